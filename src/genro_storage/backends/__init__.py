@@ -26,13 +26,14 @@ This package contains all storage backend implementations:
 - Relative: Hierarchical mount wrapper with permissions
 """
 
-from .base import StorageBackend
+from .base import StorageBackend, StatResult
 from .local import LocalStorage
 from .base64 import Base64Backend
 from .relative import RelativeMountBackend
 
 __all__ = [
     "StorageBackend",
+    "StatResult",
     "LocalStorage",
     "Base64Backend",
     "RelativeMountBackend",
@@ -22,12 +22,43 @@ different storage systems.
 
 from __future__ import annotations
 
+import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import BinaryIO, TextIO
 
 from ..capabilities import BackendCapabilities
 
 
+@dataclass(frozen=True)
+class StatResult:
+    """Metadata of a path, as returned by ``StorageBackend.stat()``.
+
+    Attributes:
+        exists: Whether the path exists
+        is_file: Whether the path is a file
+        is_dir: Whether the path is a directory
+        size: File size in bytes (None for directories and missing paths)
+        mtime: Last modification time as Unix timestamp (None if unknown)
+        etag: Entity tag from object stores (None if not provided)
+        content_hash: (algorithm, hex digest) kept by the storage service,
+            as returned by ``get_content_hash()`` (None if not provided)
+    """
+
+    exists: bool
+    is_file: bool = False
+    is_dir: bool = False
+    size: int | None = None
+    mtime: float | None = None
+    etag: str | None = None
+    content_hash: tuple[str, str] | None = None
+
+
+# Shared result for paths that don't exist
+_MISSING = StatResult(exists=False)
+
+
 class StorageBackend(ABC):
     """Abstract base class for storage backends.
 
@@ -51,6 +82,18 @@ class StorageBackend(ABC):
     # Populated automatically by @capability decorator or declared manually
     PROTOCOL_CAPABILITIES: dict[str, set[str]] = {}
 
+    # Whether open(path, 'wb') writes through to storage. Pathless backends
+    # (base64) compute a new path on write_bytes() and must opt out.
+    supports_streaming_write: bool = True
+
+    # Whether directories must be created explicitly. Object stores have no
+    # real directories (a prefix exists as soon as a key is written under it)
+    # and set this to False, making mkdir() a no-op there.
+    requires_dir_markers: bool = True
+
+    # Buffer size used when a copy has to pump bytes between backends
+    COPY_CHUNK_SIZE: int = 4 * 1024 * 1024
+
     def __init_subclass__(cls, **kwargs):
         """Automatically collect and inherit capabilities when subclass is created.
 
@@ -288,6 +331,47 @@ class StorageBackend(ABC):
         """
         pass
 
+    def stat(self, path: str) -> StatResult:
+        """Get existence, type, size and mtime of a path in one call.
+
+        The default implementation composes ``exists``/``is_file``/``is_dir``/
+        ``size``/``mtime``. Backends that can fetch all of these with a single
+        system call or request (``os.stat``, ``HEAD``) should override it.
+
+        Fields that cannot be determined are left as None; callers needing
+        them fall back to the dedicated method, which raises the proper error.
+
+        Args:
+            path: Relative path to file or directory
+
+        Returns:
+            StatResult: Metadata of the path (``exists=False`` if missing)
+
+        Examples:
+            >>> st = backend.stat('documents/report.pdf')
+            >>> if st.is_file:
+            ...     print(st.size, st.mtime)
+        """
+        if not self.exists(path):
+            return _MISSING
+
+        is_file = self.is_file(path)
+        is_dir = not is_file and self.is_dir(path)
+
+        size = None
+        if is_file:
+            try:
+                size = self.size(path)
+            except (OSError, ValueError):
+                pass
+
+        try:
+            mtime = self.mtime(path)
+        except (OSError, ValueError, NotImplementedError):
+            mtime = None
+
+        return StatResult(exists=True, is_file=is_file, is_dir=is_dir, size=size, mtime=mtime)
+
     @abstractmethod
     def open(self, path: str, mode: str = "rb") -> BinaryIO | TextIO:
         """Open a file and return file-like object.
@@ -327,6 +411,40 @@ class StorageBackend(ABC):
         """
         pass
 
+    def read_into(self, path: str, buf: memoryview, offset: int = 0) -> int:
+        """Read file content into a caller-owned buffer.
+
+        Fills ``buf`` from byte ``offset`` of the file, stopping at the end of
+        the buffer or of the file. The default implementation seeks an open
+        file and calls ``readinto()``, which on fsspec remote files becomes
+        a ranged request for just the bytes wanted.
+
+        Args:
+            path: Relative path to file
+            buf: Writable byte buffer to fill
+            offset: Position in the file to start reading from
+
+        Returns:
+            int: Number of bytes read (less than len(buf) at end of file)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+
+        Examples:
+            >>> buf = bytearray(4096)
+            >>> n = backend.read_into('video.mp4', memoryview(buf), offset=8192)
+        """
+        total = 0
+        with self.open(path, "rb") as f:
+            if offset:
+                f.seek(offset)
+            while total < len(buf):
+                n = f.readinto(buf[total:])
+                if not n:
+                    break
+                total += n
+        return total
+
     @abstractmethod
     def read_text(self, path: str, encoding: str = "utf-8") -> str:
         """Read entire file as text.
@@ -348,12 +466,13 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    def write_bytes(self, path: str, data: bytes) -> None:
+    def write_bytes(self, path: str, data: bytes | bytearray | memoryview) -> None:
         """Write bytes to file.
 
         Args:
             path: Relative path to file
-            data: Bytes to write
+            data: Bytes to write; bytearray and memoryview buffers must be
+                written as they are, without converting them to bytes
 
         Raises:
             PermissionError: If insufficient permissions
@@ -382,6 +501,34 @@ class StorageBackend(ABC):
         """
         pass
 
+    def write_from(self, path: str, src: BinaryIO) -> str | None:
+        """Write a file from a binary file object, without reading it whole.
+
+        The default implementation copies in COPY_CHUNK_SIZE chunks through
+        ``open(path, 'wb')``. Backends with a faster path (kernel-side copy,
+        multipart upload) override it.
+
+        Args:
+            path: Relative path to file
+            src: Binary file object positioned at the data to write
+
+        Returns:
+            str | None: New path if the backend changed it (base64), None otherwise
+
+        Raises:
+            PermissionError: If insufficient permissions
+
+        Examples:
+            >>> with open('/tmp/video.mp4', 'rb') as f:
+            ...     backend.write_from('videos/video.mp4', f)
+        """
+        if not self.supports_streaming_write:
+            return self.write_bytes(path, src.read())
+
+        with self.open(path, "wb") as dest:
+            shutil.copyfileobj(src, dest, self.COPY_CHUNK_SIZE)
+        return None
+
     @abstractmethod
     def delete(self, path: str, recursive: bool = False) -> None:
         """Delete file or directory.
@@ -421,6 +568,88 @@ class StorageBackend(ABC):
         """
         pass
 
+    def list_dir_stat(self, path: str) -> list[tuple[str, StatResult | None]]:
+        """List directory contents together with each entry's metadata.
+
+        Backends whose listing call already returns sizes and timestamps
+        (``os.scandir``, S3 ``ListObjectsV2``) override this so callers can
+        skip a separate stat per entry. The default lists names only and
+        reports the metadata as unknown (None).
+
+        Args:
+            path: Relative path to directory
+
+        Returns:
+            list[tuple[str, StatResult | None]]: ``(name, stat)`` pairs
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            ValueError: If path is not a directory
+
+        Examples:
+            >>> for name, st in backend.list_dir_stat('documents'):
+            ...     print(name, st.size if st else '?')
+        """
+        return [(name, None) for name in self.list_dir(path)]
+
+    def iter_dir_stat(self, path: str) -> Iterator[tuple[str, StatResult | None]]:
+        """Yield directory entries with their metadata as the listing produces them.
+
+        Lazy counterpart of ``list_dir_stat()``: backends that can read a
+        directory incrementally (``os.scandir``) override it, so callers
+        handle the first entries before the whole listing is in memory.
+        The default yields from ``list_dir_stat()``.
+
+        Args:
+            path: Relative path to directory
+
+        Yields:
+            tuple[str, StatResult | None]: ``(name, stat)`` pairs
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            ValueError: If path is not a directory
+
+        Examples:
+            >>> for name, st in backend.iter_dir_stat('logs'):
+            ...     if name.endswith('.gz'):
+            ...         break
+        """
+        yield from self.list_dir_stat(path)
+
+    def walk_files(self, path: str) -> Iterator[tuple[str, StatResult]]:
+        """Yield every file below a directory, at any depth, with its metadata.
+
+        The default implementation recurses with ``list_dir_stat()``, one
+        listing per directory. Object stores override it with a single
+        recursive prefix listing.
+
+        Args:
+            path: Relative path to directory
+
+        Yields:
+            tuple[str, StatResult]: File path relative to ``path`` and its metadata
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+
+        Examples:
+            >>> for relpath, st in backend.walk_files('documents'):
+            ...     print(relpath, st.size)
+        """
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            dir_path = f"{path}/{rel_dir}" if path and rel_dir else (path or rel_dir)
+            for name, stat in self.list_dir_stat(dir_path):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if stat is None:
+                    stat = self.stat(f"{dir_path}/{name}" if dir_path else name)
+                if stat.is_dir:
+                    pending.append(rel)
+                elif stat.is_file:
+                    yield rel, stat
+
     @abstractmethod
     def mkdir(self, path: str, parents: bool = False, exist_ok: bool = False) -> None:
         """Create directory.
@@ -469,6 +698,119 @@ class StorageBackend(ABC):
         """
         pass
 
+    def move(self, src_path: str, dest_backend: StorageBackend, dest_path: str) -> str | None:
+        """Move file/directory to another backend.
+
+        The default implementation copies then deletes the source. Backends
+        override it to rename in place when source and destination share the
+        same storage (``rename(2)`` locally, server-side copy + delete on
+        object stores). Moving a path onto itself does nothing.
+
+        Args:
+            src_path: Source path in this backend
+            dest_backend: Destination backend (may be different type)
+            dest_path: Destination path in dest_backend
+
+        Returns:
+            str | None: New destination path if destination backend changes it
+                       (e.g., base64 backend), or None if path unchanged
+
+        Raises:
+            FileNotFoundError: If source doesn't exist
+            PermissionError: If insufficient permissions
+
+        Examples:
+            >>> backend.move('inbox/file.txt', backend, 'archive/file.txt')
+        """
+        source, source_path = self.copy_target(src_path)
+        target, target_path = dest_backend.copy_target(dest_path)
+        if source is target and source_path.strip("/") == target_path.strip("/"):
+            # Onto itself: deleting the source after the copy would lose it
+            if not self.exists(src_path):
+                raise FileNotFoundError(f"Source not found: {src_path}")
+            return None
+
+        new_path = self.copy(src_path, dest_backend, dest_path)
+        self.delete(src_path, recursive=True)
+        return new_path
+
+    def copy_target(self, path: str) -> tuple[StorageBackend, str]:
+        """Return the backend and path a copy into ``path`` really writes to.
+
+        Wrapping backends (relative mounts) unwrap themselves here, so that
+        ``copy()`` can recognize when source and destination share the same
+        storage and use a native or server-side copy instead of moving the
+        bytes through the client.
+
+        Args:
+            path: Destination path in this backend
+
+        Returns:
+            tuple[StorageBackend, str]: Underlying backend and path
+
+        Raises:
+            PermissionError: If this backend does not allow writes
+        """
+        return self, path
+
+    def copies_tree_natively(self, dest_backend: StorageBackend) -> bool:
+        """Tell whether ``copy()`` of a directory into dest_backend is one native call.
+
+        When it is not, callers copying many files gain from issuing the
+        per-file copies concurrently (see ``StorageNode.copy_to``).
+
+        Args:
+            dest_backend: Destination backend
+
+        Returns:
+            bool: True if a whole tree is copied without client-side recursion
+        """
+        return False
+
+    def reads_in_batch(self) -> bool:
+        """Tell whether ``read_bytes_batch()`` reads many files in one native call.
+
+        When it does, ``StorageManager.read_many()`` hands it all the paths
+        of this backend at once instead of reading them from worker threads.
+
+        Returns:
+            bool: True if batched reads are native (default: False)
+        """
+        return False
+
+    def read_bytes_batch(self, paths: list[str], max_concurrency: int = 32) -> list[bytes]:
+        """Read several whole files.
+
+        The default reads them one after another; backends answering True
+        from ``reads_in_batch()`` override it with a concurrent native call.
+
+        Args:
+            paths: Relative paths to files
+            max_concurrency: Maximum number of reads in flight
+
+        Returns:
+            list[bytes]: File contents, in the order of ``paths``
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+        """
+        return [self.read_bytes(path) for path in paths]
+
+    def _stream_copy(
+        self, src_path: str, dest_backend: StorageBackend, dest_path: str
+    ) -> str | None:
+        """Copy one file to another backend in COPY_CHUNK_SIZE chunks.
+
+        Used when no native copy applies. Memory use stays bounded by the
+        buffer size instead of the file size.
+
+        Returns:
+            str | None: New destination path if the destination backend
+                changed it (base64), None otherwise
+        """
+        with self.open(src_path, "rb") as src:
+            return dest_backend.write_from(dest_path, src)
+
     def get_hash(self, path: str) -> str | None:
         """Get MD5 hash from filesystem metadata if available.
 
@@ -490,6 +832,27 @@ class StorageBackend(ABC):
         """
         return None  # Default: no metadata hash available
 
+    def get_content_hash(self, path: str) -> tuple[str, str] | None:
+        """Get a content hash from filesystem metadata, tagged with its algorithm.
+
+        Unlike get_hash(), this may return hashes that are not plain MD5
+        (e.g. S3 multipart ETags). Two files with hashes of the same
+        algorithm can be compared without reading either of them.
+
+        Args:
+            path: Relative path to file
+
+        Returns:
+            tuple[str, str] | None: (algorithm, hex digest) such as
+                ('md5', 'd41d8cd9...'), or None if metadata has no hash
+
+        Examples:
+            >>> backend.get_content_hash('file.txt')
+            ('md5', '5eb63bbbe01eeed093cb22bb8f5acdc3')
+        """
+        metadata_hash = self.get_hash(path)
+        return ("md5", metadata_hash.lower()) if metadata_hash else None
+
     def get_metadata(self, path: str) -> dict[str, str]:
         """Get custom metadata for a file.
 
@@ -60,6 +60,9 @@ class Base64Backend(StorageBackend):
     # Default protocol name for this backend
     _default_protocol = "base64"
 
+    # write_bytes() returns the new path, open('wb') buffers are discarded
+    supports_streaming_write = False
+
     def __init__(self) -> None:
         """Initialize the Base64 backend."""
         self._creation_time = time.time()
@@ -272,7 +275,7 @@ class Base64Backend(StorageBackend):
         data = self._decode(path)
         return data.decode(encoding)
 
-    def write_bytes(self, path: str, data: bytes) -> str:
+    def write_bytes(self, path: str, data: bytes | bytearray | memoryview) -> str:
         """Write bytes to base64 node.
 
         Creates a new base64-encoded string from the data. The path parameter
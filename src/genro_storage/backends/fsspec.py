@@ -22,13 +22,37 @@ through a unified interface.
 
 from __future__ import annotations
 
+import base64
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from typing import BinaryIO, TextIO
-from pathlib import PurePosixPath
+from collections.abc import Iterator
 import fsspec
+import fsspec.caching
 
-from .base import StorageBackend
+from .base import StorageBackend, StatResult
 from ..capabilities import BackendCapabilities
 
+# Object stores read files with HTTP range requests: read them in large
+# blocks and, where fsspec supports it, fetch the next block in a
+# background thread while the caller consumes the current one.
+_READ_AHEAD_PROTOCOLS = frozenset({"s3", "gcs", "gs", "az", "abfs", "azure"})
+_READ_AHEAD_BLOCK_SIZE = 8 * 1024 * 1024
+_READ_AHEAD_CACHE = "background" if "background" in fsspec.caching.caches else "readahead"
+
+# read_bytes() on object stores fetches files larger than one part as
+# concurrent ranged GETs of this size
+_PARALLEL_READ_PART_SIZE = 8 * 1024 * 1024
+
+# Object stores without real directories: prefixes appear with their keys
+_DIRLESS_PROTOCOLS = frozenset({"s3", "gcs", "gs", "az", "abfs", "azure"})
+
+# local_path(mode='r') hands files up to this size over in an anonymous
+# in-memory file (Linux memfd) instead of writing a temp file to disk
+_MEMFD_MAX_SIZE = 64 * 1024 * 1024
+
 
 class FsspecBackend(StorageBackend):
     """Generic backend that wraps any fsspec filesystem.
@@ -79,6 +103,9 @@ class FsspecBackend(StorageBackend):
         # Create fsspec filesystem instance
         self.fs = fsspec.filesystem(protocol, **kwargs)
 
+        self.requires_dir_markers = protocol not in _DIRLESS_PROTOCOLS
+        self.parallel_reads = protocol in _READ_AHEAD_PROTOCOLS
+
     def _full_path(self, path: str) -> str:
         """Combine base_path with relative path.
 
@@ -485,8 +512,11 @@ class FsspecBackend(StorageBackend):
         """Get last modification time."""
         full_path = self._full_path(path)
 
-        info = self.fs.info(full_path)
+        return self._info_mtime(self.fs.info(full_path))
 
+    @staticmethod
+    def _info_mtime(info: dict) -> float:
+        """Extract modification time from an fsspec info dict."""
         # fsspec may return 'mtime' or 'LastModified' depending on backend
         if "mtime" in info:
             return info["mtime"]
@@ -503,15 +533,70 @@ class FsspecBackend(StorageBackend):
 
         return time.time()
 
+    def stat(self, path: str) -> StatResult:
+        """Get path metadata from a single fs.info() call (one HEAD on object stores)."""
+        try:
+            info = self.fs.info(self._full_path(path))
+        except FileNotFoundError:
+            return StatResult(exists=False)
+
+        return self._info_stat(info)
+
+    @classmethod
+    def _info_stat(cls, info: dict) -> StatResult:
+        """Convert an fsspec info dict to a StatResult."""
+        is_file = info["type"] == "file"
+        return StatResult(
+            exists=True,
+            is_file=is_file,
+            is_dir=info["type"] == "directory",
+            size=info.get("size", 0) if is_file else None,
+            mtime=cls._info_mtime(info),
+            etag=info.get("ETag") or info.get("etag"),
+            content_hash=cls._info_content_hash(info) if is_file else None,
+        )
+
     def open(self, path: str, mode: str = "rb") -> BinaryIO | TextIO:
-        """Open file and return file-like object."""
+        """Open file and return file-like object.
+
+        Binary reads on object stores use 8 MiB range requests with
+        read-ahead, so sequential reads overlap network latency with
+        processing instead of paying it per chunk.
+        """
         full_path = self._full_path(path)
+        if mode == "rb" and self.protocol in _READ_AHEAD_PROTOCOLS:
+            return self.fs.open(
+                full_path,
+                mode,
+                block_size=_READ_AHEAD_BLOCK_SIZE,
+                cache_type=_READ_AHEAD_CACHE,
+            )
         return self.fs.open(full_path, mode)
 
     def read_bytes(self, path: str) -> bytes:
-        """Read entire file as bytes."""
+        """Read entire file as bytes.
+
+        On object stores the first part is fetched with a ranged GET; a
+        file that fills it is then read as concurrent ranged GETs of the
+        remaining parts, so large downloads use several connections.
+        Small files cost the same single request as before.
+        """
         full_path = self._full_path(path)
 
+        if self.parallel_reads:
+            first = self.fs.cat_file(full_path, 0, _PARALLEL_READ_PART_SIZE)
+            if len(first) < _PARALLEL_READ_PART_SIZE:
+                return first
+
+            size = self.fs.info(full_path)["size"]
+            starts = list(range(len(first), size, _PARALLEL_READ_PART_SIZE))
+            if not starts:
+                return first
+            ends = [min(start + _PARALLEL_READ_PART_SIZE, size) for start in starts]
+            # Async filesystems (s3fs, gcsfs, adlfs) run the ranges concurrently
+            parts = self.fs.cat_ranges([full_path] * len(starts), starts, ends, on_error="raise")
+            return b"".join([first, *parts])
+
         with self.fs.open(full_path, "rb") as f:
             return f.read()
 
@@ -522,7 +607,7 @@ class FsspecBackend(StorageBackend):
         with self.fs.open(full_path, "r", encoding=encoding) as f:
             return f.read()
 
-    def write_bytes(self, path: str, data: bytes) -> None:
+    def write_bytes(self, path: str, data: bytes | bytearray | memoryview) -> None:
         """Write bytes to file."""
         full_path = self._full_path(path)
 
@@ -569,10 +654,75 @@ class FsspecBackend(StorageBackend):
 
         return names
 
+    def list_dir_stat(self, path: str) -> list[tuple[str, StatResult]]:
+        """List directory contents with metadata from the listing itself.
+
+        On object stores the LIST response already carries size and
+        timestamp, so no per-entry HEAD request is needed.
+        """
+        full_path = self._full_path(path)
+        items = self.fs.ls(full_path, detail=True)
+
+        base = full_path.rstrip("/") + "/"
+        result = []
+        for info in items:
+            item = info["name"]
+            if item.startswith(base):
+                name = item[len(base) :]
+                if "/" in name:
+                    continue
+            else:
+                name = item.split("/")[-1]
+            result.append((name, self._info_stat(info)))
+
+        return result
+
+    def walk_files(self, path: str) -> Iterator[tuple[str, StatResult]]:
+        """Yield every file below a directory from one recursive listing.
+
+        fs.find() lists the whole prefix at once (no delimiter) on object
+        stores, instead of one LIST call per directory. The root is only
+        checked separately when the listing comes back empty.
+        """
+        full_path = self._full_path(path)
+        base = full_path.rstrip("/") + "/"
+        found = self.fs.find(full_path, detail=True)
+        if not found:
+            if path.strip("/") and not self.fs.exists(full_path):
+                raise FileNotFoundError(f"Directory not found: {path}")
+            return
+        if len(found) == 1:
+            # find() on a file returns the file itself
+            name, info = next(iter(found.items()))
+            if info.get("type") == "file" and name.strip("/") == full_path.strip("/"):
+                raise ValueError(f"Path is not a directory: {path}")
+        for name, info in found.items():
+            if info.get("type") != "file":
+                continue
+            # fsspec may add or drop a leading slash; match the prefix loosely
+            name = name.lstrip("/")
+            prefix = base.lstrip("/")
+            rel = name[len(prefix) :] if name.startswith(prefix) else name.rpartition("/")[2]
+            yield rel, self._info_stat(info)
+
     def mkdir(self, path: str, parents: bool = False, exist_ok: bool = False) -> None:
-        """Create directory."""
+        """Create directory.
+
+        On object stores there is nothing to create: with ``exist_ok=True``
+        this makes no request at all, otherwise a single existence check.
+        """
         full_path = self._full_path(path)
 
+        if not self.requires_dir_markers:
+            if not exist_ok and self.fs.exists(full_path):
+                raise FileExistsError(f"Directory already exists: {path}")
+            return
+
+        # makedirs() checks for existing levels itself: one call, no probe
+        if parents and exist_ok:
+            self.fs.makedirs(full_path, exist_ok=True)
+            return
+
         if self.fs.exists(full_path):
             if not exist_ok:
                 raise FileExistsError(f"Directory already exists: {path}")
@@ -583,7 +733,7 @@ class FsspecBackend(StorageBackend):
             self.fs.makedirs(full_path, exist_ok=True)
         else:
             # Check parent exists
-            parent = str(PurePosixPath(full_path).parent)
+            parent = full_path.rstrip("/").rpartition("/")[0]
             if parent and not self.fs.exists(parent):
                 raise FileNotFoundError(f"Parent directory does not exist: {parent}")
 
@@ -593,11 +743,15 @@ class FsspecBackend(StorageBackend):
         """Copy file/directory to another backend."""
         src_full = self._full_path(src_path)
 
+        # See through relative mounts so same-filesystem copies are detected
+        dest_backend, dest_path = dest_backend.copy_target(dest_path)
+
         # Check if both are fsspec backends
         if isinstance(dest_backend, FsspecBackend):
             dest_full = dest_backend._full_path(dest_path)
 
-            # Use fsspec's copy if same filesystem
+            # Same filesystem: native copy (server-side CopyObject on S3,
+            # rewrite on GCS, Copy Blob on Azure), no bytes through the client
             if self.fs == dest_backend.fs:
                 self.fs.copy(src_full, dest_full, recursive=True)
                 return None
@@ -606,10 +760,8 @@ class FsspecBackend(StorageBackend):
         info = self.fs.info(src_full)
 
         if info["type"] == "file":
-            # Copy single file
-            data = self.read_bytes(src_path)
-            result = dest_backend.write_bytes(dest_path, data)
-            return result  # Return new path if dest backend changed it
+            # Copy single file, streaming in chunks
+            return self._stream_copy(src_path, dest_backend, dest_path)
 
         elif info["type"] == "directory":
             # Copy directory recursively
@@ -627,6 +779,47 @@ class FsspecBackend(StorageBackend):
                     dest_item = f"{dest_path}/{item_name}" if dest_path else item_name
                     self.copy(src_item, dest_backend, dest_item)
 
+    def move(self, src_path: str, dest_backend: StorageBackend, dest_path: str) -> str | None:
+        """Move file/directory, natively when both sides share a filesystem.
+
+        fs.mv() renames on filesystems that can, and does a server-side copy
+        followed by a delete on object stores, without downloading the data.
+        """
+        target, target_path = dest_backend.copy_target(dest_path)
+        if isinstance(target, FsspecBackend) and self.fs == target.fs:
+            src_full = self._full_path(src_path)
+            dest_full = target._full_path(target_path)
+            if src_full.rstrip("/") == dest_full.rstrip("/"):
+                # Onto itself: fs.mv() would copy, then delete the only copy
+                if not self.fs.exists(src_full):
+                    raise FileNotFoundError(f"Source not found: {src_path}")
+                return None
+            self.fs.mv(src_full, dest_full, recursive=True)
+            return None
+
+        return super().move(src_path, dest_backend, dest_path)
+
+    def copies_tree_natively(self, dest_backend: StorageBackend) -> bool:
+        """A same-filesystem copy is a single recursive fs.copy() call."""
+        target, _ = dest_backend.copy_target("")
+        return isinstance(target, FsspecBackend) and self.fs == target.fs
+
+    def reads_in_batch(self) -> bool:
+        """Object stores read a batch of files in one fs.cat_ranges() call."""
+        return self.parallel_reads
+
+    def read_bytes_batch(self, paths: list[str], max_concurrency: int = 32) -> list[bytes]:
+        """Read several files with one fs.cat_ranges() call.
+
+        Async filesystems (s3fs, gcsfs, adlfs) run the GETs concurrently on
+        their event loop over pooled connections, with no thread per file.
+        Unlike fs.cat(), paths are not expanded as glob patterns.
+        """
+        full_paths = [self._full_path(path) for path in paths]
+        nothing = [None] * len(full_paths)
+        kwargs = {"batch_size": max_concurrency} if getattr(self.fs, "async_impl", False) else {}
+        return self.fs.cat_ranges(full_paths, nothing, nothing, on_error="raise", **kwargs)
+
     def get_versions(self, path: str) -> list[dict]:
         """Get list of available versions for a file.
 
@@ -791,8 +984,8 @@ class FsspecBackend(StorageBackend):
     def get_hash(self, path: str) -> str | None:
         """Get MD5 hash from filesystem metadata if available.
 
-        For S3/MinIO: Uses ETag which is the MD5 hash
-        For GCS: Also uses ETag
+        For S3/MinIO: Uses ETag, which is the MD5 hash for single-part uploads
+        For GCS: Uses md5Hash
         For Azure: Uses content_md5
         For local/memory: Returns None (must compute)
 
@@ -802,20 +995,53 @@ class FsspecBackend(StorageBackend):
         Returns:
             str | None: MD5 hash as hexadecimal string, or None if not in metadata
         """
-        full_path = self._full_path(path)
+        content_hash = self.get_content_hash(path)
+        if content_hash and content_hash[0] == "md5":
+            return content_hash[1]
+        return None
+
+    def get_content_hash(self, path: str) -> tuple[str, str] | None:
+        """Get a content hash from filesystem metadata, tagged with its algorithm.
 
+        S3 multipart uploads have ETags like ``"<hex>-<parts>"`` that are not
+        the MD5 of the content; they are reported as ``'s3-multipart-etag'``
+        so they are only compared with each other.
+
+        Args:
+            path: Relative path to file
+
+        Returns:
+            tuple[str, str] | None: (algorithm, hex digest), or None if the
+                metadata holds no hash
+        """
         try:
-            info = self.fs.info(full_path)
+            info = self.fs.info(self._full_path(path))
         except FileNotFoundError:
             return None
 
-        # S3/MinIO/GCS: ETag is MD5 (wrapped in quotes)
-        if "ETag" in info:
-            return info["ETag"].strip('"')
-
-        # Azure Blob Storage: content_md5
-        if "content_md5" in info:
-            return info["content_md5"]
+        return self._info_content_hash(info)
+
+    @staticmethod
+    def _info_content_hash(info: dict) -> tuple[str, str] | None:
+        """Extract the algorithm-tagged content hash from an fsspec info dict."""
+        # S3/MinIO: ETag is MD5 (wrapped in quotes) unless it has a part count
+        etag = info.get("ETag")
+        if etag:
+            etag = etag.strip('"').lower()
+            if "-" in etag:
+                return ("s3-multipart-etag", etag)
+            return ("md5", etag)
+
+        # GCS: base64-encoded MD5
+        if info.get("md5Hash"):
+            return ("md5", base64.b64decode(info["md5Hash"]).hex())
+
+        # Azure Blob Storage: content_md5, raw bytes or hex string
+        content_md5 = info.get("content_md5")
+        if content_md5:
+            if isinstance(content_md5, (bytes, bytearray)):
+                return ("md5", bytes(content_md5).hex())
+            return ("md5", content_md5.lower())
 
         # No hash available in metadata
         return None
@@ -1011,14 +1237,21 @@ class FsspecBackend(StorageBackend):
             ...     subprocess.run(['convert', local_path, '-resize', '800', local_path])
             >>> # Changes uploaded automatically
         """
-        import tempfile
-        import os
-        from contextlib import contextmanager
 
         @contextmanager
         def _local_path():
             full_path = self._full_path(path)
 
+            if mode == "r" and hasattr(os, "memfd_create"):
+                try:
+                    size = self.fs.size(full_path)
+                except FileNotFoundError:
+                    size = None
+                if size is not None and size <= _MEMFD_MAX_SIZE:
+                    with self._memfd_local_path(full_path) as mem_path:
+                        yield mem_path
+                    return
+
             # Create temporary file
             suffix = os.path.splitext(path)[1]  # Preserve extension
             with tempfile.NamedTemporaryFile(mode="w+b", suffix=suffix, delete=False) as tmp:
@@ -1050,8 +1283,8 @@ class FsspecBackend(StorageBackend):
                     # Upload from temp to remote
                     if os.path.exists(tmp_path):
                         # Ensure parent directory exists
-                        parent = str(PurePosixPath(full_path).parent)
-                        if parent and parent != ".":
+                        parent = full_path.rpartition("/")[0]
+                        if parent:
                             self.fs.makedirs(parent, exist_ok=True)
 
                         # Upload
@@ -1072,6 +1305,28 @@ class FsspecBackend(StorageBackend):
 
         return _local_path()
 
+    @contextmanager
+    def _memfd_local_path(self, full_path: str) -> Iterator[str]:
+        """Download a file into a memfd and yield a path other processes can open.
+
+        The path is a symlink carrying the original file name (tools that
+        look at the extension keep working) to ``/proc/<pid>/fd/<fd>``,
+        so no file data touches the disk and subprocesses need no
+        ``pass_fds``.
+        """
+        fd = os.memfd_create("genro-storage")
+        link_dir = tempfile.mkdtemp()
+        try:
+            with self.fs.open(full_path, "rb") as remote_file:
+                with os.fdopen(fd, "wb", closefd=False) as mem_file:
+                    shutil.copyfileobj(remote_file, mem_file, 8 * 1024 * 1024)
+            link = os.path.join(link_dir, full_path.rpartition("/")[2] or "file")
+            os.symlink(f"/proc/{os.getpid()}/fd/{fd}", link)
+            yield link
+        finally:
+            os.close(fd)
+            shutil.rmtree(link_dir, ignore_errors=True)
+
     def close(self) -> None:
         """Close filesystem connection if needed."""
         # Most fsspec filesystems don't need explicit closing
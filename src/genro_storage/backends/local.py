@@ -23,13 +23,70 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import BinaryIO, TextIO, Callable, Union
+from collections.abc import Iterator
+import os
 import shutil
+import stat as stat_module
 import sys
 
-from .base import StorageBackend
+from .base import StorageBackend, StatResult
 from ..capabilities import capability
 
 
+def _open_creating_parents(full_path: Path, mode: str, **kwargs):
+    """Open a file for writing, creating its parent directories if missing.
+
+    The directories are only created when the first open() fails, so
+    writes into existing directories cost no extra mkdir/stat syscalls.
+    """
+    try:
+        return open(full_path, mode, **kwargs)
+    except FileNotFoundError:
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(full_path, mode, **kwargs)
+
+
+def _kernel_copy(src: Path, dest: Path) -> bool:
+    """Copy file content with os.copy_file_range(), without user-space buffers.
+
+    The kernel may share the data blocks instead of copying them (reflinks
+    on btrfs/XFS, server-side copy on NFS 4.2).
+
+    dest is opened without truncation and only cut to the source size once
+    all data has been copied, so a copy that can't be done this way leaves
+    an existing dest untouched. Callers must rule out src and dest being
+    the same file first.
+
+    Returns:
+        bool: False if the copy could not be done this way (platform,
+            filesystem or kernel without support); the caller falls back
+            to a regular copy, which overwrites dest
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    with open(src, "rb") as fsrc:
+        with _open_creating_parents(dest, "wb", opener=_open_no_truncate) as fdst:
+            src_fd, dest_fd = fsrc.fileno(), fdst.fileno()
+            size = remaining = os.fstat(src_fd).st_size
+            try:
+                while remaining > 0:
+                    copied = copy_file_range(src_fd, dest_fd, remaining)
+                    if copied == 0:
+                        return False
+                    remaining -= copied
+            except OSError:
+                return False
+            os.ftruncate(dest_fd, size)
+    return True
+
+
+def _open_no_truncate(path: str, flags: int) -> int:
+    """open() opener that drops O_TRUNC, see _kernel_copy()."""
+    return os.open(path, flags & ~os.O_TRUNC, 0o666)
+
+
 class LocalStorage(StorageBackend):
     """Local filesystem storage backend.
 
@@ -270,56 +327,107 @@ class LocalStorage(StorageBackend):
 
         return full_path.stat().st_mtime
 
+    def stat(self, path: str) -> StatResult:
+        """Get path metadata with a single os.stat() call."""
+        full_path = self._resolve_path(path)
+
+        try:
+            st = full_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return StatResult(exists=False)
+
+        return self._stat_result(st)
+
+    @staticmethod
+    def _stat_result(st: os.stat_result) -> StatResult:
+        """Convert an os.stat_result to a StatResult."""
+        is_file = stat_module.S_ISREG(st.st_mode)
+        return StatResult(
+            exists=True,
+            is_file=is_file,
+            is_dir=stat_module.S_ISDIR(st.st_mode),
+            size=st.st_size if is_file else None,
+            mtime=st.st_mtime,
+        )
+
     @capability("read", "write", "append_mode", "seek_support", "atomic_operations")
     def open(self, path: str, mode: str = "rb") -> BinaryIO | TextIO:
         """Open file and return file-like object."""
         full_path = self._resolve_path(path)
 
-        # Ensure parent directory exists for write modes
+        # Create missing parent directories for write modes
         if any(m in mode for m in ["w", "a", "x"]):
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            return _open_creating_parents(full_path, mode)
 
         return open(full_path, mode)
 
     @capability("read")
     def read_bytes(self, path: str) -> bytes:
         """Read entire file as bytes."""
-        full_path = self._resolve_path(path)
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        return full_path.read_bytes()
+        try:
+            with open(self._resolve_path(path), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
     @capability("read")
     def read_text(self, path: str, encoding: str = "utf-8") -> str:
         """Read entire file as text."""
-        full_path = self._resolve_path(path)
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        return full_path.read_text(encoding=encoding)
+        try:
+            with open(self._resolve_path(path), encoding=encoding) as f:
+                return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
     @capability("write", "atomic_operations")
-    def write_bytes(self, path: str, data: bytes) -> None:
+    def write_bytes(self, path: str, data: bytes | bytearray | memoryview) -> None:
         """Write bytes to file."""
-        full_path = self._resolve_path(path)
+        with _open_creating_parents(self._resolve_path(path), "wb") as f:
+            f.write(data)
 
-        # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+    @capability("write")
+    def write_from(self, path: str, src: BinaryIO) -> None:
+        """Write file from a file object, copying in the kernel when possible.
 
-        full_path.write_bytes(data)
+        When ``src`` is a regular file, os.sendfile() moves the data without
+        passing it through Python buffers. Other file objects are copied in
+        chunks.
+        """
+        with _open_creating_parents(self._resolve_path(path), "wb") as dest:
+            try:
+                src_fd = src.fileno()
+                offset = src.tell()
+                remaining = os.fstat(src_fd).st_size - offset
+            except (AttributeError, OSError, ValueError):
+                # No usable file descriptor (BytesIO, sockets, remote files)
+                shutil.copyfileobj(src, dest, self.COPY_CHUNK_SIZE)
+                return
+
+            sendfile = getattr(os, "sendfile", None)
+            if sendfile is None or remaining <= 0:
+                shutil.copyfileobj(src, dest, self.COPY_CHUNK_SIZE)
+                return
+
+            dest_fd = dest.fileno()
+            try:
+                while remaining > 0:
+                    sent = sendfile(dest_fd, src_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            except OSError:
+                # Platforms where sendfile() only targets sockets
+                src.seek(offset)
+                shutil.copyfileobj(src, dest, self.COPY_CHUNK_SIZE)
+                return
+            src.seek(offset)
 
     @capability("write", "atomic_operations")
     def write_text(self, path: str, text: str, encoding: str = "utf-8") -> None:
         """Write text to file."""
-        full_path = self._resolve_path(path)
-
-        # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        full_path.write_text(text, encoding=encoding)
+        with _open_creating_parents(self._resolve_path(path), "w", encoding=encoding) as f:
+            f.write(text)
 
     @capability("delete")
     def delete(self, path: str, recursive: bool = False) -> None:
@@ -357,15 +465,70 @@ class LocalStorage(StorageBackend):
 
         return [item.name for item in full_path.iterdir()]
 
+    def list_dir_stat(self, path: str) -> list[tuple[str, StatResult]]:
+        """List directory contents with metadata from a single scandir() pass."""
+        return list(self.iter_dir_stat(path))
+
+    def iter_dir_stat(self, path: str) -> Iterator[tuple[str, StatResult]]:
+        """Yield directory entries with metadata while scandir() reads them."""
+        full_path = self._resolve_path(path)
+
+        try:
+            entries = os.scandir(full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Directory not found: {path}")
+        except NotADirectoryError:
+            raise ValueError(f"Path is not a directory: {path}")
+
+        with entries:
+            for entry in entries:
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    # Dangling symlink or entry removed while listing
+                    yield entry.name, StatResult(exists=False)
+                    continue
+                yield entry.name, self._stat_result(st)
+
+    def walk_files(self, path: str) -> Iterator[tuple[str, StatResult]]:
+        """Yield every file below a directory using scandir() metadata."""
+        root = self._resolve_path(path)
+        if not root.exists():
+            raise FileNotFoundError(f"Directory not found: {path}")
+        if not root.is_dir():
+            raise ValueError(f"Path is not a directory: {path}")
+
+        pending = [("", str(root))]
+        while pending:
+            rel_dir, dir_path = pending.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    if stat_module.S_ISDIR(st.st_mode):
+                        # Like os.walk(): don't descend into symlinked dirs
+                        if not entry.is_symlink():
+                            pending.append((rel, entry.path))
+                    elif stat_module.S_ISREG(st.st_mode):
+                        yield rel, self._stat_result(st)
+
     @capability("mkdir")
     def mkdir(self, path: str, parents: bool = False, exist_ok: bool = False) -> None:
-        """Create directory."""
-        full_path = self._resolve_path(path)
+        """Create directory.
 
-        if full_path.exists() and not exist_ok:
-            raise FileExistsError(f"Directory already exists: {path}")
+        mkdir(2) reports an existing path itself, so no separate existence
+        check is made; with ``parents=True`` the whole chain is created by
+        one ``makedirs``-style call.
+        """
+        full_path = self._resolve_path(path)
 
-        full_path.mkdir(parents=parents, exist_ok=exist_ok)
+        try:
+            full_path.mkdir(parents=parents, exist_ok=exist_ok)
+        except FileExistsError:
+            raise FileExistsError(f"Directory already exists: {path}") from None
 
     @capability("copy_optimization")
     def copy(self, src_path: str, dest_backend: StorageBackend, dest_path: str) -> None:
@@ -379,17 +542,25 @@ class LocalStorage(StorageBackend):
         if not src_full.exists():
             raise FileNotFoundError(f"Source not found: {src_path}")
 
+        # See through relative mounts so local-to-local copies are detected
+        dest_backend, dest_path = dest_backend.copy_target(dest_path)
+
         if src_full.is_file():
             # Copy single file
             if isinstance(dest_backend, LocalStorage):
-                # Local-to-local: use shutil for efficiency
+                # Local-to-local: copy in the kernel, keeping metadata like copy2
                 dest_full = dest_backend._resolve_path(dest_path)
-                dest_full.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_full, dest_full)
+                if dest_full.exists() and os.path.samefile(src_full, dest_full):
+                    raise shutil.SameFileError(
+                        f"{str(src_full)!r} and {str(dest_full)!r} are the same file"
+                    )
+                if _kernel_copy(src_full, dest_full):
+                    shutil.copystat(src_full, dest_full)
+                else:
+                    shutil.copy2(src_full, dest_full)
             else:
-                # To other backend: stream via read/write
-                data = self.read_bytes(src_path)
-                dest_backend.write_bytes(dest_path, data)
+                # To other backend: stream in chunks
+                return self._stream_copy(src_path, dest_backend, dest_path)
 
         elif src_full.is_dir():
             # Copy directory recursively
@@ -400,6 +571,40 @@ class LocalStorage(StorageBackend):
                 dest_item_path = f"{dest_path}/{item.name}" if dest_path else item.name
                 self.copy(item_rel_path, dest_backend, dest_item_path)
 
+    def move(self, src_path: str, dest_backend: StorageBackend, dest_path: str) -> str | None:
+        """Move file/directory, with a rename when it stays on this filesystem.
+
+        Falls back to copy + delete when the destination is another backend,
+        another device, or an existing directory (which copy merges into).
+        """
+        target, target_path = dest_backend.copy_target(dest_path)
+        if isinstance(target, LocalStorage):
+            src_full = self._resolve_path(src_path)
+            dest_full = target._resolve_path(target_path)
+            if dest_full == src_full:
+                # Onto itself: nothing to do (and never copy + delete)
+                if not os.path.lexists(src_full):
+                    raise FileNotFoundError(f"Source not found: {src_path}")
+                return None
+            if not dest_full.is_dir():
+                try:
+                    try:
+                        os.replace(src_full, dest_full)
+                    except FileNotFoundError:
+                        if not os.path.lexists(src_full):
+                            raise FileNotFoundError(f"Source not found: {src_path}") from None
+                        # Destination directory missing: create it on demand
+                        dest_full.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(src_full, dest_full)
+                    return None
+                except FileNotFoundError:
+                    raise
+                except OSError:
+                    # Cross-device move or file onto directory: copy instead
+                    pass
+
+        return super().move(src_path, dest_backend, dest_path)
+
     def url(self, path: str, expires_in: int = 3600, **kwargs) -> str | None:
         """Generate URL for file access.
 
@@ -23,8 +23,9 @@ permission restrictions.
 from __future__ import annotations
 
 from typing import BinaryIO, TextIO, Literal
+from collections.abc import Iterator
 
-from .base import StorageBackend
+from .base import StorageBackend, StatResult
 from ..capabilities import BackendCapabilities
 from ..exceptions import StoragePermissionError
 
@@ -147,6 +148,10 @@ class RelativeMountBackend(StorageBackend):
         """Get last modification time."""
         return self.parent.mtime(self._full_path(path))
 
+    def stat(self, path: str) -> StatResult:
+        """Get path metadata in one call."""
+        return self.parent.stat(self._full_path(path))
+
     def open(self, path: str, mode: str = "rb") -> BinaryIO | TextIO:
         """Open file with permission check for write modes."""
         if mode in ("w", "wb", "a", "ab", "r+", "rb+", "w+", "wb+", "a+", "ab+"):
@@ -161,14 +166,34 @@ class RelativeMountBackend(StorageBackend):
         """Read entire file as text."""
         return self.parent.read_text(self._full_path(path), encoding)
 
+    def read_into(self, path: str, buf: memoryview, offset: int = 0) -> int:
+        """Read file content into a caller-owned buffer."""
+        return self.parent.read_into(self._full_path(path), buf, offset)
+
     def list_dir(self, path: str) -> list[str]:
         """List directory contents."""
         return self.parent.list_dir(self._full_path(path))
 
+    def list_dir_stat(self, path: str) -> list[tuple[str, StatResult | None]]:
+        """List directory contents with metadata."""
+        return self.parent.list_dir_stat(self._full_path(path))
+
+    def iter_dir_stat(self, path: str) -> Iterator[tuple[str, StatResult | None]]:
+        """Yield directory entries with metadata."""
+        return self.parent.iter_dir_stat(self._full_path(path))
+
+    def walk_files(self, path: str) -> Iterator[tuple[str, StatResult]]:
+        """Yield every file below a directory with its metadata."""
+        return self.parent.walk_files(self._full_path(path))
+
     def get_hash(self, path: str) -> str | None:
         """Get MD5 hash from filesystem metadata."""
         return self.parent.get_hash(self._full_path(path))
 
+    def get_content_hash(self, path: str) -> tuple[str, str] | None:
+        """Get algorithm-tagged content hash from filesystem metadata."""
+        return self.parent.get_content_hash(self._full_path(path))
+
     def get_metadata(self, path: str) -> dict[str, str]:
         """Get custom metadata for file."""
         return self.parent.get_metadata(self._full_path(path))
@@ -197,7 +222,7 @@ class RelativeMountBackend(StorageBackend):
 
     # Write operations (require readwrite or delete permission)
 
-    def write_bytes(self, path: str, data: bytes) -> None:
+    def write_bytes(self, path: str, data: bytes | bytearray | memoryview) -> None:
         """Write bytes to file."""
         self._check_write_permission()
         self.parent.write_bytes(self._full_path(path), data)
@@ -207,6 +232,11 @@ class RelativeMountBackend(StorageBackend):
         self._check_write_permission()
         self.parent.write_text(self._full_path(path), text, encoding)
 
+    def write_from(self, path: str, src: BinaryIO) -> str | None:
+        """Write file from a binary file object."""
+        self._check_write_permission()
+        return self.parent.write_from(self._full_path(path), src)
+
     def mkdir(self, path: str, parents: bool = False, exist_ok: bool = False) -> None:
         """Create directory."""
         self._check_write_permission()
@@ -223,6 +253,38 @@ class RelativeMountBackend(StorageBackend):
         # Destination write is checked by dest_backend
         return self.parent.copy(self._full_path(src_path), dest_backend, dest_path)
 
+    def move(self, src_path: str, dest_backend: "StorageBackend", dest_path: str) -> str | None:
+        """Move file to another backend (source needs delete permission)."""
+        self._check_delete_permission()
+        return self.parent.move(self._full_path(src_path), dest_backend, dest_path)
+
+    def copies_tree_natively(self, dest_backend: "StorageBackend") -> bool:
+        """Copies run on the parent, so ask the parent."""
+        return self.parent.copies_tree_natively(dest_backend)
+
+    def reads_in_batch(self) -> bool:
+        """Reads run on the parent, so ask the parent."""
+        return self.parent.reads_in_batch()
+
+    def read_bytes_batch(self, paths: list[str], max_concurrency: int = 32) -> list[bytes]:
+        """Read several files through the parent's batch call."""
+        return self.parent.read_bytes_batch([self._full_path(p) for p in paths], max_concurrency)
+
+    @property
+    def requires_dir_markers(self) -> bool:
+        """Directories need creating if the parent needs them."""
+        return self.parent.requires_dir_markers
+
+    @property
+    def supports_streaming_write(self) -> bool:
+        """Streaming writes are supported if the parent supports them."""
+        return self.parent.supports_streaming_write
+
+    def copy_target(self, path: str) -> tuple[StorageBackend, str]:
+        """Unwrap to the parent backend after checking write permission."""
+        self._check_write_permission()
+        return self.parent.copy_target(self._full_path(path))
+
     # Delete operations (require delete permission)
 
     def delete(self, path: str, recursive: bool = False) -> None:
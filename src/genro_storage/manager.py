@@ -20,26 +20,658 @@ for configuring storage backends and creating StorageNode instances.
 """
 
 from __future__ import annotations
-from typing import Any, Annotated
+from types import MappingProxyType
+from typing import Any, Annotated, Callable
+from collections.abc import Iterable, Iterator, Mapping
+import copy
+import contextlib
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import importlib.util
 import json
+import os
+import re
+import sys
+import tempfile
+import time
 from pathlib import Path
 
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+from genro_toolbox import smartasync
 
 from .node import StorageNode
 from .exceptions import StorageConfigError, StorageNotFoundError
-from .backends import StorageBackend
+from .backends import StorageBackend, StatResult
 from .backends.local import LocalStorage
 from .backends.fsspec import FsspecBackend
 from .backends.base64 import Base64Backend
 from .backends.relative import RelativeMountBackend
 
 
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed.
+
+    orjson is an optional speedup (``pip install genro-storage[orjson]``);
+    its decode error subclasses ``json.JSONDecodeError``, so callers handle
+    both parsers the same way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write text to path through a temporary file renamed into place."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _load_yaml_with_sidecar(path: Path, mtime_ns: int) -> Any:
+    """Load a YAML file, going through a JSON sidecar cache when possible.
+
+    YAML parsing is much slower than JSON, so after a successful parse the
+    content is dumped to ``<file>.jsoncache`` next to the YAML file. Later
+    loads read the sidecar instead, as long as it is not older than the
+    YAML file. The sidecar is written to a temporary file and renamed into
+    place, so readers never see a partly written cache. Sidecar errors
+    (read-only filesystem, corrupt cache) are ignored and the YAML file is
+    parsed as usual.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: Modification time of the YAML file in nanoseconds
+
+    Returns:
+        The parsed YAML content
+
+    Raises:
+        StorageConfigError: If PyYAML is missing or the file is invalid
+    """
+    cache_path = path.with_suffix(path.suffix + ".jsoncache")
+
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            with open(cache_path, "rb") as f:
+                return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import yaml
+    except ImportError:
+        raise StorageConfigError("YAML support not available. Install PyYAML: pip install PyYAML")
+    # Use the LibYAML C loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    # Read the whole file at once and let the loader work on the buffer
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        config = yaml.load(data, Loader=Loader)
+    except yaml.YAMLError as e:
+        raise StorageConfigError(f"Failed to parse YAML file: {e}")
+
+    # Only cache content that survives a JSON round-trip unchanged
+    # (YAML dates or non-string keys would not)
+    try:
+        data = json.dumps(config)
+        if json.loads(data) == config:
+            _write_atomic(cache_path, data)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return config
+
+
+# Upper bound on remembered missing paths (negative_cache_ttl)
+_NEGATIVE_CACHE_MAXSIZE = 10000
+
+# Pooled HTTP connections per S3 mount (botocore's default of 10 would
+# throttle read_many() and other concurrent requests)
+_S3_MAX_POOL_CONNECTIONS = 100
+
+# Path normalization patterns, compiled once
+_MULTISLASH_RE = re.compile(r"/{2,}")
+_DOTDOT_RE = re.compile(r"(?:^|/)\.\.(?:/|$)")
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a mount-relative path (see StorageManager._normalize_path)."""
+    if not path:
+        return ""
+
+    # Check for parent directory traversal
+    if _DOTDOT_RE.search(path):
+        raise ValueError("Parent directory traversal (..) is not supported")
+
+    # Normalize: collapse multiple slashes, strip leading/trailing slashes
+    return _MULTISLASH_RE.sub("/", path).strip("/")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_address(address: str) -> tuple[str, str]:
+    """Split a "mount:path" address into interned mount name and normalized path.
+
+    Args:
+        address: Mount name alone, or "mount:path"
+
+    Returns:
+        tuple[str, str]: (mount_name, normalized_path)
+
+    Raises:
+        ValueError: If the path contains ".."
+    """
+    # One scan: path is "" when there is no separator
+    mount_name, _, path = address.partition(":")
+    return sys.intern(mount_name), _normalize_path(path)
+
+
+# Required fields per protocol, as (label, fields). Each entry in ``fields``
+# is a tuple of accepted names: the first is the standard name (used in error
+# messages), the others are legacy aliases. A single name must be present;
+# with aliases, at least one of them must have a non-empty value.
+_MOUNT_REQUIRED_FIELDS: dict[str, tuple[str, tuple[tuple[str, ...], ...]]] = {
+    "local": ("Local", (("base_path", "path"),)),
+    "memory": ("Memory", ()),
+    "s3": ("S3", (("bucket",),)),
+    "gcs": ("GCS", (("bucket",),)),
+    "azure": ("Azure", (("container",), ("account_name",))),
+    "http": ("HTTP", (("base_path", "base_url"),)),
+    "smb": ("SMB", (("host",), ("share",))),
+    "sftp": ("SFTP", (("host",), ("username",))),
+    "zip": ("ZIP", (("file",),)),
+    "tar": ("TAR", (("file",),)),
+    "git": ("Git", (("base_path", "path"),)),
+    "github": ("GitHub", (("org",), ("repo",))),
+    "webdav": ("WebDAV", (("url",),)),
+    "libarchive": ("LibArchive", (("file",),)),
+    "base64": ("Base64", ()),
+}
+
+
+def _is_relative_mount(config: dict[str, Any]) -> bool:
+    """Tell whether a mount config references a parent mount ('parent:path').
+
+    Only string paths are considered (local mounts accept callables).
+    """
+    path = config.get("path")
+    return isinstance(path, str) and ":" in path
+
+
+def _validate_mount_config(config: dict[str, Any]) -> None:
+    """Validate the structure of a single mount configuration.
+
+    Checks the common fields and the protocol-specific required fields
+    listed in ``_MOUNT_REQUIRED_FIELDS``. Unknown protocols are left to
+    the caller, which reports them with the list of supported types.
+
+    Args:
+        config: Mount configuration dictionary
+
+    Raises:
+        StorageConfigError: If a required field is missing or has the wrong type
+    """
+    if not isinstance(config, dict):
+        raise StorageConfigError(f"Mount configuration must be a dict, got {type(config).__name__}")
+    if "name" not in config:
+        raise StorageConfigError("Mount configuration missing required field: 'name'")
+
+    mount_name = config["name"]
+    if not isinstance(mount_name, str):
+        raise StorageConfigError(f"Mount name must be a string, got {type(mount_name).__name__}")
+
+    if _is_relative_mount(config):
+        return
+
+    if "protocol" not in config:
+        raise StorageConfigError(
+            f"Mount configuration for '{mount_name}' missing required field: 'protocol'"
+        )
+
+    spec = _MOUNT_REQUIRED_FIELDS.get(config["protocol"])
+    if spec is None:
+        return
+
+    label, required = spec
+    for names in required:
+        if len(names) == 1:
+            present = names[0] in config
+        else:
+            present = any(config.get(name) for name in names)
+        if not present:
+            raise StorageConfigError(
+                f"{label} storage '{mount_name}' missing required field: '{names[0]}'"
+            )
+
+
+def _create_local_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'local'."""
+    # Accept 'base_path' as standard
+    base_path = config.get("base_path") or config.get("path")
+    # LocalStorage supports both string paths and callables
+    # Optional base_url for URL generation
+    return LocalStorage(path=base_path, base_url=config.get("base_url"))
+
+
+def _create_memory_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'memory'."""
+    return FsspecBackend("memory", base_path=config.get("base_path", ""))
+
+
+def _create_s3_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 's3'."""
+    # Build S3 path: bucket/base_path
+    path = config["bucket"]
+    # Accept 'base_path' as standard, 'prefix' for legacy
+    if config.get("base_path"):
+        path = f"{path}/{config['base_path'].strip('/')}"
+    elif config.get("prefix"):
+        path = f"{path}/{config['prefix'].strip('/')}"
+
+    kwargs = {}
+    if "region" in config:
+        kwargs["client_kwargs"] = {"region_name": config["region"]}
+    if "anon" in config:
+        kwargs["anon"] = config["anon"]
+    # Accept 'access_key'/'secret_key' as standard, 'key'/'secret' for legacy
+    if config.get("access_key"):
+        kwargs["key"] = config["access_key"]
+    elif config.get("key"):
+        kwargs["key"] = config["key"]
+    if config.get("secret_key"):
+        kwargs["secret"] = config["secret_key"]
+    elif config.get("secret"):
+        kwargs["secret"] = config["secret"]
+    if "endpoint_url" in config:
+        kwargs["endpoint_url"] = config["endpoint_url"]
+    kwargs["config_kwargs"] = {
+        "max_pool_connections": config.get("max_pool_connections", _S3_MAX_POOL_CONNECTIONS)
+    }
+
+    return FsspecBackend("s3", base_path=path, **kwargs)
+
+
+def _create_gcs_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'gcs'."""
+    path = config["bucket"]
+    # Accept 'base_path' as standard, 'prefix' for legacy
+    if config.get("base_path"):
+        path = f"{path}/{config['base_path'].strip('/')}"
+    elif config.get("prefix"):
+        path = f"{path}/{config['prefix'].strip('/')}"
+
+    kwargs = {}
+    if "token" in config:
+        kwargs["token"] = config["token"]
+    if "project" in config:
+        kwargs["project"] = config["project"]
+    if "endpoint_url" in config:
+        kwargs["endpoint_url"] = config["endpoint_url"]
+
+    return FsspecBackend("gcs", base_path=path, **kwargs)
+
+
+def _create_azure_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'azure'."""
+    # Base path is just the container name for Azure
+    base_path = config["container"]
+
+    kwargs = {"account_name": config["account_name"]}
+    if "account_key" in config:
+        kwargs["account_key"] = config["account_key"]
+    if "sas_token" in config:
+        kwargs["sas_token"] = config["sas_token"]
+    if "connection_string" in config:
+        kwargs["connection_string"] = config["connection_string"]
+
+    return FsspecBackend("az", base_path=base_path, **kwargs)
+
+
+def _create_http_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'http'."""
+    # Accept 'base_path' as standard, 'base_url' for legacy
+    base_path_value = config.get("base_path") or config.get("base_url")
+    return FsspecBackend("http", base_path=base_path_value)
+
+
+def _create_smb_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'smb'."""
+    # Build SMB path: /share/base_path
+    path = f"/{config['share']}"
+    # Accept 'base_path' as standard, 'path' for legacy
+    if config.get("base_path"):
+        path = f"{path}/{config['base_path'].strip('/')}"
+    elif config.get("path"):
+        path = f"{path}/{config['path'].strip('/')}"
+
+    kwargs = {"host": config["host"]}
+    if "username" in config:
+        kwargs["username"] = config["username"]
+    if "password" in config:
+        kwargs["password"] = config["password"]
+    if "domain" in config:
+        kwargs["domain"] = config["domain"]
+    if "port" in config:
+        kwargs["port"] = config["port"]
+
+    return FsspecBackend("smb", base_path=path, **kwargs)
+
+
+def _create_sftp_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'sftp'."""
+    # Build SFTP path: host:/base_path
+    # Accept 'base_path' as standard, 'path' for legacy
+    path = config.get("base_path") or config.get("path", "/")
+
+    kwargs = {"host": config["host"], "username": config["username"]}
+    if "password" in config:
+        kwargs["password"] = config["password"]
+    if "port" in config:
+        kwargs["port"] = config["port"]
+    if "key_filename" in config:
+        kwargs["key_filename"] = config["key_filename"]
+    if "passphrase" in config:
+        kwargs["passphrase"] = config["passphrase"]
+    if "timeout" in config:
+        kwargs["timeout"] = config["timeout"]
+
+    return FsspecBackend("sftp", base_path=path, **kwargs)
+
+
+def _create_zip_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'zip'."""
+    # ZIP archives use 'fo' parameter for file path
+    kwargs = {"fo": config["file"]}
+    if "mode" in config:
+        kwargs["mode"] = config["mode"]
+    if "target_protocol" in config:
+        kwargs["target_protocol"] = config["target_protocol"]
+    if "target_options" in config:
+        kwargs["target_options"] = config["target_options"]
+
+    return FsspecBackend("zip", base_path="", **kwargs)
+
+
+def _create_tar_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'tar'."""
+    # TAR archives use 'fo' parameter for file path
+    kwargs = {"fo": config["file"]}
+    if "compression" in config:
+        kwargs["compression"] = config["compression"]
+    if "target_protocol" in config:
+        kwargs["target_protocol"] = config["target_protocol"]
+    if "target_options" in config:
+        kwargs["target_options"] = config["target_options"]
+
+    return FsspecBackend("tar", base_path="", **kwargs)
+
+
+def _create_git_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'git'."""
+    # Accept 'base_path' as standard, 'path' for legacy
+    git_path = config.get("base_path") or config.get("path")
+
+    # Git backend accesses local Git repositories
+    kwargs = {"path": git_path}
+    if "ref" in config:
+        kwargs["ref"] = config["ref"]  # commit, tag, or branch
+    if "fo" in config:
+        kwargs["fo"] = config["fo"]
+
+    return FsspecBackend("git", base_path="", **kwargs)
+
+
+def _create_github_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'github'."""
+    # GitHub backend accesses remote repositories via API
+    kwargs = {"org": config["org"], "repo": config["repo"]}
+    if "sha" in config:
+        kwargs["sha"] = config["sha"]  # commit, branch, or tag
+    if "username" in config:
+        kwargs["username"] = config["username"]  # GitHub username for auth
+    if "token" in config:
+        kwargs["token"] = config["token"]  # GitHub personal access token
+
+    return FsspecBackend("github", base_path="", **kwargs)
+
+
+def _create_webdav_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'webdav'."""
+    # WebDAV backend for Nextcloud, ownCloud, SharePoint, etc.
+    kwargs = {"base_url": config["url"]}
+    if "username" in config and "password" in config:
+        kwargs["auth"] = (config["username"], config["password"])
+    if "token" in config:
+        kwargs["token"] = config["token"]
+    if "cert" in config:
+        kwargs["cert"] = config["cert"]
+    if "verify_ssl" in config:
+        kwargs["verify_ssl"] = config["verify_ssl"]
+
+    return FsspecBackend("webdav", base_path="", **kwargs)
+
+
+def _create_libarchive_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'libarchive'."""
+    # LibArchive backend for universal archive support (7z, rar, iso, etc.)
+    kwargs = {"fo": config["file"]}
+    if "target_protocol" in config:
+        kwargs["target_protocol"] = config["target_protocol"]
+    if "target_options" in config:
+        kwargs["target_options"] = config["target_options"]
+
+    return FsspecBackend("libarchive", base_path="", **kwargs)
+
+
+def _create_base64_backend(config: dict[str, Any]) -> StorageBackend:
+    """Create the backend for a mount with protocol 'base64'."""
+    # Base64 backend has no configuration parameters
+    return Base64Backend()
+
+
+# Backend factory per protocol: each takes a validated mount config
+_BACKEND_FACTORIES: dict[str, Callable[[dict[str, Any]], StorageBackend]] = {
+    "local": _create_local_backend,
+    "memory": _create_memory_backend,
+    "s3": _create_s3_backend,
+    "gcs": _create_gcs_backend,
+    "azure": _create_azure_backend,
+    "http": _create_http_backend,
+    "smb": _create_smb_backend,
+    "sftp": _create_sftp_backend,
+    "zip": _create_zip_backend,
+    "tar": _create_tar_backend,
+    "git": _create_git_backend,
+    "github": _create_github_backend,
+    "webdav": _create_webdav_backend,
+    "libarchive": _create_libarchive_backend,
+    "base64": _create_base64_backend,
+}
+
+
+class _MountNotFoundMessage:
+    """Message for an unknown mount, formatted only when displayed.
+
+    Callers probing for mounts often catch and discard the error, so the
+    list of available mounts is joined lazily on ``str()``.
+    """
+
+    __slots__ = ("available", "mount_name")
+
+    def __init__(self, mount_name: str, available: tuple[str, ...]):
+        self.mount_name = mount_name
+        self.available = available
+
+    def __str__(self) -> str:
+        return (
+            f"Mount point '{self.mount_name}' not found. "
+            f"Available mounts: {', '.join(self.available)}"
+        )
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+# Protocols whose backends are cheap to build and validate their settings
+# on creation (e.g. local base_path must exist): never deferred.
+_EAGER_PROTOCOLS = frozenset({"local", "base64"})
+
+# (module, pip package) each deferred backend type needs, checked when the
+# mount is configured so a missing driver is reported there, not on first use
+_DRIVER_MODULES: dict[str, tuple[str, str]] = {
+    "s3": ("s3fs", "s3fs"),
+    "gcs": ("gcsfs", "gcsfs"),
+    "azure": ("adlfs", "adlfs"),
+    "http": ("aiohttp", "aiohttp"),
+    "smb": ("smbprotocol", "smbprotocol"),
+    "sftp": ("paramiko", "paramiko"),
+    "git": ("pygit2", "pygit2"),
+    "github": ("requests", "requests"),
+    "webdav": ("webdav4", "webdav4"),
+    "libarchive": ("libarchive", "libarchive-c"),
+}
+
+
+def _check_driver(mount_name: str, backend_type: str) -> None:
+    """Raise StorageConfigError if the driver package for a backend type is missing.
+
+    Looks the module up without importing it, so configuring a mount stays
+    cheap while a missing dependency is still reported by ``configure()``.
+    """
+    driver = _DRIVER_MODULES.get(backend_type)
+    if driver is None:
+        return
+    module, package = driver
+    if importlib.util.find_spec(module) is None:
+        raise StorageConfigError(
+            f"Storage type '{backend_type}' for mount '{mount_name}' requires the "
+            f"'{package}' package. Install it with: pip install {package}"
+        )
+
+
+class _PendingBackend:
+    """Placeholder for a backend that has not been built yet."""
+
+    __slots__ = ("config", "factory")
+
+    def __init__(self, factory: Callable[[dict[str, Any]], StorageBackend], config: dict[str, Any]):
+        self.factory = factory
+        self.config = config
+
+
+class _MountTable(MutableMapping):
+    """Mapping of mount names to backends, built on first lookup.
+
+    Remote backends open clients and resolve credentials when created, which
+    is wasted work for mounts a process never touches. Entries may hold a
+    ``_PendingBackend``; looking one up builds the backend and stores it in
+    place, so membership tests and mount listing never create backends.
+    Every read path (``get()``, ``values()``, ``items()``, copies) goes
+    through ``__getitem__``, so none of them sees a placeholder.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, StorageBackend | _PendingBackend] = {}
+
+    def __getitem__(self, name: str) -> StorageBackend:
+        backend = self._entries[name]
+        if isinstance(backend, _PendingBackend):
+            backend = self._entries[name] = backend.factory(backend.config)
+        return backend
+
+    def __setitem__(self, name: str, backend: StorageBackend | _PendingBackend) -> None:
+        self._entries[name] = backend
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(filepath: str, mtime_ns: int, size: int) -> list[dict[str, Any]]:
+    """Parse a YAML or JSON configuration file.
+
+    ``mtime_ns`` and ``size`` are not used for parsing; they are part of
+    the cache key so that a modified file is parsed again.
+
+    Args:
+        filepath: Absolute path to the configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        list[dict]: List of validated mount configurations
+
+    Raises:
+        StorageConfigError: If file format or a mount configuration is invalid
+    """
+    path = Path(filepath)
+    # Determine format from extension
+    suffix = path.suffix.lower()
+
+    if suffix in (".yaml", ".yml"):
+        config = _load_yaml_with_sidecar(path, mtime_ns)
+    elif suffix == ".json":
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            config = _json_loads(data)
+        except json.JSONDecodeError as e:
+            raise StorageConfigError(f"Failed to parse JSON file: {e}")
+    else:
+        raise StorageConfigError(
+            f"Unsupported configuration file format: {suffix}. Use .yaml, .yml, or .json"
+        )
+
+    if not isinstance(config, list):
+        raise StorageConfigError(
+            f"Configuration must be a list of mount configs, got {type(config).__name__}"
+        )
+
+    # Validate once per file version: cache hits skip validation entirely
+    for mount_config in config:
+        _validate_mount_config(mount_config)
+
+    return config
+
+
+@functools.lru_cache(maxsize=16)
+def _shared_manager(
+    cls: type[StorageManager], filepath: str, mtime_ns: int, size: int
+) -> StorageManager:
+    """Build the manager returned by ``StorageManager.from_file``.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file yields a new manager.
+    """
+    manager = cls()
+    manager.configure(filepath)
+    return manager
+
+
 class StorageManager:
     """Main entry point for configuring and accessing storage.
 
@@ -69,18 +701,142 @@ class StorageManager:
         >>> content = node.read_text()
     """
 
-    def __init__(self):
+    __slots__ = (
+        "_batch_stats",
+        "_content_cache",
+        "_content_cache_bytes",
+        "_content_cache_used",
+        "_mount_names_cache",
+        "_mounts",
+        "_mounts_view",
+        "_negative_cache",
+        "_negative_cache_ttl",
+        "_node_cache",
+        "_node_cache_size",
+        "_stat_cache_ttl",
+    )
+
+    def __init__(
+        self,
+        node_cache_size: Annotated[int, "Max interned nodes, 0 to disable"] = 0,
+        content_cache_bytes: Annotated[int, "Max bytes of cached file content, 0 to disable"] = 0,
+        negative_cache_ttl: Annotated[float, "Seconds to remember missing paths, 0 to disable"] = 0,
+        stat_cache_ttl: Annotated[
+            float | None, "Seconds a node reuses its metadata, None to keep it"
+        ] = 0,
+    ):
         """Initialize a new StorageManager with no configured mounts.
 
         After initialization, you must call ``configure()`` to set up
         mount points before you can access any files.
 
+        Args:
+            node_cache_size: When greater than 0, ``node()``, ``child()`` and
+                ``parent`` return the same StorageNode for the same path,
+                keeping up to this many recently used nodes. Repeated
+                traversals then skip node allocation and reuse each node's
+                cached metadata; call ``node.invalidate()`` when files change
+                behind the manager's back. Defaults to 0 (a new node per call).
+            content_cache_bytes: When greater than 0, file contents read with
+                ``read_bytes()`` are kept in memory up to this many bytes
+                (least recently used evicted first). Each later read first
+                revalidates with a metadata request (ETag, or mtime and size)
+                and returns the cached bytes if the file is unchanged.
+                Writes and deletes evict only the touched file.
+            negative_cache_ttl: When greater than 0, paths found missing are
+                remembered for this many seconds, so repeated existence checks
+                of absent files (fallback lookups, override candidates) skip
+                the backend. Writes, mkdir and ``invalidate()`` through a node
+                forget the path at once; files created by other means show up
+                when the entry expires.
+            stat_cache_ttl: Seconds a node reuses its metadata
+                (exists/is_file/is_dir/size/mtime) before asking the backend
+                again. Defaults to 0: every query asks the backend, except
+                within one operation (``copy_to()``, ``md5hash()``...) or a
+                ``batch()`` block, which look each path up once. With a
+                positive value a node may report stale metadata for up to
+                that many seconds after the file is changed by another node,
+                process or tool (its own writes, deletes, copies and moves
+                invalidate it at once). Missing paths are always asked
+                again. None keeps metadata until the node is invalidated.
+
         Examples:
             >>> from genro_storage import StorageManager
             >>> storage = StorageManager()
+            >>>
+            >>> # Reuse nodes across repeated tree walks
+            >>> storage = StorageManager(node_cache_size=4096)
+            >>>
+            >>> # Serve repeated reads of templates from memory
+            >>> storage = StorageManager(content_cache_bytes=128 * 1024 * 1024)
+            >>>
+            >>> # Avoid repeated HEAD 404s for optional files
+            >>> storage = StorageManager(negative_cache_ttl=30)
+            >>>
+            >>> # Trust node metadata for a minute (static trees)
+            >>> storage = StorageManager(stat_cache_ttl=60)
+        """
+        # Mapping of mount names to backend instances (built lazily)
+        self._mounts = _MountTable()
+        self._mounts_view = MappingProxyType(self._mounts)
+        # Mount names snapshot for get_mount_names(), reset on any change
+        self._mount_names_cache: tuple[str, ...] | None = None
+        # Stat results shared by all nodes inside a batch() scope
+        self._batch_stats: dict[tuple[str, str], StatResult] | None = None
+        # Interned nodes by (mount, path), least recently used first
+        self._node_cache: OrderedDict[tuple[str, str], StorageNode] | None = (
+            OrderedDict() if node_cache_size > 0 else None
+        )
+        self._node_cache_size = node_cache_size
+        # File content by (mount, path) as (validator, data), see node._read_bytes()
+        self._content_cache: OrderedDict[tuple[str, str], tuple[tuple, bytes]] | None = (
+            OrderedDict() if content_cache_bytes > 0 else None
+        )
+        self._content_cache_bytes = content_cache_bytes
+        self._content_cache_used = 0
+        # Expiry time (time.monotonic) of paths known to be missing
+        self._negative_cache: dict[tuple[str, str], float] | None = (
+            {} if negative_cache_ttl > 0 else None
+        )
+        self._negative_cache_ttl = negative_cache_ttl
+        self._stat_cache_ttl = stat_cache_ttl
+
+    @classmethod
+    def from_file(
+        cls, filepath: Annotated[str, "Path to YAML or JSON configuration file"]
+    ) -> StorageManager:
+        """Return a manager configured from a file, shared across callers.
+
+        Modules that each load the same configuration file get the same
+        manager instance instead of building identical copies. The file is
+        stat'ed on every call: once it changes, a freshly configured manager
+        is returned.
+
+        Since the instance is shared, mounts added to it later are visible
+        to every caller. Use ``StorageManager()`` + ``configure()`` for a
+        private manager.
+
+        Args:
+            filepath: Path to YAML or JSON configuration file
+
+        Returns:
+            StorageManager: Configured (possibly shared) manager
+
+        Raises:
+            FileNotFoundError: If configuration file doesn't exist
+            StorageConfigError: If configuration format is invalid
+
+        Examples:
+            >>> storage = StorageManager.from_file('/etc/app/storage.yaml')
+            >>> storage is StorageManager.from_file('/etc/app/storage.yaml')
+            True
         """
-        # Dictionary mapping mount names to backend instances
-        self._mounts: dict[str, Any] = {}
+        path = Path(filepath)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {filepath}")
+        return _shared_manager(cls, str(path.absolute()), st.st_mtime_ns, st.st_size)
 
     def configure(
         self,
@@ -94,6 +850,10 @@ class StorageManager:
         This method can be called multiple times. If a mount with the same
         name already exists, it will be replaced with the new configuration.
 
+        Configurations are validated immediately, but remote backends are
+        created on first access to the mount, so unused mounts never open
+        clients.
+
         Args:
             source: Configuration source, can be:
                 - str: Path to YAML or JSON configuration file
@@ -213,14 +973,62 @@ class StorageManager:
             config_list = self._load_config_file(source)
         elif isinstance(source, list):
             config_list = source
+            # Validate every mount before touching any of them
+            for config in config_list:
+                _validate_mount_config(config)
         else:
             raise TypeError(
                 f"source must be str (file path) or list[dict], got {type(source).__name__}"
             )
 
-        # Validate and configure each mount
+        # Configure each mount (file configs are validated when parsed)
         for config in config_list:
-            self._configure_mount(config)
+            self._apply_mount_config(config)
+
+    def configure_many(
+        self,
+        sources: Annotated[
+            Iterable[str | list[dict[str, Any]]],
+            "Configuration sources: file paths and/or lists of mount configurations",
+        ],
+    ) -> None:
+        """Configure mount points from several sources in one call.
+
+        Each source is handled like in ``configure()``. All files are loaded
+        before any mount is configured, so a missing or malformed file
+        leaves the manager untouched. Later sources override earlier ones
+        for mounts with the same name.
+
+        Args:
+            sources: Iterable of file paths and/or lists of mount configs
+
+        Raises:
+            FileNotFoundError: If a configuration file doesn't exist
+            StorageConfigError: If a configuration format is invalid
+            TypeError: If a source is neither str nor list
+
+        Examples:
+            >>> storage.configure_many([
+            ...     '/etc/app/storage.yaml',
+            ...     [{'name': 'tmp', 'protocol': 'local', 'base_path': '/tmp'}],
+            ... ])
+        """
+        config_lists = []
+        for source in sources:
+            if isinstance(source, str):
+                config_lists.append(self._load_config_file(source))
+            elif isinstance(source, list):
+                for config in source:
+                    _validate_mount_config(config)
+                config_lists.append(source)
+            else:
+                raise TypeError(
+                    f"source must be str (file path) or list[dict], got {type(source).__name__}"
+                )
+
+        for config_list in config_lists:
+            for config in config_list:
+                self._apply_mount_config(config)
 
     def add_mount(
         self, config: Annotated[dict[str, Any], "Mount configuration dictionary"]
@@ -259,6 +1067,103 @@ class StorageManager:
         if name not in self._mounts:
             raise KeyError(f"Mount point '{name}' not found")
         del self._mounts[name]
+        self._mount_changed(name)
+
+    def _mount_changed(self, name: str) -> None:
+        """Drop everything cached for a mount that was added, replaced or removed."""
+        self._mount_names_cache = None
+        if self._node_cache:
+            for key in [key for key in self._node_cache if key[0] == name]:
+                del self._node_cache[key]
+        if self._content_cache:
+            for key in [key for key in self._content_cache if key[0] == name]:
+                self._forget_content(key)
+        if self._negative_cache:
+            for key in [key for key in self._negative_cache if key[0] == name]:
+                del self._negative_cache[key]
+
+    def _cached_content(self, key: tuple[str, str], validator: tuple) -> bytes | None:
+        """Return cached content for key if it was stored with this validator."""
+        entry = self._content_cache.get(key)
+        if entry is None or entry[0] != validator:
+            return None
+        self._content_cache.move_to_end(key)
+        return entry[1]
+
+    def _store_content(self, key: tuple[str, str], validator: tuple, data: bytes) -> None:
+        """Cache file content, evicting least recently used entries to fit."""
+        self._forget_content(key)
+        if len(data) > self._content_cache_bytes:
+            return
+        cache = self._content_cache
+        cache[key] = (validator, data)
+        self._content_cache_used += len(data)
+        while self._content_cache_used > self._content_cache_bytes:
+            _, (_, evicted) = cache.popitem(last=False)
+            self._content_cache_used -= len(evicted)
+
+    def _forget_content(self, key: tuple[str, str]) -> None:
+        """Drop cached content for key, if any."""
+        entry = self._content_cache.pop(key, None)
+        if entry is not None:
+            self._content_cache_used -= len(entry[1])
+
+    def _known_missing(self, key: tuple[str, str]) -> bool:
+        """Tell whether key was recently found missing."""
+        expiry = self._negative_cache.get(key)
+        if expiry is None:
+            return False
+        if expiry > time.monotonic():
+            return True
+        del self._negative_cache[key]
+        return False
+
+    def _forget_missing(self, key: tuple[str, str]) -> None:
+        """Drop the missing marks of key and its ancestors.
+
+        Writing or creating a path also brings its parent directories into
+        existence, so their entries must go too.
+        """
+        cache = self._negative_cache
+        if not cache:
+            return
+        mount_name, path = key
+        while True:
+            cache.pop((mount_name, path), None)
+            if not path:
+                return
+            path = path.rpartition("/")[0]
+
+    def _remember_missing(self, key: tuple[str, str]) -> None:
+        """Record key as missing for negative_cache_ttl seconds."""
+        cache = self._negative_cache
+        if len(cache) >= _NEGATIVE_CACHE_MAXSIZE:
+            # Drop expired entries, or the oldest ones if all are fresh
+            now = time.monotonic()
+            for stale in [k for k, expiry in cache.items() if expiry <= now]:
+                del cache[stale]
+            while len(cache) >= _NEGATIVE_CACHE_MAXSIZE:
+                del cache[next(iter(cache))]
+        cache[key] = time.monotonic() + self._negative_cache_ttl
+
+    def _intern(self, mount_name: str, path: str) -> StorageNode:
+        """Return the shared node for (mount_name, path), creating it if needed.
+
+        Only used when the manager was built with ``node_cache_size > 0``.
+        Nodes can be repointed in place (move_to, base64 writes), so a cached
+        node that no longer points at its key is replaced.
+        """
+        cache = self._node_cache
+        key = (mount_name, path)
+        node = cache.get(key)
+        if node is not None and node._key == key:
+            cache.move_to_end(key)
+            return node
+
+        node = cache[key] = StorageNode(self, mount_name, path)
+        if len(cache) > self._node_cache_size:
+            cache.popitem(last=False)
+        return node
 
     def _load_config_file(self, filepath: str) -> list[dict[str, Any]]:
         """Load configuration from YAML or JSON file.
@@ -267,49 +1172,26 @@ class StorageManager:
             filepath: Path to configuration file
 
         Returns:
-            list[dict]: List of mount configurations
+            list[dict]: List of validated mount configurations
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            StorageConfigError: If file format is invalid
+            StorageConfigError: If file format or a mount configuration is invalid
         """
         path = Path(filepath)
 
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {filepath}")
-
-        # Determine format from extension
-        suffix = path.suffix.lower()
-
+        # A single stat both checks existence and provides the cache key
         try:
-            with open(path, "r") as f:
-                if suffix in (".yaml", ".yml"):
-                    if not HAS_YAML:
-                        raise StorageConfigError(
-                            "YAML support not available. Install PyYAML: pip install PyYAML"
-                        )
-                    config = yaml.safe_load(f)
-                elif suffix == ".json":
-                    config = json.load(f)
-                else:
-                    raise StorageConfigError(
-                        f"Unsupported configuration file format: {suffix}. "
-                        f"Use .yaml, .yml, or .json"
-                    )
-        except Exception as e:
-            if HAS_YAML and isinstance(e, yaml.YAMLError):
-                raise StorageConfigError(f"Failed to parse YAML file: {e}")
-            elif isinstance(e, json.JSONDecodeError):
-                raise StorageConfigError(f"Failed to parse JSON file: {e}")
-            else:
-                raise
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {filepath}")
 
-        if not isinstance(config, list):
-            raise StorageConfigError(
-                f"Configuration must be a list of mount configs, got {type(config).__name__}"
-            )
+        # Parsed configs are cached by (path, mtime, size): an edited file
+        # gets a new key, so stale entries are never returned.
+        config = _parse_config_file(str(path.absolute()), st.st_mtime_ns, st.st_size)
 
-        return config
+        # Hand out a private copy so callers can't mutate the cached object
+        return copy.deepcopy(config)
 
     def _configure_mount(self, config: dict[str, Any]) -> None:
         """Configure a single mount point.
@@ -320,306 +1202,47 @@ class StorageManager:
         Raises:
             StorageConfigError: If configuration is invalid
         """
-        # Validate required fields
-        if "name" not in config:
-            raise StorageConfigError("Mount configuration missing required field: 'name'")
+        _validate_mount_config(config)
+        self._apply_mount_config(config)
 
-        mount_name = config["name"]
+    def _apply_mount_config(self, config: dict[str, Any]) -> None:
+        """Configure a mount point from an already validated configuration.
 
-        # Check for relative mount (child mount referencing a parent)
-        # Only check if path is a string (not callable)
-        if "path" in config and isinstance(config["path"], str) and ":" in config["path"]:
+        Args:
+            config: Mount configuration dictionary, checked by
+                ``_validate_mount_config``
+
+        Raises:
+            StorageConfigError: If the backend rejects the configuration
+        """
+        # Interned so node() lookups compare mount names by identity
+        mount_name = sys.intern(config["name"])
+
+        if _is_relative_mount(config):
             self._configure_relative_mount(mount_name, config)
             return
 
-        if "protocol" not in config:
-            raise StorageConfigError(
-                f"Mount configuration for '{config['name']}' missing required field: 'protocol'"
-            )
-
         backend_type = config["protocol"]
 
-        # Create appropriate backend
-        if backend_type == "local":
-            # Accept 'base_path' as standard
-            base_path = config.get("base_path") or config.get("path")
-            if not base_path:
-                raise StorageConfigError(
-                    f"Local storage '{mount_name}' missing required field: 'base_path'"
-                )
-            # LocalStorage supports both string paths and callables
-            # Optional base_url for URL generation
-            backend = LocalStorage(path=base_path, base_url=config.get("base_url"))
-
-        elif backend_type == "memory":
-            backend = FsspecBackend("memory", base_path=config.get("base_path", ""))
-
-        elif backend_type == "s3":
-            if "bucket" not in config:
-                raise StorageConfigError(
-                    f"S3 storage '{mount_name}' missing required field: 'bucket'"
-                )
-            # Build S3 path: bucket/base_path
-            path = config["bucket"]
-            # Accept 'base_path' as standard, 'prefix' for legacy
-            if config.get("base_path"):
-                path = f"{path}/{config['base_path'].strip('/')}"
-            elif config.get("prefix"):
-                path = f"{path}/{config['prefix'].strip('/')}"
-
-            kwargs = {}
-            if "region" in config:
-                kwargs["client_kwargs"] = {"region_name": config["region"]}
-            if "anon" in config:
-                kwargs["anon"] = config["anon"]
-            # Accept 'access_key'/'secret_key' as standard, 'key'/'secret' for legacy
-            if config.get("access_key"):
-                kwargs["key"] = config["access_key"]
-            elif config.get("key"):
-                kwargs["key"] = config["key"]
-            if config.get("secret_key"):
-                kwargs["secret"] = config["secret_key"]
-            elif config.get("secret"):
-                kwargs["secret"] = config["secret"]
-            if "endpoint_url" in config:
-                kwargs["endpoint_url"] = config["endpoint_url"]
-
-            backend = FsspecBackend("s3", base_path=path, **kwargs)
-
-        elif backend_type == "gcs":
-            if "bucket" not in config:
-                raise StorageConfigError(
-                    f"GCS storage '{mount_name}' missing required field: 'bucket'"
-                )
-            path = config["bucket"]
-            # Accept 'base_path' as standard, 'prefix' for legacy
-            if config.get("base_path"):
-                path = f"{path}/{config['base_path'].strip('/')}"
-            elif config.get("prefix"):
-                path = f"{path}/{config['prefix'].strip('/')}"
-
-            kwargs = {}
-            if "token" in config:
-                kwargs["token"] = config["token"]
-            if "project" in config:
-                kwargs["project"] = config["project"]
-            if "endpoint_url" in config:
-                kwargs["endpoint_url"] = config["endpoint_url"]
-
-            backend = FsspecBackend("gcs", base_path=path, **kwargs)
-
-        elif backend_type == "azure":
-            if "container" not in config:
-                raise StorageConfigError(
-                    f"Azure storage '{mount_name}' missing required field: 'container'"
-                )
-            if "account_name" not in config:
-                raise StorageConfigError(
-                    f"Azure storage '{mount_name}' missing required field: 'account_name'"
-                )
-
-            # Base path is just the container name for Azure
-            base_path = config["container"]
-
-            kwargs = {"account_name": config["account_name"]}
-            if "account_key" in config:
-                kwargs["account_key"] = config["account_key"]
-            if "sas_token" in config:
-                kwargs["sas_token"] = config["sas_token"]
-            if "connection_string" in config:
-                kwargs["connection_string"] = config["connection_string"]
-
-            backend = FsspecBackend("az", base_path=base_path, **kwargs)
-
-        elif backend_type == "http":
-            # Accept 'base_path' as standard, 'base_url' for legacy
-            base_path_value = config.get("base_path") or config.get("base_url")
-            if not base_path_value:
-                raise StorageConfigError(
-                    f"HTTP storage '{mount_name}' missing required field: 'base_path'"
-                )
-            backend = FsspecBackend("http", base_path=base_path_value)
-
-        elif backend_type == "smb":
-            if "host" not in config:
-                raise StorageConfigError(
-                    f"SMB storage '{mount_name}' missing required field: 'host'"
-                )
-            if "share" not in config:
-                raise StorageConfigError(
-                    f"SMB storage '{mount_name}' missing required field: 'share'"
-                )
-
-            # Build SMB path: /share/base_path
-            path = f"/{config['share']}"
-            # Accept 'base_path' as standard, 'path' for legacy
-            if config.get("base_path"):
-                path = f"{path}/{config['base_path'].strip('/')}"
-            elif config.get("path"):
-                path = f"{path}/{config['path'].strip('/')}"
-
-            kwargs = {"host": config["host"]}
-            if "username" in config:
-                kwargs["username"] = config["username"]
-            if "password" in config:
-                kwargs["password"] = config["password"]
-            if "domain" in config:
-                kwargs["domain"] = config["domain"]
-            if "port" in config:
-                kwargs["port"] = config["port"]
-
-            backend = FsspecBackend("smb", base_path=path, **kwargs)
-
-        elif backend_type == "sftp":
-            if "host" not in config:
-                raise StorageConfigError(
-                    f"SFTP storage '{mount_name}' missing required field: 'host'"
-                )
-            if "username" not in config:
-                raise StorageConfigError(
-                    f"SFTP storage '{mount_name}' missing required field: 'username'"
-                )
-
-            # Build SFTP path: host:/base_path
-            # Accept 'base_path' as standard, 'path' for legacy
-            path = config.get("base_path") or config.get("path", "/")
-
-            kwargs = {"host": config["host"], "username": config["username"]}
-            if "password" in config:
-                kwargs["password"] = config["password"]
-            if "port" in config:
-                kwargs["port"] = config["port"]
-            if "key_filename" in config:
-                kwargs["key_filename"] = config["key_filename"]
-            if "passphrase" in config:
-                kwargs["passphrase"] = config["passphrase"]
-            if "timeout" in config:
-                kwargs["timeout"] = config["timeout"]
-
-            backend = FsspecBackend("sftp", base_path=path, **kwargs)
-
-        elif backend_type == "zip":
-            if "file" not in config:
-                raise StorageConfigError(
-                    f"ZIP storage '{mount_name}' missing required field: 'file'"
-                )
-
-            # ZIP archives use 'fo' parameter for file path
-            kwargs = {"fo": config["file"]}
-            if "mode" in config:
-                kwargs["mode"] = config["mode"]
-            if "target_protocol" in config:
-                kwargs["target_protocol"] = config["target_protocol"]
-            if "target_options" in config:
-                kwargs["target_options"] = config["target_options"]
-
-            backend = FsspecBackend("zip", base_path="", **kwargs)
-
-        elif backend_type == "tar":
-            if "file" not in config:
-                raise StorageConfigError(
-                    f"TAR storage '{mount_name}' missing required field: 'file'"
-                )
-
-            # TAR archives use 'fo' parameter for file path
-            kwargs = {"fo": config["file"]}
-            if "compression" in config:
-                kwargs["compression"] = config["compression"]
-            if "target_protocol" in config:
-                kwargs["target_protocol"] = config["target_protocol"]
-            if "target_options" in config:
-                kwargs["target_options"] = config["target_options"]
-
-            backend = FsspecBackend("tar", base_path="", **kwargs)
-
-        elif backend_type == "git":
-            # Accept 'base_path' as standard, 'path' for legacy
-            git_path = config.get("base_path") or config.get("path")
-            if not git_path:
-                raise StorageConfigError(
-                    f"Git storage '{mount_name}' missing required field: 'base_path'"
-                )
-
-            # Git backend accesses local Git repositories
-            kwargs = {"path": git_path}
-            if "ref" in config:
-                kwargs["ref"] = config["ref"]  # commit, tag, or branch
-            if "fo" in config:
-                kwargs["fo"] = config["fo"]
-
-            backend = FsspecBackend("git", base_path="", **kwargs)
-
-        elif backend_type == "github":
-            if "org" not in config:
-                raise StorageConfigError(
-                    f"GitHub storage '{mount_name}' missing required field: 'org'"
-                )
-            if "repo" not in config:
-                raise StorageConfigError(
-                    f"GitHub storage '{mount_name}' missing required field: 'repo'"
-                )
-
-            # GitHub backend accesses remote repositories via API
-            kwargs = {"org": config["org"], "repo": config["repo"]}
-            if "sha" in config:
-                kwargs["sha"] = config["sha"]  # commit, branch, or tag
-            if "username" in config:
-                kwargs["username"] = config["username"]  # GitHub username for auth
-            if "token" in config:
-                kwargs["token"] = config["token"]  # GitHub personal access token
-
-            backend = FsspecBackend("github", base_path="", **kwargs)
-
-        elif backend_type == "webdav":
-            if "url" not in config:
-                raise StorageConfigError(
-                    f"WebDAV storage '{mount_name}' missing required field: 'url'"
-                )
-
-            # WebDAV backend for Nextcloud, ownCloud, SharePoint, etc.
-            kwargs = {"base_url": config["url"]}
-            if "username" in config and "password" in config:
-                kwargs["auth"] = (config["username"], config["password"])
-            if "token" in config:
-                kwargs["token"] = config["token"]
-            if "cert" in config:
-                kwargs["cert"] = config["cert"]
-            if "verify_ssl" in config:
-                kwargs["verify_ssl"] = config["verify_ssl"]
-
-            backend = FsspecBackend("webdav", base_path="", **kwargs)
-
-        elif backend_type == "libarchive":
-            if "file" not in config:
-                raise StorageConfigError(
-                    f"LibArchive storage '{mount_name}' missing required field: 'file'"
-                )
-
-            # LibArchive backend for universal archive support (7z, rar, iso, etc.)
-            kwargs = {"fo": config["file"]}
-            if "target_protocol" in config:
-                kwargs["target_protocol"] = config["target_protocol"]
-            if "target_options" in config:
-                kwargs["target_options"] = config["target_options"]
-
-            backend = FsspecBackend("libarchive", base_path="", **kwargs)
-
-        elif backend_type == "base64":
-            # Base64 backend has no configuration parameters
-            backend = Base64Backend()
-
-        else:
+        factory = _BACKEND_FACTORIES.get(backend_type)
+        if factory is None:
             raise StorageConfigError(
                 f"Unknown storage type '{backend_type}' for mount '{mount_name}'. "
-                f"Supported types: local, s3, gcs, azure, http, memory, base64, smb, sftp, zip, tar, "
-                f"git, github, webdav, libarchive"
+                f"Supported types: {', '.join(_BACKEND_FACTORIES)}"
             )
 
-        # Apply permission restrictions if specified
+        # Apply permission restrictions if specified. Checking them needs the
+        # backend capabilities, so these mounts are built right away.
         if "permissions" in config:
-            backend = self._apply_permissions(mount_name, backend, config["permissions"])
+            backend = self._apply_permissions(mount_name, factory(config), config["permissions"])
+        elif backend_type in _EAGER_PROTOCOLS:
+            backend = factory(config)
+        else:
+            _check_driver(mount_name, backend_type)
+            backend = _PendingBackend(factory, dict(config))
 
         self._mounts[mount_name] = backend
+        self._mount_changed(mount_name)
 
     def _configure_relative_mount(self, mount_name: str, config: dict[str, Any]) -> None:
         """Configure a relative mount point that references a parent mount.
@@ -645,13 +1268,12 @@ class StorageManager:
         mount_path = config["path"]
 
         # Parse parent mount and relative path
-        if ":" not in mount_path:
+        parent_mount_name, sep, relative_path = mount_path.partition(":")
+        if not sep:
             raise StorageConfigError(
                 f"Relative mount path must contain ':' separator (got '{mount_path}')"
             )
 
-        parent_mount_name, relative_path = mount_path.split(":", 1)
-
         # Validate parent mount exists
         if parent_mount_name not in self._mounts:
             available = ", ".join(f"'{m}'" for m in self._mounts.keys()) if self._mounts else "none"
@@ -677,6 +1299,7 @@ class StorageManager:
         relative_backend = RelativeMountBackend(parent_backend, relative_path, permissions)
 
         self._mounts[mount_name] = relative_backend
+        self._mount_changed(mount_name)
 
     def _apply_permissions(
         self, mount_name: str, backend: StorageBackend, permissions: str
@@ -819,33 +1442,221 @@ class StorageManager:
         if mount_or_path is None:
             return StorageNode(self, None, None, version=version)
 
-        # Parse mount and path
-        if ":" in mount_or_path:
-            # Format: "mount:path"
-            mount_name, initial_path = mount_or_path.split(":", 1)
-            path_components = [initial_path] if initial_path else []
-        else:
-            # Just mount name
-            mount_name = mount_or_path
-            path_components = []
-
-        # Add additional path parts
-        path_components.extend(path_parts)
+        # Parse mount and path (cached: apps reuse a small set of addresses)
+        mount_name, path = _parse_address(mount_or_path)
 
         # Check if mount exists
         if mount_name not in self._mounts:
-            raise StorageNotFoundError(
-                f"Mount point '{mount_name}' not found. "
-                f"Available mounts: {', '.join(self._mounts.keys())}"
-            )
+            raise StorageNotFoundError(_MountNotFoundMessage(mount_name, tuple(self._mounts)))
 
-        # Join and normalize path
-        path = "/".join(path_components)
-        path = self._normalize_path(path)
+        # Add additional path parts
+        if path_parts:
+            path = self._join_and_normalize(path, *path_parts)
 
         # Create and return node
+        if self._node_cache is not None and version is None:
+            return self._intern(mount_name, path)
         return StorageNode(self, mount_name, path, version=version)
 
+    def nodes(
+        self, addresses: Annotated[Iterable[str], "Addresses in mount:path format"]
+    ) -> list[StorageNode]:
+        """Create StorageNodes for many addresses at once.
+
+        Equivalent to ``[storage.node(a) for a in addresses]``, with the
+        per-call lookups hoisted out of the loop. Useful when building nodes
+        for large listings or copy plans.
+
+        Args:
+            addresses: Iterable of "mount:path" strings
+
+        Returns:
+            list[StorageNode]: One node per address, in input order
+
+        Raises:
+            StorageNotFoundError: If a mount point doesn't exist
+            ValueError: If a path contains invalid components (e.g., "..")
+
+        Examples:
+            >>> docs = storage.nodes(['home:a.txt', 'home:b.txt', 'uploads:c.pdf'])
+        """
+        mounts = self._mounts
+        parse = _parse_address
+        result = []
+        append = result.append
+        for address in addresses:
+            mount_name, path = parse(address)
+            if mount_name not in mounts:
+                raise StorageNotFoundError(_MountNotFoundMessage(mount_name, tuple(mounts)))
+            if self._node_cache is not None:
+                append(self._intern(mount_name, path))
+            else:
+                append(StorageNode(self, mount_name, path))
+        return result
+
+    def _map_nodes(
+        self,
+        func: Callable[[StorageNode], Any],
+        nodes: Iterable[StorageNode | str],
+        max_concurrency: int,
+    ) -> dict[str, Any]:
+        """Apply func to each node, concurrently, keyed by fullpath."""
+        targets = [self.node(n) if isinstance(n, str) else n for n in nodes]
+        if max_concurrency <= 1 or len(targets) <= 1:
+            return {node.fullpath: func(node) for node in targets}
+
+        workers = min(max_concurrency, len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(func, targets)
+            return {node.fullpath: result for node, result in zip(targets, results)}
+
+    @smartasync
+    def read_many(
+        self,
+        nodes: Annotated[Iterable[StorageNode | str], "Nodes or mount:path addresses"],
+        max_concurrency: Annotated[int, "Maximum parallel reads"] = 32,
+    ) -> dict[str, bytes]:
+        """Read many files concurrently.
+
+        Reading objects one after another pays a full network round trip for
+        each. Here up to ``max_concurrency`` reads are in flight at once, so
+        fetching N small objects takes roughly N / max_concurrency round
+        trips. Object-store mounts get all their paths in one native batch
+        call (concurrent requests on the filesystem's event loop); other
+        backends are called from worker threads. In async code the call is
+        awaitable and runs off the event loop.
+
+        Args:
+            nodes: StorageNodes or "mount:path" strings
+            max_concurrency: Maximum number of reads in flight (1 = sequential)
+
+        Returns:
+            dict[str, bytes]: File content by fullpath, in input order
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist (first error wins)
+
+        Examples:
+            >>> contents = storage.read_many(['s3:a.json', 's3:b.json'])
+            >>> data = contents['s3:a.json']
+        """
+        targets = [self.node(n) if isinstance(n, str) else n for n in nodes]
+
+        # Backends with a native batch read (object stores) get all their
+        # paths in one call; everything else is read from worker threads
+        batches: dict[StorageBackend, list[StorageNode]] = {}
+        single = []
+        batching: dict[StorageBackend, bool] = {}
+        for node in targets:
+            backend = node._backend
+            if backend is not None and node._version is None and self._content_cache is None:
+                if backend not in batching:
+                    batching[backend] = backend.reads_in_batch()
+                if batching[backend]:
+                    batches.setdefault(backend, []).append(node)
+                    continue
+            single.append(node)
+
+        if not batches:
+            return self._map_nodes(lambda node: node._read_bytes(), single, max_concurrency)
+
+        contents = {}
+        for backend, group in batches.items():
+            data = backend.read_bytes_batch([node._path for node in group], max_concurrency)
+            contents.update(zip((node.fullpath for node in group), data))
+        contents.update(self._map_nodes(lambda node: node._read_bytes(), single, max_concurrency))
+        return {node.fullpath: contents[node.fullpath] for node in targets}
+
+    @smartasync
+    def stat_many(
+        self,
+        nodes: Annotated[Iterable[StorageNode | str], "Nodes or mount:path addresses"],
+        max_concurrency: Annotated[int, "Maximum parallel requests"] = 32,
+    ) -> dict[str, StatResult]:
+        """Fetch metadata for many paths concurrently.
+
+        Each node's metadata cache is filled as a side effect, so passing
+        StorageNodes and then calling ``exists()``/``size()``/``mtime()`` on
+        them needs no further backend requests.
+
+        Args:
+            nodes: StorageNodes or "mount:path" strings
+            max_concurrency: Maximum number of requests in flight (1 = sequential)
+
+        Returns:
+            dict[str, StatResult]: Metadata by fullpath, in input order
+
+        Examples:
+            >>> nodes = storage.nodes(['s3:a.pdf', 's3:b.pdf'])
+            >>> storage.stat_many(nodes)
+            >>> sizes = [n.size() for n in nodes if n.exists()]
+        """
+        return self._map_nodes(lambda node: node._stat(), nodes, max_concurrency)
+
+    @smartasync
+    def hash_many(
+        self,
+        nodes: Annotated[Iterable[StorageNode | str], "Nodes or mount:path addresses"],
+        max_concurrency: Annotated[int, "Maximum parallel requests"] = 32,
+    ) -> dict[str, str]:
+        """Get the MD5 hash of many files concurrently.
+
+        Deduplication and sync jobs hash whole folders; one by one, each file
+        costs a metadata request (ETag on S3) or a full read. Here up to
+        ``max_concurrency`` hashes are computed at once, each following the
+        ``md5hash()`` rules.
+
+        Args:
+            nodes: StorageNodes or "mount:path" strings (files)
+            max_concurrency: Maximum number of requests in flight (1 = sequential)
+
+        Returns:
+            dict[str, str]: MD5 hex digest by fullpath, in input order
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+            ValueError: If a node is a directory
+
+        Examples:
+            >>> hashes = storage.hash_many(storage.node('s3:photos').children())
+            >>> duplicates = len(hashes) - len(set(hashes.values()))
+        """
+        return self._map_nodes(lambda node: node.md5hash(), nodes, max_concurrency)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[StorageManager]:
+        """Share metadata lookups between nodes for the duration of a block.
+
+        Inside the block, asking any node for exists/is_file/is_dir/size/mtime
+        of a path that another node already looked up reuses that result
+        instead of calling the backend again. This collapses the repeated
+        HEAD requests issued when many independently built nodes (templates,
+        resolvers, copy plans) point at the same files.
+
+        Writes, deletes and ``invalidate()`` made through a node drop its
+        shared entry. A node whose own metadata expired (``stat_cache_ttl``)
+        also takes it from the scope. Nested ``batch()`` calls join the
+        outermost scope.
+
+        Yields:
+            StorageManager: This manager
+
+        Examples:
+            >>> with storage.batch():
+            ...     for name in asset_names:
+            ...         if storage.node(f'static:{name}').exists():
+            ...             ...
+        """
+        if self._batch_stats is not None:
+            yield self
+            return
+
+        self._batch_stats = {}
+        try:
+            yield self
+        finally:
+            self._batch_stats = None
+
     def iternode(self, *nodes) -> StorageNode:
         """Create a virtual node that concatenates multiple nodes lazily.
 
@@ -937,20 +1748,57 @@ class StorageManager:
         Raises:
             ValueError: If path contains invalid components (e.g., "..")
         """
-        if not path:
-            return ""
+        return _normalize_path(path)
 
-        # Check for parent directory traversal
-        if ".." in path.split("/"):
-            raise ValueError("Parent directory traversal (..) is not supported")
+    def _join_and_normalize(self, *parts: str) -> str:
+        """Join path parts and normalize the result in a single walk.
 
-        # Normalize: strip leading/trailing slashes, collapse multiple slashes
-        parts = [p for p in path.split("/") if p]
-        return "/".join(parts)
+        Equivalent to ``_normalize_path("/".join(parts))`` without building
+        the intermediate joined string.
+
+        Args:
+            *parts: Path parts, each possibly containing slashes
+
+        Returns:
+            str: Normalized path
+
+        Raises:
+            ValueError: If any component is ".."
+        """
+        segments = []
+        for part in parts:
+            if not part:
+                continue
+            for segment in part.split("/"):
+                if not segment:
+                    continue
+                if segment == "..":
+                    raise ValueError("Parent directory traversal (..) is not supported")
+                segments.append(segment)
+        return "/".join(segments)
+
+    @property
+    def mounts(self) -> Mapping[str, StorageBackend]:
+        """Read-only view of the configured mounts (name -> backend).
+
+        This is the fast path for lookups in tight loops: ``'home' in
+        storage.mounts`` avoids a method call per check. The view is live,
+        so it reflects later ``configure()``/``delete_mount()`` calls.
+
+        Examples:
+            >>> 'uploads' in storage.mounts
+            True
+            >>> list(storage.mounts)
+            ['home', 'uploads']
+        """
+        return self._mounts_view
 
     def get_mount_names(self) -> Annotated[list[str], "List of configured mount point names"]:
         """Get list of configured mount names.
 
+        For membership tests and iteration without a list copy, use the
+        ``mounts`` view instead.
+
         Returns:
             list[str]: List of mount point names
 
@@ -962,13 +1810,17 @@ class StorageManager:
             >>> print(storage.get_mount_names())
             ['home', 'uploads']
         """
-        return list(self._mounts.keys())
+        if self._mount_names_cache is None:
+            self._mount_names_cache = tuple(self._mounts)
+        return list(self._mount_names_cache)
 
     def has_mount(
         self, name: Annotated[str, "Mount point name to check"]
     ) -> Annotated[bool, "True if mount exists"]:
         """Check if a mount point is configured.
 
+        Equivalent to ``name in storage.mounts``, which is faster in tight loops.
+
         Args:
             name: Mount point name to check
 
@@ -21,12 +21,32 @@ interacting with files and directories across different storage backends.
 
 from __future__ import annotations
 from typing import BinaryIO, TextIO, TYPE_CHECKING, Callable, Literal, Annotated
+from collections.abc import Iterator
 from pathlib import PurePosixPath
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+import dataclasses
+from fnmatch import fnmatch
+import base64
+import hashlib
+import mimetypes
+import os
+import time
 
 from genro_toolbox import smartasync
 
+from .backends.base import StatResult, _MISSING
+
+# Bytes read per step by to_base64() (a multiple of 3: no padding mid-stream)
+_BASE64_READ_SIZE = 3 * 256 * 1024
+
+# Bytes read per step when computing MD5 hashes
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# same_content() hashes files from this size on in parallel segments
+_PARALLEL_HASH_MIN_SIZE = 64 * 1024 * 1024
+
 if TYPE_CHECKING:
     import zipfile
     from .manager import StorageManager
@@ -39,7 +59,8 @@ class SkipStrategy(str, Enum):
         NEVER: Always copy (overwrite existing files)
         EXISTS: Skip if destination file exists (fastest)
         SIZE: Skip if destination exists and has same size (fast)
-        HASH: Skip if destination exists and has same content/MD5 (accurate)
+        HASH: Skip if destination exists and has same content/MD5 (accurate;
+            sizes are compared first, so files of different size aren't hashed)
         CUSTOM: Use custom skip function provided by user
     """
 
@@ -103,14 +124,34 @@ class StorageNode:
         size(): Get file size in bytes
         mtime(): Get last modification time
         md5hash(): Get MD5 hash of content
+        same_content(): Compare file content with another node
         read(): Read file content
         write(): Write data to file
         delete(): Delete file or directory
         copy_to(): Copy to another node
-        children(): List directory contents
+        children(): List directory contents, with metadata from the listing
         mkdir(): Create directory
     """
 
+    # Directory walks create many nodes: no per-instance __dict__.
+    # Subclasses without __slots__ still get one for their own attributes.
+    __slots__ = (
+        "__weakref__",
+        "_backend",
+        "_fullpath",
+        "_is_virtual",
+        "_manager",
+        "_md5_cache",
+        "_mount_name",
+        "_parent",
+        "_path",
+        "_sources",
+        "_stat_cache",
+        "_stat_expiry",
+        "_version",
+        "_virtual_type",
+    )
+
     def __init__(
         self,
         manager: StorageManager,
@@ -133,19 +174,41 @@ class StorageNode:
         self._manager = manager
         self._mount_name = mount_name
         self._path = path
+        self._fullpath: str | None = None  # built on first access to fullpath
         self._version = version  # None = current version, int/str = specific version
-        self._posix_path = PurePosixPath(path) if path else PurePosixPath(".")
 
         # Virtual node support (set by iternode()/diffnode())
         self._is_virtual = False
         self._virtual_type = None  # 'iter' or 'diff'
-        self._sources: list[StorageNode] = []  # For virtual nodes
+        # Source nodes; iternode()/diffnode() assign a list, regular nodes
+        # share one empty tuple instead of allocating an empty list each
+        self._sources: list[StorageNode] | tuple[()] = ()
 
-        # Get backend from manager (None for virtual nodes)
+        # Resolve the backend once (None for virtual nodes): every operation
+        # calls self._backend directly, with no per-call mount lookup
         self._backend = manager._mounts[mount_name] if mount_name else None
 
+        # Memoized backend stat() result, see _stat()/invalidate()
+        self._stat_cache: StatResult | None = None
+        # time.monotonic() after which _stat_cache is stale (stat_cache_ttl)
+        self._stat_expiry: float | None = None
+        # Parent node, built on first access to parent
+        self._parent: StorageNode | None = None
+        # ((mtime, size), hex digest) of the last MD5 computed by reading
+        self._md5_cache: tuple[tuple, str] | None = None
+
     # ==================== Properties ====================
 
+    @property
+    def _posix_path(self) -> PurePosixPath:
+        """Path as PurePosixPath, for callers needing full pathlib semantics.
+
+        Built on demand: the name/stem/suffix/parent properties work on the
+        path string directly, so listings creating thousands of nodes don't
+        pay for parsing paths nobody inspects.
+        """
+        return PurePosixPath(self._path) if self._path else PurePosixPath(".")
+
     @property
     def fullpath(self) -> str:
         """Full path including mount point.
@@ -158,9 +221,29 @@ class StorageNode:
             >>> print(node.fullpath)
             'home:documents/report.pdf'
         """
-        if self._path:
-            return f"{self._mount_name}:{self._path}"
-        return f"{self._mount_name}:"
+        fullpath = self._fullpath
+        if fullpath is None:
+            fullpath = self._fullpath = f"{self._mount_name}:{self._path or ''}"
+        return fullpath
+
+    @property
+    def _key(self) -> tuple[str, str]:
+        """(mount, path) pair identifying this node in the manager's caches.
+
+        Used instead of ``fullpath`` for internal keys: the tuple reuses the
+        stored strings, so building and hashing it allocates no new string.
+        """
+        return (self._mount_name, self._path)
+
+    def _set_path(self, path: str) -> None:
+        """Repoint this node to another path in the same mount.
+
+        Used when a backend assigns the path on write (base64) and by
+        move_to(). Resets the values derived from the path.
+        """
+        self._path = path
+        self._fullpath = None
+        self._parent = None
 
     @property
     def path(self) -> str:
@@ -217,9 +300,111 @@ class StorageNode:
             - Remote backends return None (use local_path() for temporary access)
             - The path may not exist yet (e.g., for new files to be written)
             - Replaces need to access private _backend._resolve_path()
+            - Call ``invalidate()`` after modifying the file through this path
         """
         return self._backend.resolved_path(self._path)
 
+    def _stat(self, refresh: bool = False) -> StatResult:
+        """Return the path metadata, reusing a recent backend result.
+
+        exists/is_file/is_dir/size/mtime all read from this cache. A result
+        is reused for the manager's ``stat_cache_ttl`` seconds (0 by default,
+        so each query asks again), counted from its first use when it was
+        primed by a listing. Inside a ``batch()`` scope an expired result is
+        taken from the scope before asking the backend, so operations such
+        as ``copy_to()`` stat each path once. A path found missing is asked again
+        on the next query, so files created by other nodes or processes show
+        up at once (the manager's ``negative_cache_ttl`` opts into
+        remembering misses). The cache is dropped by writes, deletes, copies
+        and moves made through this node and when ``local_path()`` hands the
+        real path out; use ``invalidate()`` after changes made elsewhere.
+
+        Args:
+            refresh: If True, ignore the cached result and ask the backend again
+
+        Returns:
+            StatResult: Metadata of this node's path
+        """
+        manager = self._manager
+        ttl = manager._stat_cache_ttl
+        cached = self._stat_cache
+        if cached is not None and not refresh:
+            if self._stat_expiry is None:
+                # Primed by a listing: good for this use, start the clock now
+                self._stat_expiry = self._stat_deadline(cached, ttl)
+            elif time.monotonic() >= self._stat_expiry:
+                # Expired: a batch() scope may still hold the path's result
+                cached = None
+
+        if cached is None or refresh:
+            key = self._key
+            shared = manager._batch_stats
+            missing = manager._negative_cache
+
+            stat = None
+            if not refresh:
+                if shared is not None:
+                    stat = shared.get(key)
+                if stat is None and missing is not None and manager._known_missing(key):
+                    stat = _MISSING
+
+            if stat is None:
+                stat = self._backend.stat(self._path)
+                if shared is not None:
+                    shared[key] = stat
+                if missing is not None and not stat.exists:
+                    manager._remember_missing(key)
+
+            self._stat_cache = stat
+            self._stat_expiry = self._stat_deadline(stat, ttl)
+        return self._stat_cache
+
+    def _prime_stat(self, stat: StatResult | None) -> None:
+        """Fill the metadata cache from a listing; its clock starts at first use."""
+        self._stat_cache = stat
+        self._stat_expiry = None
+        shared = self._manager._batch_stats
+        if shared is not None and stat is not None:
+            shared[self._key] = stat
+
+    @staticmethod
+    def _stat_deadline(stat: StatResult, ttl: float | None) -> float:
+        """time.monotonic() until which a stat result may be reused."""
+        if not stat.exists:
+            # Never reuse a miss: the path may be created at any moment
+            return float("-inf")
+        if ttl is None:
+            return float("inf")
+        return time.monotonic() + ttl
+
+    def invalidate(self) -> None:
+        """Forget cached metadata so the next query hits the backend again.
+
+        Writes, deletes, copies and moves performed through this node do this
+        automatically. Call it when the file may have been changed by another
+        node, process or external tool.
+
+        Examples:
+            >>> node.exists()
+            False
+            >>> subprocess.run(['touch', node.resolved_path])
+            >>> node.invalidate()
+            >>> node.exists()
+            True
+        """
+        self._stat_cache = None
+        self._stat_expiry = None
+        self._parent = None
+        self._md5_cache = None
+        manager = self._manager
+        key = self._key
+        if manager._batch_stats is not None:
+            manager._batch_stats.pop(key, None)
+        if manager._content_cache is not None:
+            manager._forget_content(key)
+        if manager._negative_cache is not None:
+            manager._forget_missing(key)
+
     @smartasync
     def exists(self) -> bool:
         """Check if file or directory exists.
@@ -241,7 +426,7 @@ class StorageNode:
         # Virtual nodes don't have physical storage
         if self._is_virtual:
             return False
-        return self._backend.exists(self._path)
+        return self._stat().exists
 
     @smartasync
     def is_file(self) -> bool:
@@ -258,7 +443,7 @@ class StorageNode:
             >>> if await node.is_file():
             ...     data = await node.read_bytes()
         """
-        return self._backend.is_file(self._path)
+        return self._stat().is_file
 
     @smartasync
     def is_dir(self) -> bool:
@@ -276,7 +461,7 @@ class StorageNode:
             >>> if await node.is_dir():
             ...     children = await node.children()
         """
-        return self._backend.is_dir(self._path)
+        return self._stat().is_dir
 
     @smartasync
     def size(self) -> int:
@@ -296,7 +481,11 @@ class StorageNode:
             >>> # Async context
             >>> size = await node.size()
         """
-        return self._backend.size(self._path)
+        size = self._stat().size
+        if size is None:
+            # Directory, missing path or unknown size: let the backend raise
+            return self._backend.size(self._path)
+        return size
 
     @smartasync
     def mtime(self) -> float:
@@ -313,7 +502,10 @@ class StorageNode:
             >>> # Async context
             >>> mtime = await node.mtime()
         """
-        return self._backend.mtime(self._path)
+        mtime = self._stat().mtime
+        if mtime is None:
+            return self._backend.mtime(self._path)
+        return mtime
 
     @property
     def basename(self) -> str:
@@ -327,7 +519,7 @@ class StorageNode:
             >>> print(node.basename)
             'report.pdf'
         """
-        return self._posix_path.name
+        return (self._path or "").rstrip("/").rpartition("/")[2]
 
     @property
     def stem(self) -> str:
@@ -341,7 +533,7 @@ class StorageNode:
             >>> print(node.stem)
             'report'
         """
-        return self._posix_path.stem
+        return self._split_name()[0]
 
     @property
     def suffix(self) -> str:
@@ -355,14 +547,30 @@ class StorageNode:
             >>> print(node.suffix)
             '.pdf'
         """
-        return self._posix_path.suffix
+        return self._split_name()[1]
+
+    def _split_name(self) -> tuple[str, str]:
+        """Split basename into (stem, suffix) with pathlib's rules.
+
+        Dotfiles (".bashrc") and names ending with a dot have no suffix.
+        """
+        name = (self._path or "").rstrip("/").rpartition("/")[2]
+        head, dot, tail = name.rpartition(".")
+        if head and tail:
+            return head, dot + tail
+        return name, ""
 
     @property
     def parent(self) -> StorageNode:
         """Parent directory as StorageNode.
 
+        The node is built once and reused by later accesses, so walking up
+        with ``node.parent.parent`` or ``while node.parent != root`` doesn't
+        allocate a node per step. ``invalidate()`` (called by writes,
+        deletes and moves) drops it together with the cached metadata.
+
         Returns:
-            StorageNode: A new StorageNode pointing to the parent directory
+            StorageNode: StorageNode pointing to the parent directory
 
         Examples:
             >>> node = storage.node('home:documents/reports/q4.pdf')
@@ -370,10 +578,12 @@ class StorageNode:
             >>> print(parent.fullpath)
             'home:documents/reports'
         """
-        parent_path = str(self._posix_path.parent)
-        if parent_path == ".":
-            parent_path = ""
-        return self._create_node(self._manager, self._mount_name, parent_path)
+        parent_path = (self._path or "").rstrip("/").rpartition("/")[0].rstrip("/")
+        parent = self._parent
+        # The cached node may have been repointed (move_to) since
+        if parent is None or parent._path != parent_path or parent._mount_name != self._mount_name:
+            parent = self._parent = self._create_node(self._manager, self._mount_name, parent_path)
+        return parent
 
     @property
     def dirname(self) -> str:
@@ -422,7 +632,7 @@ class StorageNode:
             >>> if node.suffix == '.pdf':
             ...     process_pdf(node)
         """
-        return self.suffix.lstrip(".") if self.suffix else ""
+        return self._split_name()[1][1:]
 
     def splitext(self) -> tuple[str, str]:
         """Split path into filename and extension.
@@ -447,9 +657,9 @@ class StorageNode:
             >>> new_path = f'{name}.docx'
             >>> new_node = storage.node(f'home:{new_path}')
         """
-        if self.suffix:
-            name = self._path.rsplit(self.suffix, 1)[0]
-            return name, self.suffix
+        suffix = self._split_name()[1]
+        if suffix:
+            return self._path.rpartition(suffix)[0], suffix
         return self._path, ""
 
     @property
@@ -476,12 +686,12 @@ class StorageNode:
             >>> size = node.size()
             >>> isdir = node.is_dir()
         """
-        if not self.exists():
+        stat = self._stat()
+        if not stat.exists:
             return None, None, False
 
-        is_directory = self.is_dir()
-        file_size = None if is_directory else self.size()
-        return self.mtime(), file_size, is_directory
+        file_size = None if stat.is_dir else stat.size
+        return stat.mtime, file_size, stat.is_dir
 
     @smartasync
     def md5hash(self) -> str:
@@ -506,36 +716,159 @@ class StorageNode:
             >>> # Async context
             >>> hash1 = await node1.md5hash()
         """
-        # Check if exists first
-        if not self.exists():
-            raise FileNotFoundError(f"File not found: {self.fullpath}")
+        # One metadata lookup for the checks and the hash helpers below
+        with self._manager.batch():
+            # Check if exists first
+            if not self.exists():
+                raise FileNotFoundError(f"File not found: {self.fullpath}")
 
-        # Check if it's a file (not a directory)
-        if not self.is_file():
-            raise ValueError(f"Cannot compute hash of directory: {self.fullpath}")
+            # Check if it's a file (not a directory)
+            if not self.is_file():
+                raise ValueError(f"Cannot compute hash of directory: {self.fullpath}")
 
-        # Try to get hash from backend metadata first (S3 ETag, etc.)
-        metadata_hash = self._backend.get_hash(self._path)
-        if metadata_hash:
-            return metadata_hash.lower()
+            # Try to get hash from backend metadata first (S3 ETag, etc.)
+            content_hash = self._content_hash()
+            if content_hash and content_hash[0] == "md5":
+                return content_hash[1]
 
-        # Fallback: compute MD5 by reading file in blocks
-        import hashlib
+            return self._compute_md5()
 
-        hasher = hashlib.md5()
+    def _content_hash(self) -> tuple[str, str] | None:
+        """Return the hash the storage service keeps for this file, if any.
+
+        Taken from the cached metadata when the stat (or the listing that
+        primed it) carried one, so no further request is made.
+        """
+        content_hash = self._stat().content_hash
+        if content_hash is not None:
+            return content_hash
+        return self._backend.get_content_hash(self._path)
 
-        # Use 64KB blocks like Genropy legacy code
-        BLOCKSIZE = 65536
+    def _compute_md5(self) -> str:
+        """Compute the MD5 hex digest by reading the file in blocks.
 
+        The digest is kept until the file's mtime or size change (or the node
+        is invalidated), so hashing the same file again costs no read.
+        """
+        stat = self._stat()
+        validator = (stat.mtime, stat.size)
+        if self._md5_cache is not None and self._md5_cache[0] == validator:
+            return self._md5_cache[1]
+
+        digest = self._read_md5()
+        if stat.mtime is not None:
+            self._md5_cache = (validator, digest)
+        return digest
+
+    def _read_md5(self) -> str:
+        """Read the whole file and return its MD5 hex digest."""
+        # Checksum only, so FIPS-restricted builds may use MD5 too
+        hasher = hashlib.md5(usedforsecurity=False)
+
+        # One reusable 1 MiB buffer; update() releases the GIL while hashing it
+        view = memoryview(bytearray(_HASH_BLOCK_SIZE))
         with self.open("rb") as f:
             while True:
-                chunk = f.read(BLOCKSIZE)
-                if not chunk:
+                n = f.readinto(view)
+                if not n:
                     break
-                hasher.update(chunk)
+                hasher.update(view[:n])
 
         return hasher.hexdigest()
 
+    @smartasync
+    def same_content(self, other: Annotated[StorageNode, "Node to compare content with"]) -> bool:
+        """Tell whether this file and another hold the same bytes.
+
+        Works across mounts and backends. Cheap checks come first: the same
+        location, then file sizes from the cached metadata (different sizes
+        mean different content without reading anything), then the hashes
+        storage services keep (S3 ETag, GCS md5Hash, Azure content_md5),
+        compared directly when both sides use the same algorithm. MD5 is
+        computed by reading only for files without a usable stored hash.
+
+        Args:
+            other: Node to compare content with
+
+        Returns:
+            bool: True if both are files with identical content; False if they
+                  differ, either is missing or either is a directory
+
+        Examples:
+            >>> original = storage.node('home:original.txt')
+            >>> backup = storage.node('backup:copy.txt')
+            >>> if original.same_content(backup):
+            ...     print("Backup verified")
+            >>>
+            >>> # Async context
+            >>> same = await original.same_content(backup)
+        """
+        # Same location: same content, without any I/O
+        if self == other:
+            return True
+
+        # Both must be files to compare content
+        stat, other_stat = self._stat(), other._stat()
+        if not (stat.is_file and other_stat.is_file):
+            return False
+
+        # Different sizes can't hold the same bytes: skip hashing
+        if stat.size is not None and other_stat.size is not None and stat.size != other_stat.size:
+            return False
+
+        # Hashes the storage services keep (S3/GCS/Azure): compare them
+        # directly when both sides use the same algorithm, without reading
+        ours, theirs = self._content_hash(), other._content_hash()
+        if ours and theirs and ours[0] == theirs[0]:
+            return ours[1] == theirs[1]
+
+        size = stat.size
+        no_md5 = not (ours and ours[0] == "md5") and not (theirs and theirs[0] == "md5")
+        try:
+            # Nothing to match a real MD5 against: hash large files on all cores
+            if no_md5 and other_stat.size == size and (size or 0) >= _PARALLEL_HASH_MIN_SIZE:
+                return self._segment_digest(size) == other._segment_digest(size)
+
+            # Otherwise compare MD5s, computing them where metadata has none
+            md5 = ours[1] if ours and ours[0] == "md5" else self._compute_md5()
+            other_md5 = theirs[1] if theirs and theirs[0] == "md5" else other._compute_md5()
+        except FileNotFoundError:
+            return False
+        return md5 == other_md5
+
+    def _segment_digest(self, size: int) -> str:
+        """Hash the file as segments read in parallel, S3 multipart ETag style.
+
+        Returns the MD5 of the segment MD5s followed by ``-<segments>``. It is
+        not the MD5 of the content: it only matches the segment digest of a
+        file with the same size and content.
+
+        Args:
+            size: File size in bytes, which fixes the segment boundaries
+        """
+        segment = -(-size // (os.cpu_count() or 1))
+        segment = max(-(-segment // _HASH_BLOCK_SIZE) * _HASH_BLOCK_SIZE, _HASH_BLOCK_SIZE)
+
+        def hash_segment(start: int) -> bytes:
+            hasher = hashlib.md5(usedforsecurity=False)
+            remaining = min(segment, size - start)
+            view = memoryview(bytearray(min(_HASH_BLOCK_SIZE, remaining)))
+            with self.open("rb") as f:
+                f.seek(start)
+                while remaining:
+                    n = f.readinto(view[: min(len(view), remaining)])
+                    if not n:
+                        raise FileNotFoundError(f"File changed while hashing: {self.fullpath}")
+                    hasher.update(view[:n])
+                    remaining -= n
+            return hasher.digest()
+
+        starts = range(0, size, segment)
+        with ThreadPoolExecutor(max_workers=len(starts)) as pool:
+            digests = list(pool.map(hash_segment, starts))
+        digest = hashlib.md5(b"".join(digests), usedforsecurity=False).hexdigest()
+        return f"{digest}-{len(digests)}"
+
     @property
     def mimetype(self) -> str:
         """Get MIME type from file extension.
@@ -559,8 +892,6 @@ class StorageNode:
             >>> # Use for HTTP responses
             >>> response.headers['Content-Type'] = node.mimetype
         """
-        import mimetypes
-
         mime, _ = mimetypes.guess_type(self.path)
         return mime or "application/octet-stream"
 
@@ -587,9 +918,9 @@ class StorageNode:
 
         # If node has a fixed version, it's a snapshot and loses versioning capabilities
         if self._version is not None:
-            from dataclasses import replace
-
-            caps = replace(caps, versioning=False, version_listing=False, version_access=False)
+            caps = dataclasses.replace(
+                caps, versioning=False, version_listing=False, version_access=False
+            )
 
         return caps
 
@@ -697,6 +1028,8 @@ class StorageNode:
             return self._backend.open_version(self._path, version_id, mode)
 
         # Accesso normale (latest)
+        if "r" not in mode or "+" in mode:
+            self.invalidate()
         return self._backend.open(self._path, mode)
 
     def _read_bytes(self) -> bytes:
@@ -722,7 +1055,21 @@ class StorageNode:
                 return f.read()
 
         # Normal node
-        return self._backend.read_bytes(self._path)
+        manager = self._manager
+        if manager._content_cache is None:
+            return self._backend.read_bytes(self._path)
+
+        # Content cache: revalidate with a metadata request, which is much
+        # cheaper than downloading the file again
+        stat = self._stat(refresh=True)
+        key = self._key
+        validator = (stat.etag, stat.mtime, stat.size)
+        data = manager._cached_content(key, validator)
+        if data is None:
+            data = self._backend.read_bytes(self._path)
+            if stat.is_file:
+                manager._store_content(key, validator, data)
+        return data
 
     def _read_text(self, encoding: str = "utf-8") -> str:
         """Internal method: Read entire file as string.
@@ -821,7 +1168,9 @@ class StorageNode:
         else:
             raise ValueError(f"Invalid read mode '{mode}'. Use 'r' for text or 'rb' for binary")
 
-    def _write_bytes(self, data: bytes, skip_if_unchanged: bool = False) -> bool:
+    def _write_bytes(
+        self, data: bytes | bytearray | memoryview, skip_if_unchanged: bool = False
+    ) -> bool:
         """Internal method: Write bytes to file.
 
         Args:
@@ -864,8 +1213,6 @@ class StorageNode:
             )
         # Check if we should skip
         if skip_if_unchanged:
-            import hashlib
-
             # Try to compare with existing content
             if self.capabilities.versioning and self.exists():
                 # Calculate MD5 of new content
@@ -882,20 +1229,23 @@ class StorageNode:
                     if current_etag and new_md5 == current_etag:
                         return False  # Skip: content identical
             elif self.exists():
-                # Non-versioned backend: compare with current content
-                try:
-                    current_data = self._read_bytes()
-                    if current_data == data:
-                        return False  # Skip: content identical
-                except Exception:
-                    pass  # If we can't read, write anyway
+                # Non-versioned backend: compare with current content,
+                # reading it only when the sizes match
+                size = self._stat().size
+                if size is None or size == memoryview(data).nbytes:
+                    try:
+                        current_data = self._read_bytes()
+                        if current_data == data:
+                            return False  # Skip: content identical
+                    except Exception:
+                        pass  # If we can't read, write anyway
 
         # Write the data
+        self.invalidate()
         result = self._backend.write_bytes(self._path, data)
         # If backend returns a new path (e.g., base64), update it
         if result is not None:
-            self._path = result
-            self._posix_path = PurePosixPath(result) if result else PurePosixPath(".")
+            self._set_path(result)
 
         return True
 
@@ -933,7 +1283,9 @@ class StorageNode:
     @smartasync
     def write(
         self,
-        data: Annotated[str | bytes, "Data to write (str for text, bytes for binary)"],
+        data: Annotated[
+            str | bytes | bytearray | memoryview, "Data to write (str for text, bytes for binary)"
+        ],
         mode: Annotated[str, "Write mode: 'w' for text, 'wb' for binary"] = "w",
         encoding: Annotated[str, "Text encoding (only for text mode)"] = "utf-8",
         skip_if_unchanged: Annotated[bool, "Skip writing if content is identical"] = False,
@@ -941,7 +1293,8 @@ class StorageNode:
         """Write data to file in text or binary mode.
 
         Args:
-            data: Data to write (str for text mode, bytes for binary mode)
+            data: Data to write (str for text mode; bytes, bytearray or
+                memoryview for binary mode)
             mode: Write mode - 'w' for text (default), 'wb' for binary
             encoding: Text encoding (used only for text mode)
             skip_if_unchanged: If True, skip writing if content identical
@@ -972,7 +1325,7 @@ class StorageNode:
                 raise TypeError(f"Text mode 'w' requires str, got {type(data).__name__}")
             return self._write_text(data, encoding, skip_if_unchanged)
         elif mode == "wb":
-            if not isinstance(data, bytes):
+            if not isinstance(data, (bytes, bytearray, memoryview)):
                 raise TypeError(f"Binary mode 'wb' requires bytes, got {type(data).__name__}")
             return self._write_bytes(data, skip_if_unchanged)
         else:
@@ -1026,6 +1379,51 @@ class StorageNode:
         """
         return self._read_bytes()
 
+    @smartasync
+    def read_into(
+        self,
+        buf: Annotated[bytearray | memoryview, "Writable buffer to fill"],
+        offset: Annotated[int, "Position in the file to start reading from"] = 0,
+        length: Annotated[int | None, "Maximum bytes to read (default: len(buf))"] = None,
+    ) -> int:
+        """Read file content into a buffer the caller already owns.
+
+        Unlike ``read_bytes()`` no new bytes object is allocated: data goes
+        straight into ``buf``, so a pipeline can reuse one buffer for many
+        reads. With ``offset`` only the requested range is fetched (a
+        ranged GET on object stores).
+
+        Args:
+            buf: Writable buffer (bytearray, memoryview, array, mmap, ...)
+            offset: Position in the file to start reading from
+            length: Maximum number of bytes to read (default: size of buf)
+
+        Returns:
+            int: Number of bytes read (less than requested at end of file)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+
+        Examples:
+            >>> buf = bytearray(1024 * 1024)
+            >>> n = node.read_into(buf)
+            >>> header = buf[:n]
+            >>>
+            >>> # Read a range into a reused buffer
+            >>> n = node.read_into(buf, offset=4096, length=512)
+        """
+        view = memoryview(buf).cast("B")
+        if length is not None:
+            view = view[:length]
+
+        if self._is_virtual or self._version is not None:
+            # Materialized or versioned content: copy the requested slice
+            data = self._read_bytes()[offset : offset + len(view)]
+            view[: len(data)] = data
+            return len(data)
+
+        return self._backend.read_into(self._path, view, offset)
+
     @smartasync
     def write_text(
         self, text: str, encoding: str = "utf-8", skip_if_unchanged: bool = False
@@ -1058,21 +1456,24 @@ class StorageNode:
         return self._write_text(text, encoding, skip_if_unchanged)
 
     @smartasync
-    def write_bytes(self, data: bytes, skip_if_unchanged: bool = False) -> bool:
+    def write_bytes(
+        self, data: bytes | bytearray | memoryview, skip_if_unchanged: bool = False
+    ) -> bool:
         """Write binary content to file.
 
         Convenience method equivalent to write(data, mode='wb', skip_if_unchanged=skip_if_unchanged).
         Compatible with pathlib.Path API.
 
         Args:
-            data: Binary content to write
+            data: Binary content to write. A bytearray or memoryview (e.g. a
+                slice of a larger buffer) is handed to the backend as is,
+                without first copying it into a bytes object.
             skip_if_unchanged: Skip write if content identical (default: False)
 
         Returns:
             bool: True if file was written, False if skipped
 
         Raises:
-            TypeError: If data is not bytes
             ValueError: If node is a versioned snapshot (read-only)
 
         Examples:
@@ -1084,6 +1485,49 @@ class StorageNode:
         """
         return self._write_bytes(data, skip_if_unchanged)
 
+    @smartasync
+    def write_from(self, src: BinaryIO) -> None:
+        """Write file content from a binary file object.
+
+        Unlike ``write_bytes()``, the payload is never held in memory as a
+        whole: local storage copies regular files in the kernel
+        (``os.sendfile``), other backends stream it in chunks (multipart
+        upload on S3).
+
+        Args:
+            src: Binary file object to read from, starting at its current position
+
+        Raises:
+            ValueError: If node is virtual or a versioned snapshot (read-only)
+
+        Examples:
+            >>> with open('/tmp/export.zip', 'rb') as f:
+            ...     storage.node('s3:exports/export.zip').write_from(f)
+            >>>
+            >>> # Between nodes
+            >>> with src_node.open('rb') as f:
+            ...     dest_node.write_from(f)
+        """
+        self._write_from(src)
+
+    def _write_from(self, src: BinaryIO) -> None:
+        """Internal write_from implementation (not decorated with smartasync)."""
+        if self._is_virtual:
+            raise ValueError(
+                "Cannot write to virtual node (no path). " "Virtual nodes are read-only."
+            )
+        if self._version is not None:
+            raise ValueError(
+                "Cannot write to versioned snapshot. "
+                "Create a new node without version parameter to write."
+            )
+
+        self.invalidate()
+        result = self._backend.write_from(self._path, src)
+        # If backend returns a new path (e.g., base64), update it
+        if result is not None:
+            self._set_path(result)
+
     # ==================== File Operations ====================
 
     @smartasync
@@ -1096,12 +1540,13 @@ class StorageNode:
             >>> # Async context
             >>> await node.delete()
         """
+        self.invalidate()
         self._backend.delete(self._path, recursive=True)
 
     def _should_skip_file(
         self,
         dest: StorageNode,
-        skip: SkipStrategy | str,
+        skip: SkipStrategy,
         skip_fn: Callable[[StorageNode, StorageNode], bool] | None,
     ) -> tuple[bool, str]:
         """Determine if file should be skipped during copy.
@@ -1114,39 +1559,44 @@ class StorageNode:
         Returns:
             Tuple of (should_skip: bool, reason: str)
         """
+        if skip is SkipStrategy.NEVER:
+            return (False, "")
+
         # Never skip if destination doesn't exist
         if not dest.exists():
             return (False, "")
 
         # Check skip strategy
-        if skip == "never" or skip == SkipStrategy.NEVER:
-            return (False, "")
-
-        elif skip == "exists" or skip == SkipStrategy.EXISTS:
+        if skip is SkipStrategy.EXISTS:
             return (True, "destination exists")
 
-        elif skip == "size" or skip == SkipStrategy.SIZE:
+        elif skip is SkipStrategy.SIZE:
             try:
-                if self.size() == dest.size():
-                    return (True, f"same size ({self.size()} bytes)")
+                size = self.size()
+                if size == dest.size():
+                    return (True, f"same size ({size} bytes)")
                 else:
                     return (False, "")
             except Exception:
                 # If size comparison fails, don't skip
                 return (False, "")
 
-        elif skip == "hash" or skip == SkipStrategy.HASH:
+        elif skip is SkipStrategy.HASH:
             try:
+                # Different sizes can't be the same content: no hashing needed
+                if self.size() != dest.size():
+                    return (False, "")
                 # Use MD5 hash comparison (with cloud metadata optimization)
-                if self.md5hash() == dest.md5hash():
-                    return (True, f"same content (MD5: {self.md5hash()[:8]}...)")
+                digest = self.md5hash()
+                if digest == dest.md5hash():
+                    return (True, f"same content (MD5: {digest[:8]}...)")
                 else:
                     return (False, "")
             except Exception:
                 # If hash comparison fails, don't skip
                 return (False, "")
 
-        elif skip == "custom" or skip == SkipStrategy.CUSTOM:
+        elif skip is SkipStrategy.CUSTOM:
             try:
                 if skip_fn and skip_fn(self, dest):
                     return (True, "custom function returned True")
@@ -1161,7 +1611,7 @@ class StorageNode:
     def _copy_file_with_skip(
         self,
         dest: StorageNode,
-        skip: SkipStrategy | str,
+        skip: SkipStrategy,
         skip_fn: Callable[[StorageNode, StorageNode], bool] | None,
         on_file: Callable[[StorageNode], None] | None,
         on_skip: Callable[[StorageNode, str], None] | None,
@@ -1187,12 +1637,12 @@ class StorageNode:
             return dest
 
         # Perform actual copy
+        dest.invalidate()
         new_path = self._backend.copy(self._path, dest._backend, dest._path)
 
         # Update destination path if backend returned new path
         if new_path is not None:
-            dest._path = new_path
-            dest._posix_path = PurePosixPath(new_path) if new_path else PurePosixPath(".")
+            dest._set_path(new_path)
 
         # Call on_file callback
         if on_file:
@@ -1203,7 +1653,7 @@ class StorageNode:
     def _copy_dir_with_skip(
         self,
         dest: StorageNode,
-        skip: SkipStrategy | str,
+        skip: SkipStrategy,
         skip_fn: Callable[[StorageNode, StorageNode], bool] | None,
         progress: Callable[[int, int], None] | None,
         on_file: Callable[[StorageNode], None] | None,
@@ -1211,9 +1661,16 @@ class StorageNode:
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
         filter_fn: Callable[[StorageNode, str], bool] | None = None,
+        max_concurrency: int = 1,
     ) -> StorageNode:
         """Copy directory recursively with filtering, skip logic and progress tracking.
 
+        Files are copied by up to ``max_concurrency`` worker threads; the
+        callbacks always run in the calling thread, in completion order.
+        Files are streamed from the tree walk to the copy loop, so memory
+        stays bounded on large trees; only with a ``progress`` callback are
+        they gathered first, to know the total.
+
         Args:
             dest: Destination node
             skip: Skip strategy
@@ -1224,25 +1681,21 @@ class StorageNode:
             include_patterns: Glob patterns for files to include
             exclude_patterns: Glob patterns for files to exclude
             filter_fn: Custom filter function(node, relpath) -> bool
+            max_concurrency: Maximum number of file copies in flight
 
         Returns:
             Destination node
         """
         # Create destination directory if needed
-        if not dest.exists:
+        if not dest.exists():
             dest.mkdir(parents=True, exist_ok=True)
 
-        # Collect all files to process (with filtering)
-        files_to_process = []
-
         def matches_filters(node: StorageNode, relpath: str) -> tuple[bool, str]:
             """Check if file matches include/exclude/filter criteria.
 
             Returns:
                 tuple[bool, str]: (should_include, reason_if_excluded)
             """
-            from fnmatch import fnmatch
-
             # If include patterns specified, file must match at least one (whitelist mode)
             if include_patterns:
                 matched = False
@@ -1270,55 +1723,119 @@ class StorageNode:
 
             return True, ""
 
-        def collect_files(src_node: StorageNode, dest_node: StorageNode, relpath: str = ""):
-            """Recursively collect all files that match filters."""
+        # Skip checks need destination metadata: take it from one listing
+        # per destination directory instead of a stat per file
+        prime_dest = skip is not SkipStrategy.NEVER
+
+        def dest_entries(dest_dir: StorageNode) -> Callable[[], dict]:
+            """Return a function listing dest_dir once, on its first call.
+
+            Only directories holding files that pass the filters get listed,
+            and only one listing is held per level of the walk.
+            """
+            entries = None
+
+            def get() -> dict:
+                nonlocal entries
+                if entries is None:
+                    try:
+                        entries = dict(dest_dir._backend.iter_dir_stat(dest_dir._path))
+                    except (FileNotFoundError, ValueError):
+                        entries = {}
+                return entries
+
+            return get
+
+        def iter_files(
+            src_node: StorageNode,
+            dest_node: StorageNode,
+            relpath: str = "",
+            dest_listing: Callable[[], dict] | None = None,
+        ):
+            """Recursively yield (src, dest, relpath) for files that match filters."""
             if src_node.is_file():
                 # Apply filtering
                 should_include, reason = matches_filters(src_node, relpath)
                 if should_include:
-                    files_to_process.append((src_node, dest_node, relpath))
+                    if dest_listing is not None:
+                        # The listing is complete: a name it lacks is missing
+                        stat = dest_listing().get(dest_node.basename, _MISSING)
+                        if stat is not None:
+                            dest_node._prime_stat(stat)
+                    yield src_node, dest_node, relpath
                 elif on_skip:
                     # Notify about filtered files
                     on_skip(src_node, reason)
 
             elif src_node.is_dir():
-                # Ensure destination dir exists
-                if not dest_node.exists():
-                    dest_node.mkdir(parents=True, exist_ok=True)
-
-                # Recurse into children
-                for child in src_node.children():
-                    child_relpath = f"{relpath}/{child.basename}" if relpath else child.basename
-                    collect_files(child, dest_node.child(child.basename), child_relpath)
-
-        collect_files(self, dest)
-
-        # Process files with progress tracking
-        total = len(files_to_process)
-
-        for idx, (src, dst, relpath) in enumerate(files_to_process, 1):
+                # Ensure destination dir exists (a no-op when it does, no probe)
+                dest_node.mkdir(parents=True, exist_ok=True)
+                listing = dest_entries(dest_node) if prime_dest else None
+
+                # Recurse into children: the listing primes each child's type,
+                # so the is_file()/is_dir() checks above cost no backend call
+                for child in src_node.iter_children():
+                    name = child.basename
+                    child_relpath = f"{relpath}/{name}" if relpath else name
+                    yield from iter_files(
+                        child, dest_node._listed_child(name), child_relpath, listing
+                    )
+
+        files = iter_files(self, dest)
+
+        def copy_one(src: StorageNode, dst: StorageNode) -> tuple[bool, str]:
+            """Copy one file unless skipped; return (skipped, reason)."""
             # Check skip condition (skip logic is destination-based)
             should_skip, reason = src._should_skip_file(dst, skip, skip_fn)
-
             if should_skip:
-                if on_skip:
-                    on_skip(src, reason)
-            else:
-                # Copy file
-                new_path = src._backend.copy(src._path, dst._backend, dst._path)
+                return True, reason
 
-                # Update destination path if backend returned new path
-                if new_path is not None:
-                    dst._path = new_path
-                    dst._posix_path = PurePosixPath(new_path) if new_path else PurePosixPath(".")
+            dst.invalidate()
+            new_path = src._backend.copy(src._path, dst._backend, dst._path)
+
+            # Update destination path if backend returned new path
+            if new_path is not None:
+                dst._set_path(new_path)
+            return False, ""
 
-                if on_file:
-                    on_file(src)
+        def report(idx: int, src: StorageNode, skipped: bool, reason: str) -> None:
+            if skipped:
+                if on_skip:
+                    on_skip(src, reason)
+            elif on_file:
+                on_file(src)
 
             # Progress callback
             if progress:
                 progress(idx, total)
 
+        # Progress reports need the total up front
+        total = None
+        if progress:
+            files = list(files)
+            total = len(files)
+
+        if max_concurrency <= 1:
+            for idx, (src, dst, _) in enumerate(files, 1):
+                report(idx, src, *copy_one(src, dst))
+            return dest
+
+        # Overlap the per-file round trips of remote backends, keeping a
+        # bounded number of copies queued while the walk goes on
+        idx = 0
+        pending = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for src, dst, _ in files:
+                if len(pending) >= 2 * max_concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        idx += 1
+                        report(idx, pending.pop(future), *future.result())
+                pending[executor.submit(copy_one, src, dst)] = src
+            for future in as_completed(pending):
+                idx += 1
+                report(idx, pending[future], *future.result())
+
         return dest
 
     @smartasync
@@ -1336,6 +1853,7 @@ class StorageNode:
         progress: Callable[[int, int], None] | None = None,
         on_file: Callable[[StorageNode], None] | None = None,
         on_skip: Callable[[StorageNode, str], None] | None = None,
+        max_concurrency: Annotated[int, "Maximum parallel file copies for directories"] = 1,
     ) -> StorageNode:
         """Copy file or directory to destination with filtering and skip logic.
 
@@ -1368,6 +1886,11 @@ class StorageNode:
             progress: Callback(current, total) called after each file
             on_file: Callback(src_node) called after each file copied
             on_skip: Callback(src_node, reason) called when file is skipped
+            max_concurrency: Maximum number of files copied at once when
+                copying a directory (default 1: one after another, in tree
+                order). Above 1, progress, on_file and on_skip still run in
+                the calling thread but in completion order, and skip_fn runs
+                in worker threads, so it must be thread-safe.
 
         Returns:
             Destination StorageNode
@@ -1421,6 +1944,12 @@ class StorageNode:
             For cloud storage, 'hash' is efficient due to ETag metadata.
             For local storage, 'size' is usually sufficient.
 
+            With ``max_concurrency`` above 1, directory copies run that many
+            file copies in parallel (worth it on remote storage, where each
+            file is a round trip), except when the backend copies the whole
+            tree in one native call (same S3/GCS/Azure filesystem on both
+            sides).
+
         Note:
             - Include/exclude patterns match against relative paths from source
             - If copying to base64 backend, destination path will be updated
@@ -1430,6 +1959,8 @@ class StorageNode:
         # Convert string to StorageNode if needed
         if isinstance(dest, str):
             dest = self._manager.node(dest)
+        # Destination metadata is about to change
+        dest.invalidate()
 
         # Virtual node: copy materialized content
         if self._is_virtual:
@@ -1438,73 +1969,119 @@ class StorageNode:
             dest._write_bytes(content)
             return dest
 
-        if not self.exists():
-            raise FileNotFoundError(f"Source not found: {self.fullpath}")
-
-        # Validate skip strategy
-        if skip == "custom" and skip_fn is None:
-            raise ValueError("skip='custom' requires skip_fn parameter")
-
-        # Normalize include/exclude patterns to lists
-        include_patterns = []
-        if include is not None:
-            include_patterns = [include] if isinstance(include, str) else list(include)
-
-        exclude_patterns = []
-        if exclude is not None:
-            exclude_patterns = [exclude] if isinstance(exclude, str) else list(exclude)
-
-        # Check if we need enhanced copy (with skip/filter/callbacks)
-        has_filters = bool(include_patterns or exclude_patterns or filter)
-        needs_enhanced = skip != "never" or progress or on_file or on_skip or has_filters
+        # Metadata queries below (roots, listed files, skip checks) share
+        # one backend lookup per path
+        with self._manager.batch():
+            if not self.exists():
+                raise FileNotFoundError(f"Source not found: {self.fullpath}")
 
-        if needs_enhanced:
-            # Single file copy
-            if self.is_file():
-                # For single files, filters don't apply (no relative path context)
-                return self._copy_file_with_skip(dest, skip, skip_fn, on_file, on_skip)
+            # Validate skip strategy, resolving it once: the per-file checks
+            # then compare enum members by identity
+            try:
+                skip = SkipStrategy(skip)
+            except ValueError:
+                raise ValueError(f"Invalid skip strategy: {skip!r}") from None
+            if skip is SkipStrategy.CUSTOM and skip_fn is None:
+                raise ValueError("skip='custom' requires skip_fn parameter")
+
+            # Normalize include/exclude patterns to lists
+            include_patterns = []
+            if include is not None:
+                include_patterns = [include] if isinstance(include, str) else list(include)
+
+            exclude_patterns = []
+            if exclude is not None:
+                exclude_patterns = [exclude] if isinstance(exclude, str) else list(exclude)
+
+            # Check if we need enhanced copy (with skip/filter/callbacks)
+            has_filters = bool(include_patterns or exclude_patterns or filter)
+            needs_enhanced = (
+                skip is not SkipStrategy.NEVER or progress or on_file or on_skip or has_filters
+            )
 
-            # Directory copy (recursive with filtering)
-            elif self.is_dir():
+            if needs_enhanced:
+                # Single file copy
+                if self.is_file():
+                    # For single files, filters don't apply (no relative path context)
+                    return self._copy_file_with_skip(dest, skip, skip_fn, on_file, on_skip)
+
+                # Directory copy (recursive with filtering)
+                elif self.is_dir():
+                    return self._copy_dir_with_skip(
+                        dest,
+                        skip,
+                        skip_fn,
+                        progress,
+                        on_file,
+                        on_skip,
+                        include_patterns,
+                        exclude_patterns,
+                        filter,
+                        max_concurrency,
+                    )
+
+            # Directory the backend would copy file by file: do it concurrently
+            elif (
+                max_concurrency > 1
+                and self.is_dir()
+                and not self._backend.copies_tree_natively(dest._backend)
+            ):
                 return self._copy_dir_with_skip(
                     dest,
-                    skip,
-                    skip_fn,
-                    progress,
-                    on_file,
-                    on_skip,
-                    include_patterns,
-                    exclude_patterns,
-                    filter,
+                    SkipStrategy.NEVER,
+                    None,
+                    None,
+                    None,
+                    None,
+                    max_concurrency=max_concurrency,
                 )
 
-        # Simple copy without skip logic (backward compatible)
-        else:
-            # Copy via backends
-            new_path = self._backend.copy(self._path, dest._backend, dest._path)
+            # Simple copy without skip logic (backward compatible)
+            else:
+                # Copy via backends
+                new_path = self._backend.copy(self._path, dest._backend, dest._path)
 
-            # If destination backend returned a new path, update dest
-            if new_path is not None:
-                dest._path = new_path
-                dest._posix_path = PurePosixPath(new_path) if new_path else PurePosixPath(".")
+                # If destination backend returned a new path, update dest
+                if new_path is not None:
+                    dest._set_path(new_path)
 
-        return dest
+            return dest
 
     def move_to(self, dest: StorageNode | str) -> StorageNode:
-        """Move file/directory to destination."""
+        """Move file/directory to destination.
+
+        Within one filesystem this is a rename (``os.replace`` locally,
+        server-side copy + delete on object stores); across backends the
+        data is copied, then the source deleted.
+
+        Examples:
+            >>> node.move_to('archive:2024/report.pdf')
+            >>>
+            >>> # The node now points at the new location
+            >>> node.fullpath
+            'archive:2024/report.pdf'
+        """
         # Convert string to StorageNode if needed
         if isinstance(dest, str):
             dest = self._manager.node(dest)
 
-        # Copy then delete
-        self.copy_to(dest)
-        self.delete()
+        if self._is_virtual:
+            raise ValueError("Cannot move virtual node (no path). Use copy_to() instead.")
+        if not self.exists():
+            raise FileNotFoundError(f"Source not found: {self.fullpath}")
+
+        self.invalidate()
+        dest.invalidate()
+        new_path = self._backend.move(self._path, dest._backend, dest._path)
+        if new_path is not None:
+            dest._set_path(new_path)
 
         # Update self to point to new location
         self._mount_name = dest._mount_name
-        self._path = dest._path
-        self._posix_path = dest._posix_path
+        self._set_path(dest._path)
         self._backend = dest._backend
+        self._stat_cache = dest._stat_cache
+        self._stat_expiry = dest._stat_expiry
 
         return self
 
@@ -1660,21 +2237,103 @@ class StorageNode:
             the public API. It should only be overridden by subclasses that
             need custom node creation logic.
         """
+        if self.__class__ is StorageNode and manager._node_cache is not None:
+            return manager._intern(mount_name, path)
         return self.__class__(manager, mount_name, path)
 
     @smartasync
-    def children(self) -> Annotated[list["StorageNode"], "List of child nodes in this directory"]:
+    def children(
+        self,
+        with_metadata: Annotated[bool, "Prime child metadata from the listing"] = True,
+    ) -> Annotated[list["StorageNode"], "List of child nodes in this directory"]:
         """List child nodes (if directory).
 
+        When the backend's listing already carries size and modification time
+        (local scandir, S3/GCS/Azure list calls), each child's metadata cache
+        is filled from it, so ``child.size()``/``child.mtime()`` need no
+        further backend request.
+
+        Args:
+            with_metadata: If False, only names are listed and child
+                metadata is fetched lazily on first access
+
         Examples:
             >>> for child in node.children():
-            ...     print(child.basename)
+            ...     print(child.basename, child.size())
             >>>
             >>> # Async context
             >>> children = await node.children()
         """
-        names = self._backend.list_dir(self._path)
-        return [self.child(name) for name in names]
+        if not with_metadata:
+            names = self._backend.list_dir(self._path)
+            return [self._listed_child(name) for name in names]
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator["StorageNode"]:
+        """Iterate over child nodes as the backend lists them.
+
+        Like ``children()``, with metadata primed from the listing, but
+        nodes are built one at a time: a loop that stops early never
+        creates the rest, and on local storage entries are read from the
+        directory as the loop advances instead of all up front.
+
+        Yields:
+            StorageNode: One node per directory entry
+
+        Raises:
+            FileNotFoundError: If this directory doesn't exist
+
+        Examples:
+            >>> for child in storage.node('home:inbox').iter_children():
+            ...     if child.suffix == '.eml':
+            ...         first_mail = child
+            ...         break
+        """
+        for name, stat in self._backend.iter_dir_stat(self._path):
+            node = self._listed_child(name)
+            node._prime_stat(stat)
+            node._parent = self
+            yield node
+
+    def walk(
+        self,
+        recursive: Annotated[bool, "Include files in subdirectories"] = True,
+    ) -> Iterator["StorageNode"]:
+        """Iterate over the files in this directory, with metadata preloaded.
+
+        With ``recursive=True`` every file below this node is yielded,
+        at any depth. Object stores produce it from one paginated prefix
+        listing instead of one listing per directory. Each node's metadata
+        cache is filled from the listing, so ``size()``/``mtime()`` need no
+        further backend requests. Order is not guaranteed.
+
+        Args:
+            recursive: If False, only files directly in this directory
+
+        Yields:
+            StorageNode: One node per file (directories are not yielded)
+
+        Raises:
+            FileNotFoundError: If this directory doesn't exist
+
+        Examples:
+            >>> total = sum(f.size() for f in storage.node('s3:logs').walk())
+            >>>
+            >>> for f in node.walk(recursive=False):
+            ...     print(f.basename)
+        """
+        if not recursive:
+            for node in self.children():
+                if node.is_file():
+                    yield node
+            return
+
+        base = self._path
+        for rel, stat in self._backend.walk_files(base):
+            path = f"{base}/{rel}" if base else rel
+            node = self._create_node(self._manager, self._mount_name, path)
+            node._prime_stat(stat)
+            yield node
 
     def child(
         self, *parts: Annotated[str, "Path components to append"]
@@ -1702,10 +2361,32 @@ class StorageNode:
         """
         # Join all parts into a single path
         child_path = "/".join(parts)
-        # Combine with current path
-        full_child_path = str(self._posix_path / child_path)
+        base = self._path
+        if (
+            parts
+            and not (base and base[-1] == "/")
+            and all(part and part != "." and "/" not in part for part in parts)
+        ):
+            # Plain names: a string join gives what pathlib would
+            full_child_path = f"{base}/{child_path}" if base else child_path
+        else:
+            # Nested, empty or "." segments: let pathlib normalize them
+            full_child_path = str(self._posix_path / child_path)
         return self._create_node(self._manager, self._mount_name, full_child_path)
 
+    def _listed_child(self, name: str) -> StorageNode:
+        """Child node for an entry name returned by a directory listing.
+
+        Listing names are plain, so the path is joined directly, skipping
+        the argument handling of ``child()``; anything unusual goes
+        through ``child()``.
+        """
+        base = self._path
+        if name and name != "." and "/" not in name and not (base and base[-1] == "/"):
+            path = f"{base}/{name}" if base else name
+            return self._create_node(self._manager, self._mount_name, path)
+        return self.child(name)
+
     @smartasync
     def mkdir(
         self,
@@ -1720,6 +2401,7 @@ class StorageNode:
             >>> # Async context
             >>> await node.mkdir(parents=True)
         """
+        self.invalidate()
         self._backend.mkdir(self._path, parents=parents, exist_ok=exist_ok)
 
     # ==================== Advanced Methods ====================
@@ -1759,9 +2441,13 @@ class StorageNode:
         Notes:
             - For local storage, returns the actual path (no copy)
             - For remote storage, uses temporary files
+            - On Linux, small files opened with mode='r' are kept in memory
+              (memfd) and the path is a symlink to them
             - Temporary files are automatically cleaned up on exit
             - Large files are streamed in chunks to avoid memory issues
         """
+        if mode != "r":
+            self.invalidate()
         return self._backend.local_path(self._path, mode=mode)
 
     def call(
@@ -1938,24 +2624,25 @@ class StorageNode:
             - Uses local_path() for efficient cloud storage serving
             - Streams large files in chunks (doesn't load entire file in memory)
         """
-        if not self.exists():
+        stat = self._stat()
+        if not stat.exists:
             start_response("404 Not Found", [("Content-Type", "text/plain")])
             return [b"Not Found"]
 
+        # ETag (mtime-size), from the same metadata lookup
+        mtime = stat.mtime
+        size = stat.size
+        etag = f"{mtime}-{size}"
+
         # Check ETag for 304 Not Modified
         if_none_match = environ.get("HTTP_IF_NONE_MATCH")
         if if_none_match:
             # Remove quotes from ETag
             if_none_match = if_none_match.replace('"', "")
 
-            # Compute our ETag (mtime-size)
-            mtime = self.mtime()
-            size = self.size()
-            our_etag = f"{mtime}-{size}"
-
-            if our_etag == if_none_match:
+            if etag == if_none_match:
                 # Client has current version, return 304
-                headers = [("ETag", f'"{our_etag}"')]
+                headers = [("ETag", f'"{etag}"')]
                 start_response("304 Not Modified", headers)
                 return [b""]
 
@@ -1963,9 +2650,6 @@ class StorageNode:
         headers = []
 
         # ETag for caching
-        mtime = self.mtime()
-        size = self.size()
-        etag = f"{mtime}-{size}"
         headers.append(("ETag", f'"{etag}"'))
 
         # Content-Type
@@ -2051,6 +2735,8 @@ class StorageNode:
             - This typically replaces all existing metadata
             - Cloud providers may have size/format restrictions
         """
+        # Object stores rewrite the object, changing its ETag and mtime
+        self.invalidate()
         return self._backend.set_metadata(self._path, metadata)
 
     def url(self, expires_in: int = 3600, **kwargs) -> str | None:
@@ -2173,8 +2859,6 @@ class StorageNode:
         Returns:
             version_id or None if no version found before date
         """
-        from datetime import timezone
-
         versions = self.versions
 
         # Normalize target_date to UTC if naive
@@ -2324,7 +3008,10 @@ class StorageNode:
 
         Notes:
             - Uses urllib for HTTP requests (no external dependencies)
-            - Overwrites existing file if present
+            - The response is streamed to storage in chunks, so memory use
+              does not grow with the file size
+            - Overwrites existing file if present; if the download fails
+              midway the partial file is removed
             - Parent directory must exist or backend must support auto-creation
         """
         import urllib.request
@@ -2334,17 +3021,29 @@ class StorageNode:
         if not url or not url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid URL: {url}. Must start with http:// or https://")
 
-        # Download content
+        # Connect
         try:
-            with urllib.request.urlopen(url, timeout=timeout) as response:
-                data = response.read()
+            response = urllib.request.urlopen(url, timeout=timeout)
         except urllib.error.URLError as e:
             raise IOError(f"Failed to download from {url}: {e}") from e
         except Exception as e:
             raise IOError(f"Error downloading from {url}: {e}") from e
 
-        # Write to storage
-        self._write_bytes(data)
+        # Stream the body into storage as it arrives
+        try:
+            with response:
+                self._write_from(response)
+        except (PermissionError, ValueError):
+            # Read-only storage or unwritable node: nothing was written
+            raise
+        except Exception as e:
+            # Don't leave a truncated file behind
+            try:
+                self._backend.delete(self._path)
+            except Exception:
+                pass
+            self.invalidate()
+            raise IOError(f"Error downloading from {url}: {e}") from e
 
     def to_base64(self, mime: str | None = None, include_uri: bool = True) -> str:
         """Encode file content as base64 string.
@@ -2383,33 +3082,41 @@ class StorageNode:
             - MIME type auto-detection based on file extension
             - Large files will result in very long strings
         """
-        import base64
-        import mimetypes
-
         # Check exists and is file
-        if not self.exists():
+        stat = self._stat()
+        if not stat.exists:
             raise FileNotFoundError(f"File not found: {self.fullpath}")
 
-        if not self.is_file():
+        if not stat.is_file:
             raise ValueError(f"Cannot encode directory as base64: {self.fullpath}")
 
-        # Read file content
-        data = self._read_bytes()
-
-        # Encode to base64
-        b64_data = base64.b64encode(data).decode("ascii")
-
-        # Return based on format
+        # Build the result in one buffer: data URI prefix, then the encoded
+        # content, so only a single str copy is made at the end
+        out = bytearray()
         if include_uri:
             # Auto-detect MIME type if not provided
             if mime is None:
                 mime, _ = mimetypes.guess_type(self.basename)
                 if mime is None:
                     mime = "application/octet-stream"
+            out += f"data:{mime};base64,".encode("utf-8")
 
-            return f"data:{mime};base64,{b64_data}"
-        else:
-            return b64_data
+        # Encode while reading, in blocks cut at multiples of 3 bytes so the
+        # encoded pieces join without padding; the raw file is never held whole
+        pending = b""
+        with self.open("rb") as f:
+            while True:
+                chunk = f.read(_BASE64_READ_SIZE)
+                if not chunk:
+                    break
+                if pending:
+                    chunk = pending + chunk
+                cut = len(chunk) - len(chunk) % 3
+                out += base64.b64encode(chunk[:cut])
+                pending = chunk[cut:]
+        out += base64.b64encode(pending)
+
+        return out.decode("utf-8")
 
     # ==================== Special Methods ====================
 
@@ -2422,59 +3129,62 @@ class StorageNode:
         return self.fullpath
 
     def __eq__(self, other: object) -> bool:
-        """Compare nodes by content (MD5 hash).
+        """Compare nodes by location.
 
-        Two nodes are considered equal if they have the same file content,
-        regardless of their path or location. Comparison is done via MD5 hash.
+        Two nodes are equal when they point at the same path of the same
+        mount (and the same version, for versioned snapshots). No I/O is
+        done; use ``same_content()`` to compare what the files contain.
 
         Args:
             other: Another StorageNode or object to compare
 
         Returns:
-            bool: True if both nodes have identical content
+            bool: True if both nodes address the same file or directory
 
         Examples:
-            >>> file1 = storage.node('home:original.txt')
-            >>> file2 = storage.node('backup:copy.txt')
-            >>> if file1 == file2:
-            ...     print("Files have identical content")
+            >>> storage.node('home:docs/a.txt') == storage.node('home:docs/a.txt')
+            True
+            >>> # Nodes work in sets and as dict keys
+            >>> unique = set(node.children() + other.children())
 
         Notes:
-            - Only files can be compared (directories return False)
-            - Non-existent files return False
+            - Virtual nodes are only equal to themselves
             - Comparing with non-StorageNode returns NotImplemented
+            - Don't repoint a node (``move_to()``) while it is in a set or
+              used as a dict key: its hash follows its location
         """
         if not isinstance(other, StorageNode):
             return NotImplemented
-
-        # If same path, they're equal
-        if self.fullpath == other.fullpath:
+        if self is other:
             return True
-
-        # Both must be files to compare content
-        if not (self.is_file() and other.is_file()):
-            return False
-
-        # Compare via MD5 hash
-        try:
-            return self.md5hash() == other.md5hash()
-        except (FileNotFoundError, ValueError):
+        if self._is_virtual or other._is_virtual:
             return False
+        return (
+            self._path == other._path
+            and self._mount_name == other._mount_name
+            and self._version == other._version
+        )
 
     def __ne__(self, other: object) -> bool:
-        """Compare nodes for inequality.
+        """Compare nodes for inequality (by location, see ``__eq__``).
 
         Args:
             other: Another StorageNode or object to compare
 
         Returns:
-            bool: True if nodes have different content
+            bool: True if nodes address different locations
 
         Examples:
-            >>> if file1 != file2:
-            ...     print("Files differ")
+            >>> if src != dest:
+            ...     src.copy_to(dest)
         """
         result = self.__eq__(other)
         if result is NotImplemented:
             return NotImplemented
         return not result
+
+    def __hash__(self) -> int:
+        """Hash by location, consistent with ``__eq__``."""
+        if self._is_virtual:
+            return object.__hash__(self)
+        return hash((self._mount_name, self._path, self._version))
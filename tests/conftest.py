@@ -108,6 +108,29 @@ def temp_dir():
     shutil.rmtree(tmpdir)
 
 
+@pytest.fixture
+def call_spy(monkeypatch):
+    """Record calls to a method while still running it.
+
+    ``calls = call_spy(backend, "stat")`` wraps ``backend.stat`` for the rest
+    of the test; ``calls`` collects the first argument of every call (the
+    path, for backend methods).
+    """
+
+    def install(obj, name):
+        calls = []
+        original = getattr(obj, name)
+
+        def wrapper(*args, **kwargs):
+            calls.append(args[0] if args else None)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(obj, name, wrapper)
+        return calls
+
+    return install
+
+
 @pytest.fixture(scope="session")
 def minio_config():
     """MinIO connection configuration.
@@ -4,8 +4,9 @@ import pytest
 import tempfile
 import os
 import base64
+import io
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from genro_storage import StorageManager
 
 
@@ -46,6 +47,25 @@ class TestLocalPath:
         # Temp file should be cleaned up
         assert not os.path.exists(local_path)
 
+    @pytest.mark.skipif(not hasattr(os, "memfd_create"), reason="memfd is Linux only")
+    def test_local_path_read_uses_memfd(self):
+        """Small remote files are read through an in-memory file, not a temp file."""
+        import subprocess
+
+        storage = StorageManager()
+        storage.configure([{"name": "mem", "protocol": "memory"}])
+
+        node = storage.node("mem:clips/intro.txt")
+        node.write("Original")
+
+        with node.local_path(mode="r") as local_path:
+            assert os.path.basename(local_path) == "intro.txt"
+            assert os.readlink(local_path).startswith("/proc/")
+            result = subprocess.run(["cat", local_path], capture_output=True, text=True)
+            assert result.stdout == "Original"
+
+        assert not os.path.exists(local_path)
+
     def test_local_path_memory_read_write_mode(self):
         """Memory storage local_path with rw mode downloads and uploads."""
         storage = StorageManager()
@@ -394,12 +414,8 @@ class TestFillFromURL:
         temp_dir = tempfile.mkdtemp()
         storage.configure([{"name": "local", "protocol": "local", "path": temp_dir}])
 
-        # Mock HTTP response
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"Downloaded content"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
-        mock_urlopen.return_value = mock_response
+        # Mock HTTP response (a readable, closable stream)
+        mock_urlopen.return_value = io.BytesIO(b"Downloaded content")
 
         node = storage.node("local:downloaded.txt")
         node.fill_from_url("https://example.com/file.txt")
@@ -415,11 +431,8 @@ class TestFillFromURL:
         temp_dir = tempfile.mkdtemp()
         storage.configure([{"name": "local", "protocol": "local", "path": temp_dir}])
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"data"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
-        mock_urlopen.return_value = mock_response
+        # Mock HTTP response (a readable, closable stream)
+        mock_urlopen.return_value = io.BytesIO(b"data")
 
         node = storage.node("local:file.txt")
         node.fill_from_url("https://example.com/file.txt", timeout=60)
@@ -458,6 +471,32 @@ class TestFillFromURL:
         with pytest.raises(IOError, match="Failed to download"):
             node.fill_from_url("https://example.com/file.txt")
 
+    @patch("urllib.request.urlopen")
+    def test_fill_from_url_removes_partial_file(self, mock_urlopen):
+        """fill_from_url() wraps mid-stream failures and removes the partial file."""
+        import http.client
+
+        storage = StorageManager()
+        temp_dir = tempfile.mkdtemp()
+        storage.configure([{"name": "local", "protocol": "local", "path": temp_dir}])
+
+        class BrokenResponse(io.BytesIO):
+            """Response whose connection drops after the first chunk."""
+
+            def read(self, size=-1):
+                if self.tell():
+                    raise http.client.IncompleteRead(b"", 100)
+                return super().read(4)
+
+        mock_urlopen.return_value = BrokenResponse(b"partial content")
+
+        node = storage.node("local:file.txt")
+        node.write("previous")
+
+        with pytest.raises(IOError, match="Error downloading"):
+            node.fill_from_url("https://example.com/file.txt")
+        assert not node.exists()
+
 
 class TestS3Versioning:
     """Tests for S3 versioning support."""
@@ -238,6 +238,30 @@ class TestWriteBytesMethod:
         with pytest.raises(TypeError):
             node.write_bytes("string not allowed")  # type: ignore
 
+    def test_write_bytes_accepts_buffers(self, storage):
+        """Test write_bytes() and write(mode='wb') take bytearray and memoryview."""
+        storage.configure([{"name": "mem", "protocol": "memory"}])
+        payload = bytearray(b"header|body|footer")
+
+        for mount in ("test", "mem"):
+            node = storage.node(f"{mount}:buffer.bin")
+            node.write_bytes(memoryview(payload)[7:11])
+            assert node.read_bytes() == b"body"
+
+            node.write(payload, mode="wb")
+            assert node.read_bytes() == bytes(payload)
+
+    def test_write_bytes_skip_if_unchanged_checks_size_first(self, storage, monkeypatch):
+        """Test skip_if_unchanged doesn't read the file when sizes differ."""
+        node = storage.node("test:sized.bin")
+        node.write_bytes(b"12345")
+
+        def no_read():
+            raise AssertionError("file should not be read")
+
+        monkeypatch.setattr(type(node), "_read_bytes", lambda self: no_read())
+        assert node.write_bytes(b"123456", skip_if_unchanged=True) is True
+
 
 class TestConvenienceMethodsEquivalence:
     """Test that convenience methods are equivalent to unified API."""
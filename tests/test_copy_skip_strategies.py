@@ -128,6 +128,19 @@ class TestCopySkipStrategies:
         src.copy_to(dest, skip="hash")
         assert dest.read() == "new content"
 
+    def test_copy_skip_hash_compares_sizes_first(self, storage, call_spy):
+        """skip='hash' copies files of different size without hashing them."""
+        src = storage.node("src:file.txt")
+        src.write("new content")
+        storage.node("dest:file.txt").write("old")
+
+        hashed = call_spy(type(src), "_compute_md5")
+
+        dest = storage.node("dest:file.txt")
+        src.copy_to(dest, skip="hash")
+        assert dest.read() == "new content"
+        assert hashed == []
+
     def test_copy_skip_custom(self, storage):
         """skip='custom' uses custom skip function."""
         # Create files with different mtimes
@@ -349,6 +362,51 @@ class TestCopySkipStrategies:
         assert dest.read() == "content"
         assert result is dest
 
+    def test_directory_copy_runs_files_concurrently(self, storage):
+        """Directory copies opt into worker threads, callbacks stay in the caller."""
+        import threading
+
+        for i in range(20):
+            storage.node(f"src:dir/sub{i % 3}/file{i}.txt").write(f"content{i}")
+
+        threads = set()
+        backend = storage._mounts["src"]
+        original_copy = backend.copy
+
+        def tracking_copy(*args):
+            threads.add(threading.get_ident())
+            return original_copy(*args)
+
+        backend.copy = tracking_copy
+
+        progress_calls = []
+        callback_threads = set()
+
+        def progress(current, total):
+            progress_calls.append((current, total))
+            callback_threads.add(threading.get_ident())
+
+        storage.node("src:dir").copy_to(
+            storage.node("dest:dir"), progress=progress, max_concurrency=4
+        )
+
+        assert progress_calls == [(i, 20) for i in range(1, 21)]
+        assert callback_threads == {threading.get_ident()}
+        assert threading.get_ident() not in threads
+        for i in range(20):
+            assert storage.node(f"dest:dir/sub{i % 3}/file{i}.txt").read() == f"content{i}"
+
+        # Plain directory copies take the concurrent path too
+        threads.clear()
+        storage.node("src:dir").copy_to(storage.node("dest:plain"), max_concurrency=4)
+        assert storage.node("dest:plain/sub1/file1.txt").read() == "content1"
+        assert threading.get_ident() not in threads
+
+        # By default files are copied one after another in the calling thread
+        threads.clear()
+        storage.node("src:dir").copy_to(storage.node("dest:serial"))
+        assert threads == {threading.get_ident()}
+
     def test_skip_strategy_enum_values(self):
         """SkipStrategy enum has correct values."""
         assert SkipStrategy.NEVER == "never"
@@ -422,3 +480,81 @@ class TestCopySkipEdgeCases:
         src.copy_to(dest, skip="hash")
 
         assert storage.node("dest:a/b/c/d/file.txt").read() == "deep"
+
+    def test_directory_copy_reads_metadata_from_listings(self, storage, call_spy):
+        """Source and destination metadata come from listings, not a stat per file."""
+        storage.node("src:tree/a.txt").write("a")
+        storage.node("src:tree/sub/b.txt").write("b")
+        storage.node("dest:tree/a.txt").write("x")
+
+        src_calls = call_spy(storage._mounts["src"], "stat")
+        dest_calls = call_spy(storage._mounts["dest"], "stat")
+
+        storage.node("src:tree").copy_to(storage.node("dest:tree"), skip="size")
+
+        # Only the two roots: destination files are checked from the listings
+        assert src_calls == ["tree"]
+        assert dest_calls == ["tree"]
+        assert storage.node("dest:tree/a.txt").read() == "x"
+        assert storage.node("dest:tree/sub/b.txt").read() == "b"
+
+    def test_directory_copy_lists_only_destinations_it_copies_to(self, storage, call_spy):
+        """Destination listings cover only directories with files to copy."""
+        storage.node("src:tree/one/a.txt").write("a")
+        storage.node("src:tree/two/b.txt").write("b")
+        storage.node("src:tree/two/c.txt").write("c")
+        # A directory where the source has a file counts as existing
+        storage.node("dest:tree/two/c.txt").mkdir(parents=True)
+
+        listed = call_spy(storage._mounts["dest"], "iter_dir_stat")
+
+        skipped = []
+        storage.node("src:tree").copy_to(
+            storage.node("dest:tree"),
+            include="two/*",
+            skip="exists",
+            on_skip=lambda node, reason: skipped.append((node.basename, reason)),
+        )
+
+        assert listed == ["tree/two"]
+        assert ("c.txt", "destination exists") in skipped
+        assert storage.node("dest:tree/two/b.txt").read() == "b"
+
+    def test_directory_copy_streams_files_from_walk(self, storage):
+        """Without progress, copying starts before the whole tree is walked."""
+        storage.node("src:tree/one/a.txt").write("a")
+        storage.node("src:tree/two/b.txt").write("b")
+
+        dirs_seen = []
+
+        def on_file(node):
+            dirs_seen.append(
+                [storage.node(f"dest:tree/{name}").exists() for name in ("one", "two")]
+            )
+
+        storage.node("src:tree").copy_to(
+            storage.node("dest:tree"), on_file=on_file, max_concurrency=1
+        )
+
+        # The first file is copied while the other directory is still unvisited
+        assert sorted(dirs_seen[0]) == [False, True]
+        assert dirs_seen[1] == [True, True]
+        assert storage.node("dest:tree/two/b.txt").read() == "b"
+
+        # With workers, only a bounded number of copies is queued at a time
+        for i in range(10):
+            storage.node(f"src:many/file{i}.txt").write(f"content{i}")
+        copied = []
+        storage.node("src:many").copy_to(
+            storage.node("dest:many"), on_file=copied.append, max_concurrency=2
+        )
+        assert len(copied) == 10
+        assert storage.node("dest:many/file9.txt").read() == "content9"
+
+    def test_copy_rejects_unknown_skip_strategy(self, storage):
+        """An unknown skip value is reported instead of silently copying."""
+        storage.node("src:file.txt").write("content")
+
+        with pytest.raises(ValueError, match="Invalid skip strategy"):
+            storage.node("src:file.txt").copy_to(storage.node("dest:file.txt"), skip="sizes")
+        assert not storage.node("dest:file.txt").exists()
@@ -1,5 +1,8 @@
 """Tests for LocalStorage backend and StorageNode integration."""
 
+import io
+import json
+import os
 import pytest
 import tempfile
 import shutil
@@ -50,6 +53,26 @@ class TestStorageManager:
         with pytest.raises(StorageConfigError, match="missing required field: 'protocol'"):
             storage.configure([{"name": "test", "path": "/tmp"}])
 
+    def test_configure_non_string_name(self, temp_dir):
+        """Test error when mount name is not a string."""
+        storage = StorageManager()
+
+        with pytest.raises(StorageConfigError, match="Mount name must be a string"):
+            storage.configure([{"name": 42, "protocol": "local", "path": temp_dir}])
+
+    def test_configure_validates_all_mounts_first(self, temp_dir):
+        """Test that an invalid mount leaves earlier mounts unconfigured."""
+        storage = StorageManager()
+
+        with pytest.raises(StorageConfigError, match="missing required field: 'bucket'"):
+            storage.configure(
+                [
+                    {"name": "good", "protocol": "local", "path": temp_dir},
+                    {"name": "bad", "protocol": "s3"},
+                ]
+            )
+        assert storage.get_mount_names() == []
+
     def test_configure_with_protocol_field(self, temp_dir):
         """Test configuring with 'protocol' field (new standard)."""
         storage = StorageManager()
@@ -81,11 +104,503 @@ class TestStorageManager:
         # Should still have only one mount
         assert len(storage.get_mount_names()) == 1
 
+    def test_configure_from_json_file(self, temp_dir):
+        """Test configuring from a JSON file."""
+        config_file = Path(temp_dir) / "storage.json"
+        config_file.write_text(
+            json.dumps([{"name": "test", "protocol": "local", "path": temp_dir}])
+        )
+
+        storage = StorageManager()
+        storage.configure(str(config_file))
+        assert storage.has_mount("test")
+
+    def test_config_file_cache_invalidated_on_change(self, temp_dir):
+        """Test that an edited config file is parsed again."""
+        config_file = Path(temp_dir) / "storage.json"
+        config_file.write_text(
+            json.dumps([{"name": "first", "protocol": "local", "path": temp_dir}])
+        )
+        storage = StorageManager()
+        storage.configure(str(config_file))
+
+        config_file.write_text(
+            json.dumps([{"name": "second_mount", "protocol": "local", "path": temp_dir}])
+        )
+        storage = StorageManager()
+        storage.configure(str(config_file))
+        assert storage.get_mount_names() == ["second_mount"]
+
+    def test_configure_from_yaml_file_writes_json_sidecar(self, temp_dir):
+        """Test that YAML configs are cached in a JSON sidecar file."""
+        config_file = Path(temp_dir) / "storage.yaml"
+        config_file.write_text(f"- name: test\n  protocol: local\n  path: {temp_dir}\n")
+
+        storage = StorageManager()
+        storage.configure(str(config_file))
+        assert storage.has_mount("test")
+
+        sidecar = Path(temp_dir) / "storage.yaml.jsoncache"
+        assert sidecar.exists()
+        assert json.loads(sidecar.read_text())[0]["name"] == "test"
+        # Written through a temporary file renamed into place
+        assert sorted(p.name for p in Path(temp_dir).iterdir()) == [
+            "storage.yaml",
+            "storage.yaml.jsoncache",
+        ]
+
+    def test_corrupt_json_sidecar_falls_back_to_yaml(self, temp_dir):
+        """Test that a truncated sidecar is ignored and rewritten."""
+        from genro_storage import manager as manager_module
+
+        config_file = Path(temp_dir) / "storage.yaml"
+        config_file.write_text(f"- name: test\n  protocol: local\n  path: {temp_dir}\n")
+        sidecar = Path(temp_dir) / "storage.yaml.jsoncache"
+        sidecar.write_text('[{"name": "te')
+
+        mtime_ns = config_file.stat().st_mtime_ns
+        config = manager_module._load_yaml_with_sidecar(config_file, mtime_ns)
+        assert config[0]["name"] == "test"
+        assert json.loads(sidecar.read_text()) == config
+
+    def test_backend_created_on_first_access(self, monkeypatch):
+        """Test that backends are only built when a mount is first used."""
+        from genro_storage import manager as manager_module
+
+        calls = []
+        original = manager_module._BACKEND_FACTORIES["memory"]
+
+        def counting_factory(config):
+            calls.append(config["name"])
+            return original(config)
+
+        monkeypatch.setitem(manager_module._BACKEND_FACTORIES, "memory", counting_factory)
+
+        storage = StorageManager()
+        storage.configure(
+            [
+                {"name": "used", "protocol": "memory"},
+                {"name": "unused", "protocol": "memory"},
+            ]
+        )
+        assert calls == []
+        assert storage.has_mount("unused")
+
+        storage.node("used:file.txt").write("content")
+        storage.node("used:other.txt").write("content")
+        assert calls == ["used"]
+
+        # Every read path of the mount table builds pending backends
+        from genro_storage.backends import StorageBackend
+
+        assert all(isinstance(b, StorageBackend) for b in dict(storage._mounts).values())
+        assert all(isinstance(b, StorageBackend) for b in storage._mounts.values())
+        assert isinstance(storage._mounts.get("unused"), StorageBackend)
+
+    def test_deferred_mount_reports_missing_driver_at_configure(self, monkeypatch):
+        """Test that a missing backend driver fails configure(), not first use."""
+        from genro_storage import manager as manager_module
+
+        monkeypatch.setitem(
+            manager_module._DRIVER_MODULES, "memory", ("no_such_driver", "no-such-driver")
+        )
+        storage = StorageManager()
+        with pytest.raises(StorageConfigError, match="pip install no-such-driver"):
+            storage.configure([{"name": "mem", "protocol": "memory"}])
+
+    def test_s3_mount_sizes_connection_pool(self, monkeypatch):
+        """Test that S3 mounts raise botocore's connection pool limit."""
+        from genro_storage import manager as manager_module
+
+        created = []
+        monkeypatch.setattr(
+            manager_module, "FsspecBackend", lambda *args, **kwargs: created.append(kwargs)
+        )
+
+        manager_module._create_s3_backend({"name": "s3", "bucket": "b"})
+        manager_module._create_s3_backend({"name": "s3", "bucket": "b", "max_pool_connections": 8})
+
+        assert created[0]["config_kwargs"] == {"max_pool_connections": 100}
+        assert created[1]["config_kwargs"] == {"max_pool_connections": 8}
+
+    def test_configure_from_invalid_json_file(self, temp_dir):
+        """Test error when a JSON config file cannot be parsed."""
+        config_file = Path(temp_dir) / "storage.json"
+        config_file.write_text('[{"name": "test",')
+
+        storage = StorageManager()
+        with pytest.raises(StorageConfigError, match="Failed to parse JSON file"):
+            storage.configure(str(config_file))
+
+    def test_configure_from_invalid_yaml_file(self, temp_dir):
+        """Test error when a YAML config file cannot be parsed."""
+        config_file = Path(temp_dir) / "storage.yaml"
+        config_file.write_text("- name: test\n  protocol: [local\n")
+
+        storage = StorageManager()
+        with pytest.raises(StorageConfigError, match="Failed to parse YAML file"):
+            storage.configure(str(config_file))
+
+    def test_from_file_shares_manager_until_file_changes(self, temp_dir):
+        """Test that from_file returns one manager per config file version."""
+        config_file = Path(temp_dir) / "storage.json"
+        config_file.write_text(
+            json.dumps([{"name": "test", "protocol": "local", "path": temp_dir}])
+        )
+
+        first = StorageManager.from_file(str(config_file))
+        assert first is StorageManager.from_file(str(config_file))
+        assert first.has_mount("test")
+
+        config_file.write_text(
+            json.dumps([{"name": "changed", "protocol": "local", "path": temp_dir}])
+        )
+        second = StorageManager.from_file(str(config_file))
+        assert second is not first
+        assert second.get_mount_names() == ["changed"]
+
+    def test_configure_many(self, temp_dir):
+        """Test configuring from several sources at once."""
+        config_file = Path(temp_dir) / "storage.json"
+        config_file.write_text(
+            json.dumps([{"name": "from_file", "protocol": "local", "path": temp_dir}])
+        )
+
+        storage = StorageManager()
+        storage.configure_many([str(config_file), [{"name": "from_list", "protocol": "memory"}]])
+        assert storage.get_mount_names() == ["from_file", "from_list"]
+
+    def test_nodes_batch(self, storage):
+        """Test creating several nodes at once."""
+        nodes = storage.nodes(["test:a.txt", "test:dir//b.txt"])
+        assert [n.fullpath for n in nodes] == ["test:a.txt", "test:dir/b.txt"]
+
+        with pytest.raises(StorageNotFoundError):
+            storage.nodes(["test:a.txt", "missing:b.txt"])
+
+    def test_read_many_and_stat_many(self, storage):
+        """Test concurrent batch reads and metadata fetches."""
+        for i in range(5):
+            storage.node(f"test:f{i}.txt").write(f"content {i}")
+
+        contents = storage.read_many([f"test:f{i}.txt" for i in range(5)], max_concurrency=4)
+        assert list(contents) == [f"test:f{i}.txt" for i in range(5)]
+        assert contents["test:f3.txt"] == b"content 3"
+
+        nodes = storage.nodes(["test:f0.txt", "test:missing.txt"])
+        stats = storage.stat_many(nodes)
+        assert stats["test:f0.txt"].size == 9
+        assert not stats["test:missing.txt"].exists
+        assert nodes[0]._stat_cache is stats["test:f0.txt"]
+
+        with pytest.raises(FileNotFoundError):
+            storage.read_many(["test:f0.txt", "test:missing.txt"])
+
+        import hashlib
+
+        hashes = storage.hash_many([f"test:f{i}.txt" for i in range(5)], max_concurrency=4)
+        assert hashes["test:f2.txt"] == hashlib.md5(b"content 2").hexdigest()
+
+    def test_read_many_uses_native_batch_reads(self, storage):
+        """Test object-store mounts get their paths in one batch call."""
+        storage.configure(
+            [
+                {"name": "bucket", "protocol": "memory", "base_path": "/batch"},
+                {"name": "shard", "path": "bucket:shards"},
+            ]
+        )
+        backend = storage._mounts["bucket"]
+        backend.parallel_reads = True
+        calls = []
+        original_cat_ranges = backend.fs.cat_ranges
+
+        def spy_cat_ranges(paths, starts, ends, **kwargs):
+            calls.append(list(paths))
+            return original_cat_ranges(paths, starts, ends, **kwargs)
+
+        backend.fs.cat_ranges = spy_cat_ranges
+        storage.node("test:local.txt").write("local")
+        for i in range(3):
+            storage.node(f"bucket:shards/s{i}.json").write(f"[{i}]")
+
+        addresses = ["shard:s0.json", "test:local.txt", "bucket:shards/s1.json", "shard:s2.json"]
+        contents = storage.read_many(addresses)
+        assert list(contents) == addresses
+        assert contents["test:local.txt"] == b"local"
+        assert contents["shard:s2.json"] == b"[2]"
+        # One batch per mount; the relative mount batches through its parent
+        assert len(calls) == 2
+
+        with pytest.raises(FileNotFoundError):
+            storage.read_many(["bucket:shards/s0.json", "bucket:missing.json"])
+
+    def test_many_helpers_awaitable_in_async_code(self, storage):
+        """Test read_many/stat_many are awaited, not run on the event loop."""
+        import asyncio
+
+        storage.node("test:a.txt").write("a")
+
+        async def main():
+            contents = await storage.read_many(["test:a.txt"])
+            stats = await storage.stat_many(["test:a.txt"])
+            return contents, stats
+
+        contents, stats = asyncio.run(main())
+        assert contents == {"test:a.txt": b"a"}
+        assert stats["test:a.txt"].size == 1
+
+    def test_batch_shares_stat_between_nodes(self, storage, call_spy):
+        """Test that nodes inside batch() reuse each other's stat results."""
+        calls = call_spy(storage._mounts["test"], "stat")
+
+        with storage.batch():
+            assert not storage.node("test:a.txt").exists()
+            assert not storage.node("test:a.txt").exists()
+            assert len(calls) == 1
+
+            # A write through any node drops the shared entry
+            storage.node("test:a.txt").write("content")
+            assert storage.node("test:a.txt").exists()
+            assert len(calls) == 2
+
+        storage.node("test:a.txt").exists()
+        storage.node("test:a.txt").exists()
+        assert len(calls) == 4
+
+    def test_mount_names_follow_mount_changes(self, temp_dir):
+        """Test that get_mount_names reflects added and deleted mounts."""
+        storage = StorageManager()
+        storage.configure([{"name": "a", "protocol": "memory"}])
+        assert storage.get_mount_names() == ["a"]
+
+        storage.add_mount({"name": "b", "protocol": "local", "path": temp_dir})
+        assert storage.get_mount_names() == ["a", "b"]
+
+        storage.delete_mount("a")
+        assert storage.get_mount_names() == ["b"]
+
+    def test_mounts_view(self, storage):
+        """Test the read-only mounts mapping."""
+        assert "test" in storage.mounts
+        assert list(storage.mounts) == ["test"]
+
+        with pytest.raises(TypeError):
+            storage.mounts["other"] = None
+
+        storage.add_mount({"name": "other", "protocol": "memory"})
+        assert "other" in storage.mounts
+
+    def test_root_node_shared_only_when_interning(self, storage, temp_dir):
+        """Test that mount root nodes are shared only with node interning on."""
+        # Without interning every caller gets its own root and stat cache
+        assert storage.node("test") is not storage.node("test:")
+
+        interning = StorageManager(node_cache_size=16)
+        interning.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        root = interning.node("test")
+        assert interning.node("test:") is root
+        assert interning.node("test:docs") is not root
+
+        interning.add_mount({"name": "test", "protocol": "local", "path": temp_dir})
+        assert interning.node("test") is not root
+
+    def test_node_cache_interns_nodes(self, temp_dir):
+        """Test that node_cache_size makes equal paths share one node."""
+        storage = StorageManager(node_cache_size=2)
+        storage.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+
+        node = storage.node("test:dir/a.txt")
+        assert storage.node("test:dir", "a.txt") is node
+        assert storage.node("test:dir").child("a.txt") is node
+        assert node.parent is storage.node("test:dir")
+
+        # Least recently used nodes are evicted
+        storage.node("test:b.txt")
+        storage.node("test:c.txt")
+        assert storage.node("test:dir/a.txt") is not node
+
+        # Replacing the mount drops its nodes
+        node = storage.node("test:dir/a.txt")
+        storage.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        assert storage.node("test:dir/a.txt") is not node
+
+        # Disabled by default
+        default = StorageManager()
+        default.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        assert default.node("test:a.txt") is not default.node("test:a.txt")
+
+    def test_content_cache_revalidates(self, temp_dir, call_spy):
+        """Test that cached content is reused until the file changes."""
+        storage = StorageManager(content_cache_bytes=1024)
+        storage.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        storage.node("test:a.txt").write("version 1")
+
+        reads = call_spy(storage._mounts["test"], "read_bytes")
+
+        assert storage.node("test:a.txt").read_bytes() == b"version 1"
+        assert storage.node("test:a.txt").read_bytes() == b"version 1"
+        assert len(reads) == 1
+
+        # Writing through a node evicts the entry
+        storage.node("test:a.txt").write("version 22")
+        assert storage.node("test:a.txt").read_bytes() == b"version 22"
+        assert len(reads) == 2
+
+        # External changes are detected by the metadata check
+        Path(temp_dir, "a.txt").write_text("external change")
+        assert storage.node("test:a.txt").read_bytes() == b"external change"
+        assert len(reads) == 3
+
+    def test_negative_cache_remembers_missing_paths(self, temp_dir, monkeypatch, call_spy):
+        """Test that missing paths are not stat'ed again until the TTL expires."""
+        from genro_storage import manager as manager_module
+
+        storage = StorageManager(negative_cache_ttl=30)
+        storage.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        calls = call_spy(storage._mounts["test"], "stat")
+
+        assert not storage.node("test:override.css").exists()
+        assert not storage.node("test:override.css").exists()
+        assert len(calls) == 1
+
+        # Created elsewhere: still reported missing until the entry expires
+        Path(temp_dir, "override.css").write_text("body {}")
+        assert not storage.node("test:override.css").exists()
+        now = manager_module.time.monotonic()
+        monkeypatch.setattr(manager_module.time, "monotonic", lambda: now + 31)
+        assert storage.node("test:override.css").exists()
+
+        # Writes through a node forget the entry at once
+        assert not storage.node("test:new.css").exists()
+        storage.node("test:new.css").write("body {}")
+        assert storage.node("test:new.css").exists()
+
+        # ...and those of the parent directories the write creates
+        assert not storage.node("test:themes").exists()
+        storage.node("test:themes/dark/site.css").write("body {}")
+        assert storage.node("test:themes").exists()
+
     def test_node_mount_not_found(self, storage):
         """Test error when accessing non-existent mount."""
         with pytest.raises(StorageNotFoundError, match="Mount point 'missing' not found"):
             storage.node("missing:file.txt")
 
+    def test_node_mount_not_found_lists_available_mounts(self, storage):
+        """Test that the error message lists the configured mounts."""
+        with pytest.raises(StorageNotFoundError) as exc_info:
+            storage.node("missing:file.txt")
+        assert str(exc_info.value) == "Mount point 'missing' not found. Available mounts: test"
+
+
+class TestStorageNode:
+    """Test StorageNode metadata caching and buffer helpers."""
+
+    def test_stat_metadata_cached(self, temp_dir, call_spy):
+        """Test metadata queries share one backend stat until invalidated."""
+        storage = StorageManager(stat_cache_ttl=None)
+        storage.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        node = storage.node("test:file.txt")
+        node.write("content")
+
+        calls = call_spy(storage._mounts["test"], "stat")
+
+        assert node.exists()
+        assert node.is_file()
+        assert not node.is_dir()
+        assert node.size() == 7
+        assert node.mtime() > 0
+        assert len(calls) == 1
+
+        # Changes made outside the node are seen after invalidate()
+        os.remove(os.path.join(temp_dir, "file.txt"))
+        assert node.exists()
+        node.invalidate()
+        assert not node.exists()
+        assert len(calls) == 2
+
+        # Writes through the node drop the cache
+        node.write("new content")
+        assert node.size() == 11
+
+    def test_operations_stat_once(self, storage, call_spy):
+        """Test that a single operation looks up its metadata once by default."""
+        node = storage.node("test:file.txt")
+        node.write("content")
+
+        calls = call_spy(storage._mounts["test"], "stat")
+        assert node.ext_attributes[1] == 7
+        assert len(calls) == 1
+        node.md5hash()
+        assert len(calls) == 2
+        node.to_base64()
+        assert len(calls) == 3
+
+    def test_stat_cache_ttl_expires_metadata(self, temp_dir, monkeypatch):
+        """Test that cached node metadata is refetched once stat_cache_ttl passes."""
+        from genro_storage import node as node_module
+
+        storage = StorageManager(stat_cache_ttl=10)
+        storage.configure([{"name": "test", "protocol": "local", "path": temp_dir}])
+        node = storage.node("test:late.txt")
+        assert not node.exists()
+
+        # Created elsewhere: a miss is never reused
+        Path(temp_dir, "late.txt").write_text("hello")
+        assert node.exists()
+        assert node.size() == 5
+
+        # Rewritten elsewhere: the cached metadata holds until it expires
+        Path(temp_dir, "late.txt").write_text("hello world")
+        assert node.size() == 5
+        now = node_module.time.monotonic()
+        monkeypatch.setattr(node_module.time, "monotonic", lambda: now + 11)
+        assert node.size() == 11
+
+    def test_stat_cache_stays_consistent_across_nodes(self, storage):
+        """Test that exists() and size() agree after writes through other nodes."""
+        node = storage.node("test:x.txt")
+        assert not node.exists()
+
+        storage.node("test:x.txt").write("hi")
+        assert node.exists()
+        assert node.size() == 2
+
+        # By default (stat_cache_ttl=0) every query asks the backend
+        assert node.size() == 2
+        storage.node("test:x.txt").write("hello")
+        assert node.size() == 5
+
+    def test_parent_node_reused(self, storage):
+        """Test that parent is built once and refreshed by invalidate()."""
+        node = storage.node("test:a/b/file.txt")
+        parent = node.parent
+        assert node.parent is parent
+        assert not parent.exists()
+
+        # Writing through the node drops the cached parent and its metadata
+        node.write("data")
+        assert node.parent is not parent
+        assert node.parent.exists()
+
+        # Listed children share the listing directory as parent
+        child = storage.node("test:a/b").children()[0]
+        assert child.parent.fullpath == "test:a/b"
+
+    def test_read_into_fills_caller_buffer(self, storage):
+        """Test that read_into() reads whole files and ranges into a buffer."""
+        node = storage.node("test:data.bin")
+        node.write(bytes(range(100)), mode="wb")
+
+        buf = bytearray(64)
+        assert node.read_into(buf) == 64
+        assert buf == bytes(range(64))
+
+        assert node.read_into(buf, offset=90) == 10
+        assert buf[:10] == bytes(range(90, 100))
+
+        assert node.read_into(buf, offset=10, length=5) == 5
+        assert buf[:5] == bytes(range(10, 15))
+
 
 class TestFileOperations:
     """Test basic file operations."""
@@ -113,6 +628,26 @@ class TestFileOperations:
         read_data = node.read(mode="rb")
         assert read_data == data
 
+    def test_write_from_file_object(self, storage, temp_dir):
+        """Test writing from real files and in-memory file objects."""
+        source = Path(temp_dir) / "source.bin"
+        source.write_bytes(b"header" + bytes(range(256)) * 100)
+
+        node = storage.node("test:copy/file.bin")
+        with open(source, "rb") as f:
+            f.seek(6)
+            node.write_from(f)
+            assert f.tell() == source.stat().st_size
+        assert node.read_bytes() == bytes(range(256)) * 100
+
+        node.write_from(io.BytesIO(b"in memory"))
+        assert node.read_bytes() == b"in memory"
+
+        storage.configure([{"name": "b64", "protocol": "base64"}])
+        b64 = storage.node("b64:")
+        b64.write_from(io.BytesIO(b"Hello"))
+        assert b64.path == "SGVsbG8="
+
     def test_file_exists(self, storage):
         """Test checking if file exists."""
         node = storage.node("test:file.txt")
@@ -168,6 +703,13 @@ class TestFileOperations:
         assert node.stem == "report"
         assert node.suffix == ".pdf"
 
+    def test_node_has_no_instance_dict(self, storage):
+        """Test that StorageNode uses __slots__ (no per-node __dict__)."""
+        node = storage.node("test:file.txt")
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
+
     def test_file_open_context_manager(self, storage):
         """Test using open() with context manager."""
         node = storage.node("test:file.txt")
@@ -401,6 +943,72 @@ class TestDirectoryOperations:
         assert "file2.txt" in names
         assert "subdir" in names
 
+    def test_children_metadata_from_listing(self, storage, call_spy):
+        """Test children() primes child metadata without extra stat calls."""
+        dir_node = storage.node("test:mydir")
+        dir_node.mkdir()
+        dir_node.child("file1.txt").write("content1")
+        dir_node.child("subdir").mkdir()
+
+        calls = call_spy(storage._mounts["test"], "stat")
+
+        by_name = {c.basename: c for c in dir_node.children()}
+        assert by_name["file1.txt"].size() == 8
+        assert by_name["subdir"].is_dir()
+        assert calls == []
+
+        # Listed metadata serves one query; batch() keeps it for the scope
+        with storage.batch():
+            by_name = {c.basename: c for c in dir_node.children()}
+            assert by_name["file1.txt"].size() == 8
+            assert by_name["file1.txt"].is_file()
+            assert by_name["subdir"].is_dir()
+        assert calls == []
+
+        # Without metadata, children are stat'ed on first access
+        lazy = dir_node.children(with_metadata=False)
+        assert all(c.exists() for c in lazy)
+        assert len(calls) == 2
+
+    def test_iter_children_builds_nodes_lazily(self, storage):
+        """Test iter_children() yields primed nodes one at a time."""
+        dir_node = storage.node("test:inbox")
+        for i in range(5):
+            dir_node.child(f"mail{i}.eml").write("x" * i)
+
+        children = dir_node.iter_children()
+        first = next(children)
+        assert first.basename.startswith("mail")
+        assert first._stat_cache is not None
+        assert first.parent is dir_node
+        assert len(list(children)) == 4
+
+        assert sorted(c.basename for c in dir_node.iter_children()) == sorted(
+            c.basename for c in dir_node.children()
+        )
+
+        with pytest.raises(FileNotFoundError):
+            next(storage.node("test:missing").iter_children())
+
+    def test_walk_yields_files_with_metadata(self, storage):
+        """Test walk() over local and memory trees."""
+        storage.configure([{"name": "mem", "protocol": "memory"}])
+        for mount in ("test", "mem"):
+            for name in ("a.txt", "sub/b.txt", "sub/deeper/c.txt"):
+                storage.node(f"{mount}:tree/{name}").write(name)
+
+            files = {f.path: f for f in storage.node(f"{mount}:tree").walk()}
+            assert sorted(files) == ["tree/a.txt", "tree/sub/b.txt", "tree/sub/deeper/c.txt"]
+            assert files["tree/sub/deeper/c.txt"]._stat_cache.size == 16
+
+            flat = [f.path for f in storage.node(f"{mount}:tree").walk(recursive=False)]
+            assert flat == ["tree/a.txt"]
+
+            with pytest.raises(FileNotFoundError):
+                next(storage.node(f"{mount}:missing").walk())
+            with pytest.raises(ValueError):
+                next(storage.node(f"{mount}:tree/a.txt").walk())
+
     def test_child_method(self, storage):
         """Test child() with single path and varargs."""
         parent = storage.node("test:documents")
@@ -565,6 +1173,48 @@ class TestCopyMove:
         # Content should be the same
         assert dest.read() == "Hello World"
 
+    def test_copy_file_falls_back_without_kernel_copy(self, storage, monkeypatch):
+        """Test local copies still work when copy_file_range() is refused."""
+        import errno
+        import os
+
+        def refuse(*args):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+
+        src = storage.node("test:source.txt")
+        src.write("Hello World")
+        dest = src.copy_to("test:backup/destination.txt")
+
+        assert dest.read() == "Hello World"
+        assert dest.mtime() == src.mtime()
+
+    def test_copy_onto_itself_keeps_data(self, storage):
+        """Test copying a file onto itself raises and leaves it intact."""
+        import shutil
+
+        storage.configure([{"name": "alias", "path": "test:"}])
+        node = storage.node("test:same.txt")
+        node.write("Hello World")
+
+        with pytest.raises(shutil.SameFileError):
+            node.copy_to(node)
+        # Same file reached through a relative mount
+        with pytest.raises(shutil.SameFileError):
+            node.copy_to("alias:same.txt")
+
+        node.invalidate()
+        assert node.read() == "Hello World"
+
+    def test_copy_shorter_file_over_longer_one(self, storage):
+        """Test a kernel copy onto a longer file leaves only the new content."""
+        storage.node("test:long.txt").write("a much longer content")
+        storage.node("test:short.txt").write("short")
+
+        dest = storage.node("test:short.txt").copy_to("test:long.txt")
+        assert dest.read() == "short"
+
     def test_copy_with_string_dest(self, storage):
         """Test copying with string destination."""
         src = storage.node("test:source.txt")
@@ -598,6 +1248,7 @@ class TestCopyMove:
         """Test that move updates the node itself."""
         node = storage.node("test:old.txt")
         node.write("content")
+        assert node.fullpath == "test:old.txt"
 
         original_id = id(node)
 
@@ -609,6 +1260,51 @@ class TestCopyMove:
         assert node.fullpath == "test:new.txt"
         assert node.exists()
 
+    def test_move_renames_on_same_filesystem(self, storage, temp_dir):
+        """Test that a local move is a rename, not a copy."""
+        node = storage.node("test:old.txt")
+        node.write("content")
+        inode = os.stat(os.path.join(temp_dir, "old.txt")).st_ino
+
+        node.move_to("test:sub/new.txt")
+        assert os.stat(os.path.join(temp_dir, "sub", "new.txt")).st_ino == inode
+        assert not storage.node("test:old.txt").exists()
+
+        # Across backends the data is copied, then the source deleted
+        storage.configure([{"name": "mem", "protocol": "memory"}])
+        node.move_to("mem:new.txt")
+        assert storage.node("mem:new.txt").read() == "content"
+        assert not os.path.exists(os.path.join(temp_dir, "sub", "new.txt"))
+
+        with pytest.raises(FileNotFoundError):
+            storage.node("test:missing.txt").move_to("test:other.txt")
+
+    def test_move_onto_itself_keeps_data(self, storage):
+        """Test that moving a file or directory onto itself is a no-op."""
+        storage.configure([{"name": "alias", "path": "test:"}])
+        storage.node("test:file.txt").write("content")
+        storage.node("test:folder/inner.txt").write("inner")
+
+        storage.node("test:file.txt").move_to("test:file.txt")
+        storage.node("test:file.txt").move_to("alias:file.txt")
+        storage.node("test:folder").move_to("test:folder")
+        storage.node("test:folder").move_to("alias:folder")
+
+        assert storage.node("test:file.txt").read() == "content"
+        assert storage.node("test:folder/inner.txt").read() == "inner"
+
+        # Copy + delete backends (memory) keep the data too
+        storage.configure([{"name": "mem", "protocol": "memory"}])
+        storage.node("mem:file.txt").write("content")
+        storage.node("mem:folder/inner.txt").write("inner")
+        storage.node("mem:file.txt").move_to("mem:file.txt")
+        storage.node("mem:folder").move_to("mem:folder")
+        assert storage.node("mem:file.txt").read() == "content"
+        assert storage.node("mem:folder/inner.txt").read() == "inner"
+
+        with pytest.raises(FileNotFoundError):
+            storage.node("test:missing.txt").move_to("test:missing.txt")
+
     def test_copy_directory(self, storage):
         """Test copying a directory recursively."""
         # Create source directory with contents
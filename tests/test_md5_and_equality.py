@@ -1,4 +1,4 @@
-"""Tests for MD5 hash and node equality operators."""
+"""Tests for MD5 hash, node equality operators and content comparison."""
 
 import pytest
 from genro_storage import StorageManager
@@ -113,53 +113,142 @@ class TestMD5Hash:
 
         assert node.md5hash() == expected
 
+    def test_md5hash_uses_hash_from_cached_stat(self, storage_manager):
+        """Test a content hash carried by the stat needs no further request."""
+        from genro_storage.backends.base import StatResult
+
+        storage_manager.configure([{"name": "mem", "protocol": "memory"}])
+        backend = storage_manager._mounts["mem"]
+        digest = "5eb63bbbe01eeed093cb22bb8f5acdc3"
+        backend.stat = lambda path: StatResult(
+            exists=True, is_file=True, size=11, content_hash=("md5", digest)
+        )
+
+        def no_request(path):
+            raise AssertionError("hash should come from the cached stat")
+
+        backend.get_content_hash = no_request
+        backend.get_hash = no_request
+        assert storage_manager.node("mem:hello.txt").md5hash() == digest
+
 
 class TestNodeEquality:
-    """Test node equality operators (== and !=)."""
+    """Test node equality operators (== and !=) and hashing."""
 
-    def test_equality_same_content(self, storage_manager, tmp_path):
-        """Test two files with same content are equal."""
+    def test_equality_same_path(self, storage_manager, tmp_path):
+        """Test nodes at the same location are equal."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
 
-        content = b"Same content"
+        node1 = storage_manager.node("local:file.txt")
+        node1.write(b"Content", mode="wb")
 
-        node1 = storage_manager.node("local:file1.txt")
-        node1.write(content, mode="wb")
+        node2 = storage_manager.node("local:file.txt")
+
+        assert node1 == node2
+        assert node1.fullpath == node2.fullpath
 
+    def test_equality_is_by_location_not_content(self, storage_manager, tmp_path):
+        """Test files with the same content at different paths are not equal."""
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+
+        node1 = storage_manager.node("local:file1.txt")
+        node1.write(b"Same content", mode="wb")
         node2 = storage_manager.node("local:file2.txt")
-        node2.write(content, mode="wb")
+        node2.write(b"Same content", mode="wb")
+
+        assert node1 != node2
+        assert not (node1 == node2)
+
+    def test_equality_same_path_skips_io(self, storage_manager, tmp_path):
+        """Test nodes compare without touching the backend."""
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+
+        node1 = storage_manager.node("local:missing.txt")
+        node2 = storage_manager.node("local:missing.txt")
 
         assert node1 == node2
-        assert not (node1 != node2)
+        assert node1 == node1
+        assert node1 != storage_manager.node("local:other.txt")
+
+    def test_nodes_are_hashable(self, storage_manager, tmp_path):
+        """Test nodes deduplicate in sets and work as dict keys."""
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+
+        node1 = storage_manager.node("local:a.txt")
+        node2 = storage_manager.node("local:a.txt")
+        node3 = storage_manager.node("local:b.txt")
+
+        assert hash(node1) == hash(node2)
+        assert len({node1, node2, node3}) == 2
+        assert {node1: "seen"}[node2] == "seen"
 
-    def test_inequality_different_content(self, storage_manager, tmp_path):
-        """Test two files with different content are not equal."""
+    def test_equality_considers_version(self, storage_manager, tmp_path):
+        """Test a versioned snapshot differs from the current file node."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
 
+        current = storage_manager.node("local:file.txt")
+        snapshot = storage_manager.node("local:file.txt", version=1)
+
+        assert current != snapshot
+        assert snapshot == storage_manager.node("local:file.txt", version=1)
+
+    def test_virtual_nodes_equal_only_themselves(self, storage_manager):
+        """Test virtual nodes compare by identity."""
+        node1 = storage_manager.iternode()
+        node2 = storage_manager.iternode()
+
+        assert node1 == node1
+        assert node1 != node2
+        assert len({node1, node2}) == 2
+
+    def test_inequality_with_non_storagenode(self, storage_manager, tmp_path):
+        """Test comparison with non-StorageNode returns NotImplemented."""
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+
+        node = storage_manager.node("local:file.txt")
+        node.write(b"Content", mode="wb")
+
+        # Comparing with string should not raise, but return False
+        assert (node == "local:file.txt") is False
+        assert (node != "local:file.txt") is True
+
+        # Comparing with None
+        assert (node == None) is False
+        assert (node != None) is True
+
+
+class TestSameContent:
+    """Test content comparison with same_content()."""
+
+    def test_same_content(self, storage_manager, tmp_path):
+        """Test two files with same content match."""
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+
+        content = b"Same content"
+
         node1 = storage_manager.node("local:file1.txt")
-        node1.write(b"Content A", mode="wb")
+        node1.write(content, mode="wb")
 
         node2 = storage_manager.node("local:file2.txt")
-        node2.write(b"Content B", mode="wb")
+        node2.write(content, mode="wb")
 
-        assert node1 != node2
-        assert not (node1 == node2)
+        assert node1.same_content(node2)
+        assert node2.same_content(node1)
 
-    def test_equality_same_path(self, storage_manager, tmp_path):
-        """Test node equals itself (same path)."""
+    def test_different_content(self, storage_manager, tmp_path):
+        """Test two files with different content don't match."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
 
-        node1 = storage_manager.node("local:file.txt")
-        node1.write(b"Content", mode="wb")
+        node1 = storage_manager.node("local:file1.txt")
+        node1.write(b"Content A", mode="wb")
 
-        node2 = storage_manager.node("local:file.txt")
+        node2 = storage_manager.node("local:file2.txt")
+        node2.write(b"Content B", mode="wb")
 
-        assert node1 == node2
-        assert node1.fullpath == node2.fullpath
+        assert not node1.same_content(node2)
 
-    def test_equality_across_backends(self, storage_manager, tmp_path):
-        """Test equality works across different storage backends."""
-        # Setup two different storages
+    def test_same_content_across_backends(self, storage_manager, tmp_path):
+        """Test content comparison works across different mounts."""
         local_path = tmp_path / "local"
         backup_path = tmp_path / "backup"
         local_path.mkdir()
@@ -176,11 +265,10 @@ class TestNodeEquality:
         node2 = storage_manager.node("backup:file.txt")
         node2.write(content, mode="wb")
 
-        assert node1 == node2
+        assert node1.same_content(node2)
 
-    def test_equality_s3_to_local(self, storage_manager, tmp_path, s3_fs):
-        """Test equality between S3 and local file with same content."""
-        # Configure both storages
+    def test_same_content_s3_to_local(self, storage_manager, tmp_path, s3_fs):
+        """Test content comparison between S3 and local file."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
         storage_manager.configure(
             [
@@ -203,37 +291,20 @@ class TestNodeEquality:
         s3_node = storage_manager.node("s3:test-bucket/file.txt")
         s3_node.write(content, mode="wb")
 
-        # Should be equal (one uses computed MD5, one uses ETag)
-        assert local_node == s3_node
-
-    def test_inequality_with_non_storagenode(self, storage_manager, tmp_path):
-        """Test comparison with non-StorageNode returns NotImplemented."""
-        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
-
-        node = storage_manager.node("local:file.txt")
-        node.write(b"Content", mode="wb")
-
-        # Comparing with string should not raise, but return False
-        assert (node == "local:file.txt") is False
-        assert (node != "local:file.txt") is True
-
-        # Comparing with None
-        assert (node == None) is False
-        assert (node != None) is True
+        # One uses computed MD5, one uses ETag
+        assert local_node.same_content(s3_node)
 
-    def test_equality_nonexistent_files(self, storage_manager, tmp_path):
-        """Test equality of non-existent files returns False."""
+    def test_same_content_nonexistent_files(self, storage_manager, tmp_path):
+        """Test missing files never match."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
 
         node1 = storage_manager.node("local:missing1.txt")
         node2 = storage_manager.node("local:missing2.txt")
 
-        # Non-existent files are not equal
-        assert not (node1 == node2)
-        assert node1 != node2
+        assert not node1.same_content(node2)
 
-    def test_equality_directory_returns_false(self, storage_manager, tmp_path):
-        """Test directories are never equal (can't compare content)."""
+    def test_same_content_directories(self, storage_manager, tmp_path):
+        """Test directories never match (no content to compare)."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
 
         dir1 = storage_manager.node("local:dir1")
@@ -242,22 +313,81 @@ class TestNodeEquality:
         dir2 = storage_manager.node("local:dir2")
         dir2.mkdir()
 
-        # Directories can't be compared by content
-        assert not (dir1 == dir2)
-        assert dir1 != dir2
+        file_node = storage_manager.node("local:file.txt")
+        file_node.write(b"Content", mode="wb")
 
-    def test_equality_file_to_directory(self, storage_manager, tmp_path):
-        """Test file vs directory comparison returns False."""
+        assert not dir1.same_content(dir2)
+        assert not file_node.same_content(dir1)
+
+    def test_different_size_skips_hashing(self, storage_manager, tmp_path, monkeypatch):
+        """Test files of different sizes don't match without hashing."""
         storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
 
-        file_node = storage_manager.node("local:file.txt")
-        file_node.write(b"Content", mode="wb")
+        node1 = storage_manager.node("local:short.txt")
+        node1.write(b"abc", mode="wb")
+        node2 = storage_manager.node("local:long.txt")
+        node2.write(b"abcdef", mode="wb")
+
+        def no_hash(node):
+            raise AssertionError("content should not be hashed")
+
+        monkeypatch.setattr(type(node1), "_compute_md5", no_hash)
+        assert not node1.same_content(node2)
+
+    def test_large_files_hashed_in_parallel_segments(self, storage_manager, tmp_path, monkeypatch):
+        """Test large files without stored hashes are compared by segment digests."""
+        from genro_storage import node as node_module
+
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+        monkeypatch.setattr(node_module, "_PARALLEL_HASH_MIN_SIZE", 1024)
+        monkeypatch.setattr(node_module.os, "cpu_count", lambda: 4)
+
+        content = bytes(range(256)) * 16384  # 4 MiB: four 1 MiB segments
+        node1 = storage_manager.node("local:big1.bin")
+        node1.write(content, mode="wb")
+        node2 = storage_manager.node("local:big2.bin")
+        node2.write(content, mode="wb")
+        node3 = storage_manager.node("local:big3.bin")
+        node3.write(content[:-1] + b"x", mode="wb")
 
-        dir_node = storage_manager.node("local:dir")
-        dir_node.mkdir()
+        assert node1._segment_digest(len(content)).endswith("-4")
+        assert node1.same_content(node2)
+        assert not node1.same_content(node3)
 
-        assert not (file_node == dir_node)
-        assert file_node != dir_node
+    def test_stored_hashes_compared_without_reading(self, storage_manager, monkeypatch):
+        """Test hashes kept by the storage service are compared when algorithms agree."""
+        storage_manager.configure(
+            [
+                {"name": "a", "protocol": "memory", "base_path": "/hash_a"},
+                {"name": "b", "protocol": "memory", "base_path": "/hash_b"},
+            ]
+        )
+        node1 = storage_manager.node("a:video.mp4")
+        node1.write(b"same size 1", mode="wb")
+        node2 = storage_manager.node("b:video.mp4")
+        node2.write(b"same size 2", mode="wb")
+
+        def no_read(node):
+            raise AssertionError("content should not be read")
+
+        monkeypatch.setattr(type(node1), "_compute_md5", no_read)
+        etag = "9b2cf535f27731c974343645a3985328-3"
+        etags = {"a": etag, "b": etag}
+        for name in ("a", "b"):
+            backend = storage_manager._mounts[name]
+            backend.get_content_hash = lambda path, n=name: ("s3-multipart-etag", etags[n])
+        assert node1.same_content(node2)
+
+        etags["b"] = "0c4d6b2e3f0d2b5b8e0b5d1f5e1c0a9b-3"
+        assert not node1.same_content(node2)
+
+        # Algorithms differ: fall back to MD5, computed where metadata has none
+        monkeypatch.undo()
+        del storage_manager._mounts["b"].get_content_hash
+        storage_manager._mounts["a"].get_content_hash = lambda path: ("s3-multipart-etag", etag)
+        assert not node1.same_content(node2)
+        node2.write(b"same size 1", mode="wb")
+        assert node1.same_content(node2)
 
 
 class TestMD5Performance:
@@ -308,3 +438,20 @@ class TestMD5Performance:
         hash3 = node.md5hash()
 
         assert hash1 == hash2 == hash3
+
+    def test_computed_hash_reused_until_file_changes(self, storage_manager, tmp_path, call_spy):
+        """Test a computed MD5 is not recomputed until the file changes."""
+        import hashlib
+
+        storage_manager.configure([{"name": "local", "protocol": "local", "path": str(tmp_path)}])
+        node = storage_manager.node("local:file.txt")
+        node.write(b"Test content", mode="wb")
+
+        reads = call_spy(node._backend, "open")
+
+        node.md5hash()
+        node.md5hash()
+        assert len(reads) == 1
+
+        node.write(b"Other content", mode="wb")
+        assert node.md5hash() == hashlib.md5(b"Other content").hexdigest()
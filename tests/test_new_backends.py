@@ -470,3 +470,74 @@ class TestBackendCapabilities:
 
         finally:
             Path(tar_path).unlink(missing_ok=True)
+
+
+class TestObjectStoreOptimizations:
+    """Test object store specific I/O paths."""
+
+    def test_object_store_reads_use_read_ahead(self):
+        """Binary reads on object stores request large read-ahead blocks."""
+        from genro_storage.backends.fsspec import FsspecBackend
+
+        backend = FsspecBackend("memory", base_path="/readahead")
+        backend.write_bytes("file.bin", b"data")
+        calls = []
+        original_open = backend.fs.open
+
+        def spy_open(path, mode="rb", **kwargs):
+            calls.append((mode, kwargs))
+            return original_open(path, mode, **kwargs)
+
+        backend.fs.open = spy_open
+
+        # Plain filesystems are opened as before
+        with backend.open("file.bin", "rb") as f:
+            assert f.read() == b"data"
+        assert calls[-1] == ("rb", {})
+
+        backend.protocol = "s3"
+        with backend.open("file.bin", "rb") as f:
+            assert f.read() == b"data"
+        assert calls[-1][1]["block_size"] == 8 * 1024 * 1024
+        assert calls[-1][1]["cache_type"] in ("background", "readahead")
+
+    def test_object_store_read_bytes_fetches_parts(self, monkeypatch):
+        """read_bytes on object stores reads large files as ranged parts."""
+        from genro_storage.backends import fsspec as fsspec_module
+        from genro_storage.backends.fsspec import FsspecBackend
+
+        backend = FsspecBackend("memory", base_path="/parts")
+        assert not backend.parallel_reads
+        data = bytes(range(256)) * 40
+        backend.write_bytes("big.bin", data)
+        backend.write_bytes("small.bin", b"tiny")
+
+        backend.parallel_reads = True
+        monkeypatch.setattr(fsspec_module, "_PARALLEL_READ_PART_SIZE", 1024)
+        ranges = []
+        original_cat_ranges = backend.fs.cat_ranges
+
+        def spy_cat_ranges(paths, starts, ends, **kwargs):
+            ranges.extend(zip(starts, ends))
+            return original_cat_ranges(paths, starts, ends, **kwargs)
+
+        backend.fs.cat_ranges = spy_cat_ranges
+
+        assert backend.read_bytes("big.bin") == data
+        assert ranges[0] == (1024, 2048) and ranges[-1] == (9216, 10240)
+        assert len(ranges) == 9
+
+        ranges.clear()
+        assert backend.read_bytes("small.bin") == b"tiny"
+        assert ranges == []
+
+    def test_object_store_mkdir_makes_no_requests(self):
+        """mkdir on object stores doesn't create directory markers."""
+        from genro_storage.backends.fsspec import FsspecBackend
+
+        backend = FsspecBackend("memory", base_path="/dirless")
+        assert backend.requires_dir_markers
+
+        backend.requires_dir_markers = False
+        backend.fs = None  # any filesystem call would fail
+        backend.mkdir("a/b/c", parents=True, exist_ok=True)
@@ -219,6 +219,26 @@ def test_relative_mount_copy_operations(storage):
     assert dest_rw.read() == "test data"
 
 
+def test_relative_mount_copy_uses_native_copy(storage):
+    """Test copies between mounts on one filesystem skip the byte pump."""
+    storage.configure(
+        [{"name": "source", "path": "data:source"}, {"name": "dest", "path": "data:dest"}]
+    )
+    source = storage.node("source:file.txt")
+    source.write("test data")
+
+    def no_read(path):
+        raise AssertionError("data should not be read through the client")
+
+    parent = storage._mounts["data"]
+    parent.read_bytes = no_read
+    parent.open = no_read
+
+    dest = storage.node("dest:file.txt")
+    source.copy_to(dest)
+    assert parent.fs.cat_file(parent._full_path("dest/file.txt")) == b"test data"
+
+
 def test_relative_mount_open_modes(storage):
     """Test file open modes respect permissions."""
     storage.configure([{"name": "ro", "path": "data:ro", "permissions": "readonly"}])